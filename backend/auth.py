@@ -12,6 +12,8 @@ from pydantic import BaseModel, EmailStr, Field
 import secrets
 import os
 
+from utils.session_cache import SessionCache, SessionTouchBuffer
+
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -28,6 +30,17 @@ ROLES = {
     "admin": 3
 }
 
+# Resolved sessions are cached briefly; rolling expiry is written behind.
+# Endpoints that delete sessions or change user fields must invalidate.
+session_cache = SessionCache(
+    ttl_seconds=float(os.environ.get("SESSION_CACHE_TTL_SECONDS", "30")),
+    max_size=int(os.environ.get("SESSION_CACHE_SIZE", "10000"))
+)
+session_touches = SessionTouchBuffer(
+    interval_seconds=float(os.environ.get("SESSION_TOUCH_INTERVAL_SECONDS", "60")),
+    expire_days=ACCESS_TOKEN_EXPIRE_DAYS
+)
+
 # Models
 class User(BaseModel):
     id: str
@@ -123,34 +136,62 @@ async def get_current_user(
     if not session_token:
         return None
     
+    now = datetime.now(timezone.utc)
+    
+    # Recently resolved session - the rolling expiry is written behind
+    cached_user = session_cache.get(session_token)
+    if cached_user is not None:
+        session_touches.touch(session_token, now)
+        return cached_user.model_copy()
+    
     # Find session in database
     session = await db.user_sessions.find_one({
         "session_token": session_token,
-        "expires_at": {"$gt": datetime.now(timezone.utc)}
+        "expires_at": {"$gt": now}
     })
     
     if not session:
         return None
     
     # ROLLING EXPIRATION: Refresh session expiration and last_active timestamp
-    # This ensures active users stay logged in "practically forever"
-    new_expires_at = datetime.now(timezone.utc) + timedelta(days=ACCESS_TOKEN_EXPIRE_DAYS)
-    await db.user_sessions.update_one(
-        {"session_token": session_token},
-        {
-            "$set": {
-                "expires_at": new_expires_at,
-                "last_active": datetime.now(timezone.utc)
+    # This ensures active users stay logged in "practically forever".
+    # Sessions about to expire are refreshed right away, the rest in batches.
+    if session_touches.needs_immediate_write(session["expires_at"], now):
+        await db.user_sessions.update_one(
+            {"session_token": session_token},
+            {
+                "$set": {
+                    "expires_at": now + timedelta(days=ACCESS_TOKEN_EXPIRE_DAYS),
+                    "last_active": now
+                }
             }
-        }
-    )
+        )
+        session_touches.mark_written(session_token)
+    else:
+        session_touches.touch(session_token, now)
+        if session_touches.pending_count >= session_touches.max_pending:
+            await session_touches.flush(db)
     
     # Get user
     user_doc = await db.users.find_one({"id": session["user_id"]})
     if not user_doc:
         return None
     
-    return User(**user_doc)
+    user = User(**user_doc)
+    session_cache.put(session_token, user, user.id)
+    return user.model_copy()
+
+
+def invalidate_session(session_token: Optional[str]) -> None:
+    """Drop a session from the cache after deleting it"""
+    if session_token:
+        session_cache.invalidate_token(session_token)
+        session_touches.discard(session_token)
+
+
+def invalidate_user_sessions(user_id: str) -> None:
+    """Drop all cached sessions of a user after changing or deleting them"""
+    session_cache.invalidate_user(user_id)
 
 
 def require_auth(db=None):
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: include/exclude ingredient filter for GET /api/recipes
+
+Compares the nested substring scan (recipe_matches_ingredients) with the
+IngredientIndex bitset filter on synthetic catalogs, checks that both return
+the same recipes, and times an incremental re-index of changed recipes.
+
+Usage:
+    python benchmarks/bench_ingredient_filter.py [--sizes 1000,10000,100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.ingredient_index import IngredientIndex, recipe_matches_ingredients  # noqa: E402
+
+BASE_INGREDIENTS = [
+    "Citron", "Lime", "Appelsin", "Jordbær", "Hindbær", "Blåbær", "Brombær", "Solbær",
+    "Mango", "Ananas", "Passionsfrugt", "Banan", "Kokos", "Vandmelon", "Melon", "Kirsebær",
+    "Æble", "Pære", "Rabarber", "Hyldeblomst", "Mynte", "Ingefær", "Vanilje", "Karamel",
+    "Sukker", "Vand", "Mælk", "Fløde", "Yoghurt", "Cola", "Sprite", "Fanta", "Rom", "Vodka",
+]
+VARIANTS = ["", " sirup", " saft", " juice", " koncentrat", " (økologisk)", " light", " sukkerfri"]
+
+# (include terms, exclude terms) - mirrors how the endpoint lowercases and strips
+QUERIES = [
+    (["citron"], []),
+    (["bær"], ["mælk"]),
+    (["sirup", "sukker"], []),
+    ([], ["vodka", "rom"]),
+    (["ma"], ["light"]),
+    (["passionsfrugt koncentrat"], []),
+    ([""], []),
+    (["does-not-exist"], []),
+]
+
+
+def make_recipes(size: int):
+    rng = random.Random(size)
+    names = [base + variant for base in BASE_INGREDIENTS for variant in VARIANTS]
+    recipes = []
+    for i in range(size):
+        count = rng.randint(0, 8) if i % 50 else 0
+        recipes.append({
+            "id": f"recipe-{i}",
+            "ingredients": [{"name": rng.choice(names)} for _ in range(count)],
+        })
+    return recipes
+
+
+def run(sizes):
+    print(f"{'recipes':>8} {'build ms':>9} {'scan ms':>9} {'index ms':>9} {'speedup':>8} {'reindex 1% ms':>14}  identical")
+    for size in sizes:
+        recipes = make_recipes(size)
+        keyed = [(("recipes", r["id"]), r) for r in recipes]
+
+        start = time.perf_counter()
+        index = IngredientIndex()
+        for key, recipe in keyed:
+            index.sync(key, recipe)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        scanned = [
+            [r for r in recipes if recipe_matches_ingredients(r, include, exclude)]
+            for include, exclude in QUERIES
+        ]
+        scan_ms = (time.perf_counter() - start) * 1000 / len(QUERIES)
+
+        start = time.perf_counter()
+        indexed = [index.filter(keyed, include, exclude) for include, exclude in QUERIES]
+        index_ms = (time.perf_counter() - start) * 1000 / len(QUERIES)
+
+        identical = [[r["id"] for r in a] for a in scanned] == [[r["id"] for r in b] for b in indexed]
+
+        # Change 1% of the recipes and re-sync everything; only those are re-indexed
+        rng = random.Random(-size)
+        for recipe in rng.sample(recipes, k=max(1, size // 100)):
+            recipe["ingredients"] = recipe["ingredients"][1:] + [{"name": "Ny Ingrediens"}]
+        start = time.perf_counter()
+        for key, recipe in keyed:
+            index.sync(key, recipe)
+        reindex_ms = (time.perf_counter() - start) * 1000
+
+        rescanned = [[r["id"] for r in recipes if recipe_matches_ingredients(r, i, e)] for i, e in QUERIES]
+        reindexed = [[r["id"] for r in index.filter(keyed, i, e)] for i, e in QUERIES]
+        identical = identical and rescanned == reindexed
+
+        speedup = scan_ms / index_ms if index_ms else float("inf")
+        print(f"{size:>8} {build_ms:>9.1f} {scan_ms:>9.2f} {index_ms:>9.2f} {speedup:>7.1f}x {reindex_ms:>14.1f}  {identical}")
+        if not identical:
+            sys.exit(f"Result mismatch at {size} recipes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated catalog sizes")
+    args = parser.parse_args()
+    run([int(s) for s in args.sizes.split(",")])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark: link-health check of redirect options against a local stub server
+
+Starts stub HTTP servers on localhost (each port counts as a separate host)
+that answer after a fixed delay. Some paths are broken (404), some reject
+HEAD (405 on HEAD, 200 on GET), and one host is slow enough to time out.
+Runs the old serial HEAD loop and LinkHealthChecker over the same links,
+checks that the concurrent checker finds exactly the expected broken links
+and reports wall time and the peak number of concurrent requests per host.
+The checker also runs over the links grouped by host, the order options of
+one retailer are stored in, which must not be slower than the interleaved
+order by more than the per-host cap forces.
+
+Usage:
+    python benchmarks/bench_link_health.py [--links 300] [--hosts 6] [--delay-ms 50]
+                                           [--concurrency 20] [--per-host 4]
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+from utils.link_health import LinkHealthChecker  # noqa: E402
+
+
+class StubState:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = Counter()
+        self.peak = Counter()
+
+
+def make_handler(state: StubState, slow: bool):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _respond(self, head: bool):
+            port = self.server.server_address[1]
+            with state.lock:
+                state.active[port] += 1
+                state.peak[port] = max(state.peak[port], state.active[port])
+            try:
+                time.sleep(state.delay * (40 if slow else 1))
+                if "/broken" in self.path:
+                    status = 404
+                elif "/nohead" in self.path and head:
+                    status = 405
+                else:
+                    status = 200
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            finally:
+                with state.lock:
+                    state.active[port] -= 1
+
+        def do_HEAD(self):
+            self._respond(head=True)
+
+        def do_GET(self):
+            self._respond(head=False)
+
+    return Handler
+
+
+def start_servers(hosts: int, state: StubState):
+    servers = []
+    for index in range(hosts):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(state, slow=index == hosts - 1))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+def build_options(servers, links: int):
+    options, expected_broken = [], set()
+    fast_ports = [server.server_address[1] for server in servers[:-1]]
+    slow_port = servers[-1].server_address[1]
+    for i in range(links):
+        if i % 50 == 49:
+            url = f"http://127.0.0.1:{slow_port}/product/{i}"
+            expected_broken.add(f"opt-{i}")
+        else:
+            port = fast_ports[i % len(fast_ports)]
+            kind = "broken" if i % 10 == 3 else "nohead" if i % 10 == 7 else "product"
+            url = f"http://127.0.0.1:{port}/{kind}/{i}"
+            if kind == "broken":
+                expected_broken.add(f"opt-{i}")
+        options.append({"id": f"opt-{i}", "url": url})
+    return options, expected_broken
+
+
+async def serial_check(options, timeout: float):
+    """The previous implementation: one HEAD at a time, HEAD only"""
+    broken = set()
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        for option in options:
+            try:
+                response = await client.head(option["url"])
+                if response.status_code >= 400:
+                    broken.add(option["id"])
+            except Exception:
+                broken.add(option["id"])
+    return broken
+
+
+async def run(args):
+    state = StubState(args.delay_ms / 1000)
+    servers = start_servers(args.hosts, state)
+    options, expected = build_options(servers, args.links)
+    timeout = args.delay_ms / 1000 * 10
+
+    start = time.perf_counter()
+    serial_broken = await serial_check(options, timeout)
+    serial_s = time.perf_counter() - start
+    # Timed-out requests keep the slow host's threads busy, so peaks are per fast host
+    fast_ports = [server.server_address[1] for server in servers[:-1]]
+    serial_peak = max(state.peak[port] for port in fast_ports)
+
+    state.peak.clear()
+    checker = LinkHealthChecker(concurrency=args.concurrency, per_host=args.per_host, timeout=timeout)
+    start = time.perf_counter()
+    results = await checker.check(options)
+    concurrent_s = time.perf_counter() - start
+    concurrent_broken = {option["id"] for option, result in zip(options, results) if not result["ok"]}
+    concurrent_peak = max(state.peak[port] for port in fast_ports)
+
+    # Options of one retailer are stored next to each other
+    grouped = sorted(options, key=lambda option: option["url"].split("/")[2])
+    state.peak.clear()
+    start = time.perf_counter()
+    results = await checker.check(grouped)
+    grouped_s = time.perf_counter() - start
+    grouped_broken = {option["id"] for option, result in zip(grouped, results) if not result["ok"]}
+    grouped_peak = max(state.peak[port] for port in fast_ports)
+
+    for server in servers:
+        server.shutdown()
+
+    print(f"{'checker':<12} {'seconds':>8} {'broken':>7} {'expected':>9} {'peak/host':>10}")
+    print(f"{'serial':<12} {serial_s:>8.2f} {len(serial_broken):>7} {len(expected):>9} {serial_peak:>10}")
+    print(f"{'concurrent':<12} {concurrent_s:>8.2f} {len(concurrent_broken):>7} {len(expected):>9} {concurrent_peak:>10}")
+    print(f"{'grouped':<12} {grouped_s:>8.2f} {len(grouped_broken):>7} {len(expected):>9} {grouped_peak:>10}")
+    print(f"\nspeedup {serial_s / concurrent_s:.1f}x; serial run wrongly flags {len(serial_broken - expected)} HEAD-rejecting links")
+    if concurrent_broken != expected:
+        sys.exit("Concurrent checker result differs from the expected broken links")
+    if grouped_broken != expected:
+        sys.exit("Checker result over links grouped by host differs from the expected broken links")
+    if max(concurrent_peak, grouped_peak) > args.per_host:
+        sys.exit(f"Per-host cap exceeded: {max(concurrent_peak, grouped_peak)} > {args.per_host}")
+    if grouped_s > concurrent_s * 1.5:
+        sys.exit(f"Links grouped by host took {grouped_s:.2f}s vs {concurrent_s:.2f}s interleaved")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--links", type=int, default=300, help="Number of redirect options")
+    parser.add_argument("--hosts", type=int, default=6, help="Stub hosts (the last one is slow and times out)")
+    parser.add_argument("--delay-ms", type=float, default=50, help="Stub response delay")
+    parser.add_argument("--concurrency", type=int, default=20, help="Checker workers")
+    parser.add_argument("--per-host", type=int, default=4, help="Max concurrent requests per host")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
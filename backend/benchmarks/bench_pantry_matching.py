@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pantry matching for POST /api/match
+
+Scores synthetic catalogs with the per-recipe calculate_match_score and with
+the vectorized PantryMatcher, and checks that every match payload is identical.
+
+Usage:
+    python benchmarks/bench_pantry_matching.py [--sizes 1000,10000,100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.pantry_matching import PantryMatcher, calculate_match_score  # noqa: E402
+
+# Includes case/whitespace variants that normalize to the same pantry item
+NAMES = [
+    "Citron", "citron ", "Lime", "Sukker", "Vand", "  Mælk", "mælk", "Rom", "Vodka",
+    "Jordbær sirup", "Jordbær  Sirup", "Hindbær", "Mango", "Ananas", "Mynte", "Is",
+]
+ROLES = ["required", "required", "required", "optional", "garnish"]
+
+
+def make_recipes(size: int):
+    rng = random.Random(size)
+    return [
+        {"ingredients": [
+            {"name": rng.choice(NAMES), "role": rng.choice(ROLES)}
+            for _ in range(rng.randint(0, 8))
+        ]}
+        for _ in range(size)
+    ]
+
+
+def run(sizes):
+    print(f"{'recipes':>8} {'loop ms':>9} {'build ms':>9} {'score ms':>9} {'speedup':>8}  identical")
+    for size in sizes:
+        recipes = make_recipes(size)
+        rng = random.Random(-size)
+        pantry_items = [{"ingredient_name": name} for name in rng.sample(NAMES, k=6)]
+        pantry_names = [item["ingredient_name"] for item in pantry_items]
+
+        start = time.perf_counter()
+        reference = [calculate_match_score(recipe, pantry_items) for recipe in recipes]
+        loop_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        matcher = PantryMatcher(recipes)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        scores = matcher.score(pantry_names)
+        score_ms = (time.perf_counter() - start) * 1000
+
+        matched = set(scores.with_matches())
+        identical = all(
+            scores.match(i) == ref and (i in matched) == bool(ref["have"])
+            for i, ref in enumerate(reference)
+        )
+        speedup = loop_ms / score_ms if score_ms else float("inf")
+        print(f"{size:>8} {loop_ms:>9.1f} {build_ms:>9.1f} {score_ms:>9.2f} {speedup:>7.0f}x  {identical}")
+        if not identical:
+            sys.exit(f"Result mismatch at {size} recipes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated catalog sizes")
+    args = parser.parse_args()
+    run([int(s) for s in args.sizes.split(",")])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: author/rating enrichment for GET /api/recipes
+
+Compares the old per-recipe lookups with utils.recipe_enrichment on growing
+catalogs and shows that the bulk version uses a constant number of Mongo
+round trips and produces identical output.
+
+Usage:
+    python benchmarks/bench_recipe_enrichment.py [--sizes 100,500,2000]
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.mongo_standin import create_database  # noqa: E402
+from utils.recipe_enrichment import enrich_recipes  # noqa: E402
+
+SESSION_ID = "bench-session"
+
+
+async def legacy_enrich(db, all_recipes, session_id):
+    """The per-recipe enrichment loop get_recipes used before bulk lookups"""
+    if session_id:
+        favorites = await db.favorites.find({"session_id": session_id}, {"_id": 0}).to_list(1000)
+        favorite_ids = {fav['recipe_id'] for fav in favorites}
+        for recipe in all_recipes:
+            recipe['is_favorite'] = recipe['id'] in favorite_ids
+            rating = await db.ratings.find_one(
+                {"session_id": session_id, "recipe_id": recipe['id']},
+                {"_id": 0}
+            )
+            recipe['user_rating'] = rating.get('stars') if rating else None
+    for recipe in all_recipes:
+        if recipe.get('author') and recipe.get('author') != 'system':
+            author_user = await db.users.find_one({"id": recipe['author']}, {"_id": 0, "name": 1})
+            if author_user:
+                recipe['author_name'] = author_user.get('name', 'Ukendt')
+                recipe['author_recipe_count'] = await db.user_recipes.count_documents({
+                    "author": recipe['author'],
+                    "is_published": True,
+                    "approval_status": "approved"
+                })
+            else:
+                recipe['author_name'] = 'Ukendt'
+                recipe['author_recipe_count'] = 0
+    return all_recipes
+
+
+async def seed(db, size: int):
+    """Seed a catalog where roughly half the recipes are user-authored"""
+    rng = random.Random(size)
+    authors = [f"user-{i}" for i in range(max(1, size // 20))]
+    await db.users.insert_many(
+        [{"id": author, "name": f"Author {i}"} for i, author in enumerate(authors)]
+    )
+
+    recipes = []
+    for i in range(size):
+        is_user = i % 2 == 1
+        recipes.append({
+            "id": f"recipe-{i}",
+            "name": f"Recipe {i}",
+            # Every 10th user recipe points at a deleted author
+            "author": (f"ghost-{i}" if i % 20 == 1 else rng.choice(authors)) if is_user else "system",
+        })
+    await db.user_recipes.insert_many([
+        {**r, "is_published": True, "approval_status": "approved"}
+        for r in recipes if r["author"] != "system"
+    ])
+
+    rated = rng.sample(recipes, k=size // 4)
+    await db.ratings.insert_many([
+        {"session_id": SESSION_ID, "recipe_id": r["id"], "stars": rng.randint(1, 5)}
+        for r in rated
+    ])
+    await db.favorites.insert_many([
+        {"session_id": SESSION_ID, "recipe_id": r["id"]}
+        for r in rng.sample(recipes, k=max(1, size // 10))
+    ])
+    return [{"id": r["id"], "name": r["name"], "author": r["author"]} for r in recipes]
+
+
+async def run(sizes):
+    print(f"{'recipes':>8} {'legacy ops':>11} {'bulk ops':>9} {'legacy ms':>10} {'bulk ms':>8}  identical")
+    for size in sizes:
+        db = create_database(f"bench_enrich_{size}")
+        recipes = await seed(db, size)
+
+        db.reset()
+        start = time.perf_counter()
+        legacy = await legacy_enrich(db, copy.deepcopy(recipes), SESSION_ID)
+        legacy_ms = (time.perf_counter() - start) * 1000
+        legacy_ops = db.total_ops
+
+        db.reset()
+        start = time.perf_counter()
+        bulk = await enrich_recipes(db, copy.deepcopy(recipes), SESSION_ID)
+        bulk_ms = (time.perf_counter() - start) * 1000
+        bulk_ops = db.total_ops
+
+        identical = json.dumps(legacy) == json.dumps(bulk)
+        print(f"{size:>8} {legacy_ops:>11} {bulk_ops:>9} {legacy_ms:>10.1f} {bulk_ms:>8.1f}  {identical}")
+        if not identical:
+            sys.exit(f"Output mismatch at {size} recipes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,500,2000", help="Comma-separated catalog sizes")
+    args = parser.parse_args()
+    asyncio.run(run([int(s) for s in args.sizes.split(",")]))
+
+
+if __name__ == "__main__":
+    main()
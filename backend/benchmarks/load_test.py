@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Load test: latency and Mongo ops of the public API hot paths
+
+Runs the FastAPI app in-process against a synthetic catalog (in-memory Mongo
+stand-in by default, or a disposable database on a local MongoDB) and drives
+GET /api/recipes, /api/recipes/{id}, /api/favorites/{session_id},
+/api/comments/{recipe_id}, /api/go/{mapping_id} and POST /api/match with
+concurrent clients. Reports p50/p95/p99 latency, throughput and Mongo round
+trips per request for each endpoint.
+
+The app's startup and shutdown handlers run around each catalog size, so the
+session, view and click buffers work as in production; whatever they still
+hold is flushed at the end of every scenario and their deferred writes are
+counted in its ops per request.
+
+The in-memory stand-in has no indexes and no network, so absolute numbers
+are only comparable between runs on the same backend; ops per request are
+comparable everywhere.
+
+Usage:
+    python benchmarks/load_test.py [--sizes 200,1000] [--requests 200] [--concurrency 8]
+                                   [--scenarios recipes,match] [--mongo-url mongodb://localhost:27017]
+                                   [--json results.json]
+
+Requires the backend dependencies (requirements.txt) plus mongomock-motor.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# server.py reads these at import time; the client it creates is never used
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "slushbook_bench")
+# The synthetic catalog is the whole catalog
+os.environ.setdefault("SEED_RECIPES_ON_STARTUP", "false")
+
+import httpx  # noqa: E402
+
+from benchmarks.mongo_standin import create_database, drop_database  # noqa: E402
+
+INGREDIENTS = [
+    "Citron sirup", "Lime sirup", "Jordbær sirup", "Hindbær sirup", "Blå curaçao sirup",
+    "Mango sirup", "Ananas sirup", "Cola sirup", "Vanilje sirup", "Mynte sirup",
+    "Vand/knust is", "Citron saft", "Lime saft", "Sukker", "Mælk", "Rom", "Vodka",
+]
+LANGUAGES = ["da", "en", "de", "fr", "en_us"]
+USERS = 200
+FAVORITES_PER_USER = 20
+COMMENTED_RECIPES = 50
+COMMENTS_PER_RECIPE = 20
+MAPPINGS = 200
+
+
+def _recipe(rng: random.Random, recipe_id: str, author: str, created_at: datetime) -> dict:
+    ingredients = [
+        {
+            "name": name,
+            "category_key": name.lower().replace(" ", "."),
+            "quantity": rng.randint(20, 700),
+            "unit": "ml",
+            "role": rng.choice(["required", "required", "optional", "garnish"]),
+        }
+        for name in rng.sample(INGREDIENTS, k=rng.randint(2, 6))
+    ]
+    name = f"Slush {recipe_id}"
+    return {
+        "id": recipe_id,
+        "name": name,
+        "description": f"Beskrivelse af {name}",
+        "author": author,
+        "author_name": "SLUSHBOOK" if author == "system" else "Bench",
+        "ingredients": ingredients,
+        "steps": ["Bland", "Frys", "Server"],
+        "alcohol_flag": rng.random() < 0.2,
+        "color": rng.choice(["red", "blue", "green", "yellow"]),
+        "type": rng.choice(["klassisk", "frugt", "cocktail"]),
+        "tags": ["slush"],
+        "is_free": rng.random() < 0.2,
+        "is_published": True,
+        "approval_status": "approved",
+        "rating_avg": 0,
+        "rating_count": 0,
+        "view_count": 0,
+        "created_at": created_at.isoformat(),
+        "translations": {
+            lang: {"name": f"{name} ({lang})", "description": f"{name} - {lang}", "steps": ["1", "2", "3"]}
+            for lang in LANGUAGES
+        },
+    }
+
+
+async def seed(db, size: int, rng: random.Random) -> dict:
+    """Fill the database and return the ids the scenarios pick from"""
+    now = datetime.now(timezone.utc)
+    recipes = [_recipe(rng, f"sys-{i}", "system", now - timedelta(hours=i)) for i in range(size)]
+    for recipe in recipes:
+        recipe["is_published"] = rng.random() < 0.9
+    await db.recipes.insert_many(recipes)
+
+    users, sessions, pantry, favorites, ratings = [], [], [], [], []
+    for i in range(USERS):
+        user_id = f"user-{i}"
+        users.append({
+            "id": user_id,
+            "email": f"user{i}@bench.slushbook.dk",
+            "name": f"Bench {i}",
+            "role": "pro",
+            "hashed_password": None,
+            "created_at": now,
+        })
+        sessions.append({
+            "user_id": user_id,
+            "session_token": uuid.uuid4().hex,
+            "expires_at": now + timedelta(days=30),
+            "created_at": now,
+            "last_active": now,
+        })
+        for name in rng.sample(INGREDIENTS, k=8):
+            pantry.append({"id": uuid.uuid4().hex, "session_id": user_id, "ingredient_name": name})
+        for recipe in rng.sample(recipes, k=min(FAVORITES_PER_USER, size)):
+            favorites.append({"session_id": user_id, "recipe_id": recipe["id"], "created_at": now.isoformat()})
+            ratings.append({"session_id": user_id, "recipe_id": recipe["id"], "stars": rng.randint(1, 5)})
+    await db.users.insert_many(users)
+    await db.user_sessions.insert_many(sessions)
+    await db.user_pantry.insert_many(pantry)
+    await db.favorites.insert_many(favorites)
+    await db.ratings.insert_many(ratings)
+
+    user_recipes = [
+        _recipe(rng, f"usr-{i}", f"user-{i % USERS}", now - timedelta(minutes=i))
+        for i in range(size // 4)
+    ]
+    for recipe in user_recipes:
+        recipe["session_id"] = recipe["author"]
+    if user_recipes:
+        await db.user_recipes.insert_many(user_recipes)
+
+    commented = [recipe["id"] for recipe in recipes[:COMMENTED_RECIPES]]
+    await db.recipe_comments.insert_many([
+        {
+            "id": uuid.uuid4().hex,
+            "recipe_id": recipe_id,
+            "user_id": f"user-{rng.randrange(USERS)}",
+            "user_name": "Bench",
+            "comment": "Lækker!",
+            "language": "da",
+            "created_at": (now - timedelta(minutes=j)).isoformat(),
+            "likes": 0,
+            "liked_by": [],
+            "status": "visible",
+        }
+        for recipe_id in commented
+        for j in range(COMMENTS_PER_RECIPE)
+    ])
+
+    mappings = [f"mapping-{i}" for i in range(MAPPINGS)]
+    await db.redirect_mappings.insert_many([{"id": m, "name": m, "ean": None, "keywords": ""} for m in mappings])
+    await db.redirect_options.insert_many([
+        {
+            "id": f"opt-{m}-{country}",
+            "mappingId": m,
+            "supplier": "bench",
+            "title": m,
+            "url": f"https://shop.example.{country.lower()}/{m}",
+            "status": "active",
+            "priceLastSeen": None,
+            "country_codes": [country],
+            "updatedAt": now.isoformat(),
+        }
+        for m in mappings
+        for country in ("DK", "DE", "GB")
+    ])
+
+    return {
+        "recipe_ids": [recipe["id"] for recipe in recipes if recipe["is_published"]],
+        "commented_ids": commented,
+        "sessions": [(session["user_id"], session["session_token"]) for session in sessions],
+        "mapping_ids": mappings,
+    }
+
+
+def build_scenarios(ids: dict, rng: random.Random) -> dict:
+    """name -> function returning (method, url, request kwargs)"""
+    def session():
+        user_id, token = rng.choice(ids["sessions"])
+        return user_id, {"Cookie": f"session_token={token}"}
+
+    def recipes():
+        user_id, headers = session()
+        return "GET", f"/api/recipes?session_id={user_id}&lang={rng.choice(LANGUAGES)}", {"headers": headers}
+
+    def recipe():
+        user_id, headers = session()
+        return "GET", f"/api/recipes/{rng.choice(ids['recipe_ids'])}?session_id={user_id}", {"headers": headers}
+
+    def match():
+        user_id, _ = session()
+        return "POST", "/api/match", {"json": {"session_id": user_id}}
+
+    def favorites():
+        user_id, headers = session()
+        return "GET", f"/api/favorites/{user_id}", {"headers": headers}
+
+    def comments():
+        return "GET", f"/api/comments/{rng.choice(ids['commented_ids'])}", {}
+
+    def go():
+        country = rng.choice(["DK", "DE", "GB", "US"])
+        return "GET", f"/api/go/{rng.choice(ids['mapping_ids'])}?country={country}", {}
+
+    return {
+        "recipes": recipes,
+        "recipe": recipe,
+        "match": match,
+        "favorites": favorites,
+        "comments": comments,
+        "go": go,
+    }
+
+
+def percentile(sorted_values, pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def flush_deferred_writes(server) -> None:
+    """Write what the session, view and click buffers hold, as shutdown does"""
+    await server.session_touches.flush(server.db, force=True)
+    await server.recipe_view_buffer.flush(server.db)
+    await server.click_ingestor.drain(server.db)
+    server.click_ingestor.start(server.db)
+
+
+async def run_scenario(client, db, make_request, requests: int, concurrency: int, warmup: int, flush) -> dict:
+    for _ in range(warmup):
+        method, url, kwargs = make_request()
+        await client.request(method, url, **kwargs)
+    await flush()
+
+    db.reset()
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            method, url, kwargs = make_request()
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    # Deferred writes belong to the requests that caused them
+    await flush()
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "throughput_rps": round(requests / elapsed, 1) if elapsed else None,
+        "ops_per_request": round(db.total_ops / requests, 2),
+        "ops": dict(db.ops.most_common()),
+    }
+
+
+async def run(args) -> list:
+    logging.disable(logging.INFO)
+    import redirect_routes
+    import server
+
+    results = []
+    print(f"{'recipes':>8} {'scenario':<10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8} {'ops/req':>8} {'errors':>7}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        db = create_database(f"slushbook_bench_{size}", args.mongo_url)
+        if args.mongo_url:
+            await drop_database(db)
+        ids = await seed(db, size, rng)
+
+        # Point the app at the seeded database and start with cold caches
+        server.db = db
+        redirect_routes.set_db(db)
+        server.catalog_cache.invalidate()
+
+        scenarios = build_scenarios(ids, rng)
+        # ASGITransport does not send lifespan events; run the handlers it would
+        await server.app.router.startup()
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name in args.scenarios:
+                result = await run_scenario(
+                    client, db, scenarios[name], args.requests, args.concurrency, args.warmup,
+                    lambda: flush_deferred_writes(server)
+                )
+                result.update({"size": size, "scenario": name})
+                results.append(result)
+                print(
+                    f"{size:>8} {name:<10} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f} "
+                    f"{result['throughput_rps']:>8.1f} {result['ops_per_request']:>8.2f} {result['errors']:>7}"
+                )
+        await server.app.router.shutdown()
+        if args.mongo_url:
+            await drop_database(db)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="200,1000", help="Comma-separated system catalog sizes")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per scenario")
+    parser.add_argument("--scenarios", default="recipes,recipe,match,favorites,comments,go",
+                        help="Comma-separated subset of: recipes, recipe, match, favorites, comments, go")
+    parser.add_argument("--mongo-url", default=None, help="Use a disposable database on this MongoDB instead of the in-memory stand-in")
+    parser.add_argument("--json", default=None, help="Also write the results (including ops per collection) to this file")
+    args = parser.parse_args()
+    args.sizes = [int(s) for s in args.sizes.split(",")]
+    args.scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+
+    results = asyncio.run(run(args))
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+In-process Mongo stand-in for benchmarks
+Wraps a mongomock-motor database and counts every round trip a handler makes,
+so benchmarks can report "Mongo ops per request" without a running server.
+Pass a mongo_url to count against a real (local) MongoDB instead.
+
+Requires: pip install mongomock-motor
+"""
+
+from collections import Counter
+from typing import Optional
+
+from mongomock_motor import AsyncMongoMockClient
+
+# Collection methods that cost one round trip to the server
+ROUND_TRIP_METHODS = {
+    "find", "find_one", "count_documents", "estimated_document_count",
+    "aggregate", "distinct",
+    "insert_one", "insert_many",
+    "update_one", "update_many", "replace_one",
+    "delete_one", "delete_many",
+    "find_one_and_update", "find_one_and_replace", "find_one_and_delete",
+    "bulk_write", "create_index", "create_indexes",
+}
+
+
+class CountingCollection:
+    """Proxy around a collection that records each round-trip method call"""
+
+    def __init__(self, collection, counter: Counter):
+        self._collection = collection
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name in ROUND_TRIP_METHODS:
+            def counted(*args, **kwargs):
+                self._counter[f"{self._collection.name}.{name}"] += 1
+                return attr(*args, **kwargs)
+            return counted
+        return attr
+
+
+class CountingDatabase:
+    """Proxy around a database that hands out counting collections"""
+
+    def __init__(self, database):
+        self._database = database
+        self.ops = Counter()
+
+    def __getattr__(self, name):
+        return self[name]
+
+    def __getitem__(self, name):
+        return CountingCollection(self._database[name], self.ops)
+
+    @property
+    def total_ops(self) -> int:
+        return sum(self.ops.values())
+
+    def reset(self):
+        self.ops.clear()
+
+
+def create_database(name: str = "slushbook_bench", mongo_url: Optional[str] = None) -> CountingDatabase:
+    """
+    Create an empty database with op counting: in memory by default, or the
+    database `name` on a real server. That database is expected to be
+    disposable - call drop_database() before seeding.
+    """
+    if mongo_url:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        return CountingDatabase(AsyncIOMotorClient(mongo_url)[name])
+    return CountingDatabase(AsyncMongoMockClient()[name])
+
+
+async def drop_database(db: CountingDatabase) -> None:
+    """Drop every collection of a benchmark database"""
+    for name in await db._database.list_collection_names():
+        await db._database.drop_collection(name)
@@ -0,0 +1,61 @@
+"""
+Report which hot queries are covered by an index
+Prints the registered indexes (utils/db_indexes.py), the ones missing in the
+database and the winning plan of every known query shape, flagging COLLSCANs.
+
+Usage:
+    python check_db_indexes.py          # report only
+    python check_db_indexes.py --apply  # create missing indexes first
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from utils.db_indexes import ensure_indexes, index_report
+
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'flavor_sync')
+
+
+async def main(apply: bool) -> int:
+    client = AsyncIOMotorClient(MONGO_URL)
+    db = client[DB_NAME]
+
+    try:
+        if apply:
+            result = await ensure_indexes(db)
+            print(f"Ensured {len(result['ensured'])} indexes")
+            for failure in result['failed']:
+                print(f"  FAILED {failure['index']}: {failure['error']}")
+
+        report = await index_report(db)
+
+        print("\nMissing indexes:")
+        for name in report['missing'] or ["(none)"]:
+            print(f"  {name}")
+
+        print("\nQuery plans:")
+        for query in report['queries']:
+            if query.get('error'):
+                status = f"ERROR {query['error']}"
+            else:
+                status = ("COLLSCAN  " if query['collscan'] else "ok        ") + " > ".join(query['stages'])
+            print(f"  {query['collection'] + ': ' + query['query']:<50} {status}")
+
+        if report['collscans']:
+            print(f"\n⚠️  {len(report['collscans'])} query shape(s) collection-scan")
+            return 1
+        print("\n✅ All query shapes use an index")
+        return 0
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check MongoDB index coverage")
+    parser.add_argument("--apply", action="store_true", help="Create missing indexes before reporting")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.apply)))
@@ -2,13 +2,18 @@
 """
 Import complete recipes from JSON export
 This will REPLACE all recipes in the target database
+
+Usage: python import_all_recipes.py [--dry-run]
 """
 
 import asyncio
 import json
 import os
+import sys
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from utils.recipe_import import RecipeImport
+
 async def main():
     mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
     db_name = os.environ.get('DB_NAME', 'flavor_sync')
@@ -34,12 +39,16 @@ async def main():
     recipes_data = data.get('recipes', [])
     print(f"📚 Found {len(recipes_data)} recipes in file")
     
+    dry_run = '--dry-run' in sys.argv
+    if dry_run:
+        print("🧪 Dry run - nothing will be written")
+    
     # Ask for confirmation
     print(f"\n⚠️  WARNING: This will update/create recipes in '{db_name}' database")
     print(f"   Existing recipes with same ID will be REPLACED")
     print(f"   New recipes will be CREATED")
     
-    response = input(f"\n   Continue? (yes/no): ")
+    response = 'yes' if dry_run else input(f"\n   Continue? (yes/no): ")
     
     if response.lower() != 'yes':
         print("❌ Cancelled")
@@ -47,41 +56,19 @@ async def main():
     
     print(f"\n{'='*60}")
     
-    # Process each recipe
-    created = 0
-    updated = 0
-    errors = 0
-    
-    for recipe_data in recipes_data:
-        recipe_id = recipe_data.get('id')
-        recipe_name = recipe_data.get('name', 'Unknown')
-        
-        if not recipe_id:
-            print(f"  ⚠️  Skipping {recipe_name} (no ID)")
-            errors += 1
-            continue
-        
-        try:
-            # Check if exists
-            existing = await db.recipes.find_one({'id': recipe_id})
-            
-            if existing:
-                # Update (replace)
-                await db.recipes.replace_one(
-                    {'id': recipe_id},
-                    recipe_data
-                )
-                updated += 1
-                print(f"  ✅ Updated: {recipe_name}")
-            else:
-                # Create new
-                await db.recipes.insert_one(recipe_data)
-                created += 1
-                print(f"  ✨ Created: {recipe_name}")
-                
-        except Exception as e:
-            print(f"  ❌ Error with {recipe_name}: {e}")
-            errors += 1
+    # Recipes are matched on id and written in batches
+    importer = RecipeImport("recipes", key_field="id", existing_projection={"_id": 0, "id": 1})
+    report = await importer.run(db, recipes_data, dry_run=dry_run)
+    
+    for result in report.results:
+        if result["status"] == "created":
+            print(f"  ✨ Created: {result['name']}")
+        elif result["status"] == "updated":
+            print(f"  ✅ Updated: {result['name']}")
+        else:
+            print(f"  ❌ Error with {result['name']}: {result['error']}")
+    
+    created, updated, errors = report.created, report.updated, report.errors
     
     print(f"\n{'='*60}")
     print(f"✨ Created: {created} new recipes")
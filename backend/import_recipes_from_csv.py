@@ -5,7 +5,7 @@ Import translated recipe data from CSV and update database
 
 import csv
 import json
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 
 # CSV file path
 csv_filename = '/app/recipe_translations_import.csv'
@@ -60,21 +60,12 @@ print("📤 Opdaterer database...")
 client = MongoClient('mongodb://localhost:27017')
 db = client['flavor_sync']
 
-updated_count = 0
-
-for recipe_id, recipe_data in recipes_data.items():
-    recipe_name = recipe_data['name']
-    translations = recipe_data['translations']
-    
-    result = db.recipes.update_one(
-        {'name': recipe_name},
-        {'$set': {'translations': translations}}
-    )
-    
-    if result.matched_count > 0:
-        updated_count += 1
-        if updated_count % 10 == 0:
-            print(f"✓ Opdateret {updated_count}/{len(recipes_data)}...")
+# One unordered bulk write instead of an update per recipe
+operations = [
+    UpdateOne({'name': recipe_data['name']}, {'$set': {'translations': recipe_data['translations']}})
+    for recipe_data in recipes_data.values()
+]
+updated_count = db.recipes.bulk_write(operations, ordered=False).matched_count if operations else 0
 
 print(f"\n✅ Opdateret {updated_count} opskrifter i databasen!")
 
@@ -0,0 +1,36 @@
+"""
+Management commands
+
+Usage:
+    python manage.py --seed           # seed system recipes if seed_data changed
+    python manage.py --seed --force   # re-apply the seed data regardless of the stored hash
+"""
+import argparse
+import asyncio
+import sys
+
+
+async def seed(force: bool) -> int:
+    from server import client, seed_recipes
+
+    try:
+        result = await seed_recipes(force=force)
+    finally:
+        client.close()
+
+    if not result["seeded"]:
+        print(f"Seed data unchanged ({result['hash'][:12]}) - nothing to do")
+        return 0
+    print(f"Seeded {result['recipes']} recipes ({result['errors']} errors), hash {result['hash'][:12]}")
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SLUSHBOOK management commands")
+    parser.add_argument("--seed", action="store_true", help="Seed the system recipes from seed_data/recipes.json")
+    parser.add_argument("--force", action="store_true", help="With --seed: ignore the stored seed hash")
+    args = parser.parse_args()
+    if not args.seed:
+        parser.print_help()
+        sys.exit(2)
+    sys.exit(asyncio.run(seed(args.force)))
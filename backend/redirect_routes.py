@@ -8,11 +8,17 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 import logging
-import csv
-import io
+import os
 from urllib.parse import urlencode, urlparse, parse_qs
-import httpx
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from utils.click_ingest import ClickIngestor
+from utils.csv_export import csv_download
+from utils.background_jobs import BackgroundJobs
+from utils.link_health import LinkHealthChecker
+from utils.product_csv_import import ProductCsvImporter
+from utils.redirect_table import RedirectTable
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +30,14 @@ def set_db(database: AsyncIOMotorDatabase):
     global db
     db = database
 
+# Shared click queue from server.py; clicks are written synchronously without it
+click_ingestor: Optional[ClickIngestor] = None
+
+def set_click_ingestor(ingestor: ClickIngestor):
+    """Set the batched click writer used by the redirect route"""
+    global click_ingestor
+    click_ingestor = ingestor
+
 router = APIRouter(prefix="/api/admin", tags=["redirect-service"])
 go_router = APIRouter(prefix="/api/go", tags=["redirect"])
 
@@ -153,6 +167,8 @@ async def create_mapping(request: CreateMappingRequest, auth: bool = Depends(ver
                 )
                 saved_options.append(option_dict)
         
+        await redirect_table.refresh(db)
+        
         # Fetch all options for this mapping
         all_options = await db.redirect_options.find(
             {"mappingId": mapping_dict["id"]},
@@ -213,6 +229,7 @@ async def delete_mapping(mapping_id: str, auth: bool = Depends(verify_admin_toke
         
         # Delete the mapping
         result = await db.redirect_mappings.delete_one({"id": mapping_id})
+        await redirect_table.refresh(db)
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Mapping not found")
@@ -245,6 +262,7 @@ async def create_option(request: CreateOptionRequest, auth: bool = Depends(verif
             )
         
         await db.redirect_options.insert_one(option_dict)
+        await redirect_table.refresh(db)
         
         # Remove MongoDB _id from response
         option_dict.pop("_id", None)
@@ -275,6 +293,7 @@ async def update_option(
             return_document=True,
             projection={"_id": 0}
         )
+        await redirect_table.refresh(db)
         
         if not result:
             raise HTTPException(status_code=404, detail="Option not found")
@@ -291,6 +310,7 @@ async def delete_option(option_id: str, auth: bool = Depends(verify_admin_token)
     """Delete an option"""
     try:
         result = await db.redirect_options.delete_one({"id": option_id})
+        await redirect_table.refresh(db)
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Option not found")
@@ -408,282 +428,151 @@ async def delete_supplier(supplier_id: str, auth: bool = Depends(verify_admin_to
 # LINK HEALTH CHECK
 # ==========================================
 
+link_health_checker = LinkHealthChecker(
+    concurrency=int(os.environ.get("LINK_HEALTH_CONCURRENCY", "20")),
+    per_host=int(os.environ.get("LINK_HEALTH_PER_HOST", "4")),
+    timeout=5.0
+)
+link_health_jobs = BackgroundJobs("Link health")
+
+async def run_link_health(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Check all active links and mark broken ones as inactive in one bulk write"""
+    active_options = await db.redirect_options.find(
+        {"status": "active"},
+        {"_id": 0, "id": 1, "url": 1}
+    ).to_list(length=None)
+    job["total"] = len(active_options)
+    
+    def progress(option, result):
+        job["checked"] += 1
+    
+    results = await link_health_checker.check(active_options, on_result=progress)
+    
+    changed = []
+    for option, result in zip(active_options, results):
+        if result["ok"]:
+            continue
+        entry = {"id": option["id"], "url": option["url"], "reason": result["reason"]}
+        if "status" in result:
+            entry["status"] = result["status"]
+        changed.append(entry)
+    
+    if changed:
+        now = datetime.now(timezone.utc).isoformat()
+        # Only options that are still active - an admin may have edited them meanwhile
+        await db.redirect_options.bulk_write(
+            [
+                UpdateOne(
+                    {"id": entry["id"], "status": "active"},
+                    {"$set": {"status": "inactive", "updatedAt": now}}
+                )
+                for entry in changed
+            ],
+            ordered=False
+        )
+        await redirect_table.refresh(db)
+    
+    return {"checked": len(active_options), "changed": changed}
+
 @router.post("/link-health")
 async def check_link_health(auth: bool = Depends(verify_admin_token)):
-    """Check health of all active links and mark broken ones as inactive"""
+    """Start a background health check of all active links (poll GET /link-health/{job_id})"""
     try:
-        active_options = await db.redirect_options.find(
-            {"status": "active"},
-            {"_id": 0}
-        ).to_list(length=None)
-        
-        changed = []
-        
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            for option in active_options:
-                try:
-                    response = await client.head(option["url"])
-                    
-                    if response.status_code >= 400:
-                        await db.redirect_options.update_one(
-                            {"id": option["id"]},
-                            {"$set": {
-                                "status": "inactive",
-                                "updatedAt": datetime.now(timezone.utc).isoformat()
-                            }}
-                        )
-                        changed.append({
-                            "id": option["id"],
-                            "url": option["url"],
-                            "status": response.status_code,
-                            "reason": "HTTP error"
-                        })
-                except Exception as e:
-                    await db.redirect_options.update_one(
-                        {"id": option["id"]},
-                        {"$set": {
-                            "status": "inactive",
-                            "updatedAt": datetime.now(timezone.utc).isoformat()
-                        }}
-                    )
-                    changed.append({
-                        "id": option["id"],
-                        "url": option["url"],
-                        "reason": str(e) or "Timeout/Network error"
-                    })
-        
-        return {"changed": changed}
+        job = link_health_jobs.running() or link_health_jobs.start(run_link_health)
+        return job
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error checking link health: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/link-health/{job_id}")
+async def get_link_health_job(job_id: str, auth: bool = Depends(verify_admin_token)):
+    """Status of a link health job; result holds the changed links when done"""
+    job = link_health_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Link health job not found")
+    return job
+
 # ==========================================
 # CSV IMPORT/EXPORT
 # ==========================================
 
+# Mappings per cursor batch (and per options query) in the CSV export
+EXPORT_BATCH_SIZE = 500
+
 @router.get("/export-product-csv")
 async def export_csv(auth: bool = Depends(verify_admin_token)):
-    """Export all product mappings and options to CSV"""
-    try:
-        mappings = await db.redirect_mappings.find({}, {"_id": 0}).to_list(length=None)
-        
-        # Create CSV in memory - standard format (only quotes when necessary)
-        output = io.StringIO()
-        writer = csv.writer(output)  # Default quoting handles commas, quotes, newlines
-        
-        # Header (keywords are semicolon-separated in output)
-        writer.writerow(['produkt_navn', 'keywords', 'ean', 'leverandør', 'url', 'title', 'lande'])
+    """Export all product mappings and their active options to CSV (streamed)"""
+    async def write_mappings(mappings):
+        # One options query per batch of mappings
+        options_by_mapping: Dict[str, List[Dict]] = {}
+        async for option in db.redirect_options.find(
+            {"mappingId": {"$in": [mapping["id"] for mapping in mappings]}, "status": "active"},
+            {"_id": 0}
+        ):
+            options_by_mapping.setdefault(option["mappingId"], []).append(option)
         
+        rows = []
         for mapping in mappings:
-            options = await db.redirect_options.find(
-                {"mappingId": mapping["id"]},
-                {"_id": 0}
-            ).to_list(length=None)
-            
             # Convert keywords from comma to semicolon
             keywords = mapping.get("keywords", "") or ""
             keywords = keywords.replace(",", ";")
             
-            for option in options:
-                if option.get("status") == "active":
-                    # Get country_codes - since we now store ONE country per option
-                    # Just extract the first (and should be only) country code
-                    country_codes = option.get("country_codes", ["DK"])
-                    country_str = country_codes[0] if country_codes else "DK"
-                    
-                    writer.writerow([
-                        mapping.get("name", ""),
-                        keywords,
-                        mapping.get("ean", "") or "",
-                        option.get("supplier", ""),
-                        option.get("url", ""),
-                        option.get("title", ""),
-                        country_str  # Single country code
-                    ])
-        
-        csv_content = output.getvalue()
-        output.close()
-        
-        # Add UTF-8 BOM for Excel/Numbers compatibility
-        csv_content_with_bom = '\ufeff' + csv_content
-        
-        return Response(
-            content=csv_content_with_bom.encode('utf-8'),
-            media_type="text/csv; charset=utf-8",
-            headers={
-                "Content-Disposition": "attachment; filename=slushice-links.csv"
-            }
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error exporting CSV: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+            for option in options_by_mapping.get(mapping["id"], []):
+                # Get country_codes - since we now store ONE country per option
+                # Just extract the first (and should be only) country code
+                country_codes = option.get("country_codes", ["DK"])
+                country_str = country_codes[0] if country_codes else "DK"
+                
+                rows.append([
+                    mapping.get("name", ""),
+                    keywords,
+                    mapping.get("ean", "") or "",
+                    option.get("supplier", ""),
+                    option.get("url", ""),
+                    option.get("title", ""),
+                    country_str  # Single country code
+                ])
+        return rows
+    
+    async def rows():
+        batch = []
+        async for mapping in db.redirect_mappings.find({}, {"_id": 0}).batch_size(EXPORT_BATCH_SIZE):
+            batch.append(mapping)
+            if len(batch) >= EXPORT_BATCH_SIZE:
+                for row in await write_mappings(batch):
+                    yield row
+                batch = []
+        if batch:
+            for row in await write_mappings(batch):
+                yield row
+    
+    # Header (keywords are semicolon-separated in output)
+    return csv_download(
+        ['produkt_navn', 'keywords', 'ean', 'leverandør', 'url', 'title', 'lande'],
+        rows(),
+        "slushice-links.csv"
+    )
+
+# Rows validated and written per bulk_write
+CSV_IMPORT_CHUNK_SIZE = int(os.environ.get("CSV_IMPORT_CHUNK_SIZE", "1000"))
 
 @router.post("/import-product-csv")
 async def import_csv(
     file: UploadFile = File(...),
     auth: bool = Depends(verify_admin_token)
 ):
-    """Import product mappings and options from CSV"""
+    """Import product mappings and options from CSV (streamed in chunks)"""
     try:
         if not file:
             raise HTTPException(status_code=400, detail="No file uploaded")
         
-        # Read CSV content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        
-        # Use StringIO to properly parse CSV with quoted fields
-        from io import StringIO
-        csv_file = StringIO(csv_content)
-        
-        reader = csv.reader(csv_file)
-        header = next(reader)  # Skip header
-        
-        logger.info(f"CSV Header: {header}")
+        importer = ProductCsvImporter(db, chunk_size=CSV_IMPORT_CHUNK_SIZE)
+        imported = await importer.run(file.file)
         
-        imported = {
-            "mappings": 0,
-            "options": 0,
-            "errors": []
-        }
-        
-        line_number = 1  # Start at 1 for header
-        for row in reader:
-            line_number += 1
-            try:
-                if len(row) < 6:
-                    error_msg = f"Line {line_number}: Invalid format (expected at least 6 fields, got {len(row)}). Row: {row}"
-                    imported["errors"].append(error_msg)
-                    logger.warning(error_msg)
-                    continue
-                
-                produkt_navn, keywords, ean, leverandor, url, title = row[:6]
-                
-                # Optional 7th field: countries (comma or semicolon separated)
-                countries = row[6] if len(row) > 6 else ""
-                
-                if not produkt_navn or not leverandor or not url or not title:
-                    error_msg = f"Line {line_number}: Missing required fields. Row: {row}"
-                    imported["errors"].append(error_msg)
-                    logger.warning(error_msg)
-                    continue
-                
-                # Generate mapping ID (slug)
-                import re
-                import unicodedata
-                
-                mapping_id = produkt_navn.lower()
-                # Normalize unicode
-                mapping_id = unicodedata.normalize('NFD', mapping_id)
-                mapping_id = mapping_id.encode('ascii', 'ignore').decode('utf-8')
-                # Replace Danish characters
-                mapping_id = mapping_id.replace('æ', 'ae').replace('ø', 'o').replace('å', 'aa')
-                # Remove special characters
-                mapping_id = re.sub(r'[^a-z0-9]+', '-', mapping_id)
-                mapping_id = mapping_id.strip('-')
-                
-                # Convert keywords from semicolon to comma
-                keywords_formatted = keywords.replace(";", ",") if keywords else ""
-                
-                # UPSERT mapping (update if exists, insert if new)
-                result = await db.redirect_mappings.update_one(
-                    {"id": mapping_id},
-                    {
-                        "$set": {
-                            "id": mapping_id,
-                            "name": produkt_navn,
-                            "ean": ean or None,
-                            "keywords": keywords_formatted
-                        }
-                    },
-                    upsert=True
-                )
-                # Count mapping only if it was newly created (upserted)
-                if result.upserted_id:
-                    imported["mappings"] += 1
-                
-                # Parse countries - each CSV row should have ONE country
-                # We create separate options for each country
-                if countries and countries.strip():
-                    country_code = countries.strip().upper()
-                else:
-                    # Auto-detect country from URL domain
-                    import urllib.parse
-                    parsed_url = urllib.parse.urlparse(url)
-                    domain = parsed_url.netloc.lower()
-                    
-                    # Extract TLD and map to country code
-                    tld_to_country = {
-                        '.dk': 'DK',
-                        '.de': 'DE',
-                        '.at': 'AT',
-                        '.fr': 'FR',
-                        '.co.uk': 'GB',
-                        '.uk': 'GB',
-                        '.com': 'US',
-                        '.eu': 'GB',
-                    }
-                    
-                    country_code = None
-                    for tld, country in tld_to_country.items():
-                        if domain.endswith(tld):
-                            country_code = country
-                            break
-                    
-                    if not country_code:
-                        country_code = "DK"  # Default fallback
-                        logger.warning(f"Could not detect country from URL {url}, using DK fallback")
-                
-                # Each option is unique by: mapping + supplier + country
-                # Check if this specific option already exists
-                existing_option = await db.redirect_options.find_one({
-                    "mappingId": mapping_id,
-                    "supplier": leverandor,
-                    "country_codes": [country_code]  # Check exact country match
-                })
-                
-                if existing_option:
-                    # UPDATE existing option
-                    await db.redirect_options.update_one(
-                        {"id": existing_option["id"]},
-                        {
-                            "$set": {
-                                "title": title,
-                                "url": url,
-                                "country_codes": [country_code],  # Single country per option
-                                "updatedAt": datetime.now(timezone.utc).isoformat()
-                            }
-                        }
-                    )
-                    logger.info(f"Updated option: {mapping_id} - {leverandor} - {country_code}")
-                else:
-                    # INSERT new option
-                    option_id = f"opt_{mapping_id}_{leverandor}_{country_code}_{int(datetime.now(timezone.utc).timestamp() * 1000)}"
-                    
-                    await db.redirect_options.insert_one({
-                        "id": option_id,
-                        "mappingId": mapping_id,
-                        "supplier": leverandor,
-                        "title": title,
-                        "url": url,
-                        "status": "active",
-                        "priceLastSeen": None,
-                        "country_codes": [country_code],  # Single country per option
-                        "updatedAt": datetime.now(timezone.utc).isoformat()
-                    })
-                    logger.info(f"Created new option: {mapping_id} - {leverandor} - {country_code}")
-                
-                imported["options"] += 1
-            except Exception as e:
-                error_msg = f"Line {line_number}: {str(e)}"
-                imported["errors"].append(error_msg)
-                logger.error(error_msg, exc_info=True)
-        
-        logger.info(f"CSV Import completed: {imported['mappings']} mappings, {imported['options']} options, {len(imported['errors'])} errors")
+        await redirect_table.refresh(db)
+        logger.info(f"CSV Import completed: {imported['mappings']} mappings, {imported['options']} options, {importer.error_count} errors")
         return imported
     except HTTPException:
         raise
@@ -716,6 +605,13 @@ def add_utm(url: str) -> str:
     new_query = urlencode(params, doseq=True)
     return f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{new_query}"
 
+# mapping_id -> precomputed target URL per country, refreshed after option writes
+redirect_table = RedirectTable(
+    make_url=lambda url: add_utm(wrap_affiliate(url)),
+    fallback_url=FALLBACK_URL,
+    ttl_seconds=float(os.environ.get("REDIRECT_TABLE_TTL_SECONDS", "60"))
+)
+
 @go_router.get("/{mapping_id}")
 async def redirect_to_product(
     mapping_id: str, 
@@ -735,58 +631,24 @@ async def redirect_to_product(
     6. Fallback URL
     """
     try:
-        # Log click
+        # Log click (queued - the redirect does not wait for the write)
         import uuid
         click_id = str(uuid.uuid4())
-        await db.redirect_clicks.insert_one({
+        click = {
             "id": click_id,
             "mappingId": mapping_id,
             "ts": datetime.now(timezone.utc).isoformat(),
             "userAgent": user_agent,
             "referer": referer,
             "country": country
-        })
-        
-        # Get all active options for this mapping
-        options_cursor = db.redirect_options.find(
-            {"mappingId": mapping_id, "status": "active"},
-            {"_id": 0}
-        ).sort("updatedAt", -1)
-        
-        options = await options_cursor.to_list(length=None)
-        
-        if not options:
-            # No options at all, use fallback
-            target_url = add_utm(wrap_affiliate(FALLBACK_URL))
+        }
+        if click_ingestor is not None:
+            click_ingestor.insert("redirect_clicks", click)
         else:
-            # Country-based selection with fallback
-            selected_option = None
-            
-            # Define fallback order
-            fallback_order = []
-            if country:
-                fallback_order.append(country.upper())
-            fallback_order.extend(["DK", "US", "GB"])
-            
-            # Try each country in fallback order
-            for country_code in fallback_order:
-                for option in options:
-                    # Check if this option supports the country
-                    option_countries = option.get("country_codes", ["DK", "US", "GB"])
-                    if country_code in option_countries:
-                        selected_option = option
-                        logger.info(f"Selected option for country {country_code}: {option['supplier']}")
-                        break
-                
-                if selected_option:
-                    break
-            
-            # If still no match, use first available option
-            if not selected_option:
-                selected_option = options[0]
-                logger.info(f"No country match, using first option: {selected_option['supplier']}")
-            
-            target_url = add_utm(wrap_affiliate(selected_option["url"]))
+            await db.redirect_clicks.insert_one(click)
+        
+        # Country-based selection with fallback, precomputed per mapping
+        target_url = await redirect_table.resolve(db, mapping_id, country)
         
         return Response(
             status_code=302,
@@ -1,3 +1,5 @@
+# First import: with STARTUP_PROFILE=1 it hooks every later import to time it
+from utils.startup_profile import startup_profile
 from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Depends, Request, Response, Body
 from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
@@ -5,7 +7,7 @@ from fastapi.responses import FileResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
-from PIL import Image
+import asyncio
 import io
 import os
 import json
@@ -17,28 +19,42 @@ import uuid
 import secrets
 from datetime import datetime, timezone, timedelta
 import shutil
-import httpx
 import subprocess
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
 # Import unit converter utilities
 import sys
 sys.path.append('/app/backend')
 from utils.unit_converter import convert_to_ml, convert_from_ml, normalize_ingredient, denormalize_ingredient, get_supported_units, UNIT_TO_ML
+from utils.recipe_enrichment import enrich_recipes, attach_author_info, ENRICHMENT_FIELDS
+from utils.catalog_cache import CatalogCache
+from utils.ingredient_index import IngredientIndex, recipe_matches_ingredients
+from utils.pantry_matching import PantryMatcher, TopMatches
+from utils.db_indexes import ensure_indexes, index_report
+from utils.view_buffer import RecipeViewBuffer
+from utils.recipe_lookup import ResolvedRecipe, resolve_recipe, is_visible
+from utils.click_ingest import ClickIngestor
+from utils.csv_export import csv_download
+from utils.recipe_import import RecipeImport
+from utils.recipe_seed import forget_seed, seed_recipes as run_recipe_seed
+from utils.background_jobs import BackgroundJobs
+from utils.comment_enrichment import enrich_admin_comments, backfill_comment_languages
+from utils import broadcast_notifications, notification_feed, comment_threads, tips_feed
+from utils.keyset import NEWEST_FIRST, decode_position, encode_position, older_than
+from utils.recipe_pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE,
+    paginate_recipe_sources, parse_fields, build_projection, trim_fields
+)
+from utils.recipe_translation import SUPPORTED_LANGUAGES, apply_translation, with_translations
 
 # Version
 __version__ = "2.0.0"
 
-# Import geolocation service
-import geolocation_service
-
 # Import auth module
 from auth import (
     User, UserInDB, UserSession, PasswordReset,
     SignupRequest, LoginRequest, ForgotPasswordRequest, ResetPasswordRequest,
     get_password_hash, verify_password, create_session_token, create_reset_token,
     get_current_user, require_auth, require_role,
+    invalidate_session, invalidate_user_sessions, session_cache, session_touches,
     can_edit_recipe, can_view_recipe, can_create_recipe,
     security
 )
@@ -49,20 +65,7 @@ import redirect_routes
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# Configure Cloudinary
-cloudinary.config(
-    cloud_name=os.environ.get('CLOUDINARY_CLOUD_NAME'),
-    api_key=os.environ.get('CLOUDINARY_API_KEY'),
-    api_secret=os.environ.get('CLOUDINARY_API_SECRET'),
-    secure=True  # Use HTTPS URLs
-)
-
-print(f"[INFO] Cloudinary configured: {os.environ.get('CLOUDINARY_CLOUD_NAME')}")
-
-# Debug CORS configuration
 cors_origins_str = os.environ.get('CORS_ORIGINS', '*')
-print(f"[DEBUG] CORS_ORIGINS from env: {cors_origins_str}")
-print(f"[DEBUG] CORS_ORIGINS split: {cors_origins_str.split(',')}")
 
 
 # NOTE: Redirect-service startup removed - now using integrated FastAPI routes
@@ -73,6 +76,27 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+logger.debug(f"CORS_ORIGINS from env: {cors_origins_str}")
+startup_profile.mark("imports")
+
+_cloudinary = None
+
+def get_cloudinary():
+    """Import and configure Cloudinary on first use - only image uploads need it"""
+    global _cloudinary
+    if _cloudinary is None:
+        import cloudinary
+        import cloudinary.uploader
+        import cloudinary.api
+        cloudinary.config(
+            cloud_name=os.environ.get('CLOUDINARY_CLOUD_NAME'),
+            api_key=os.environ.get('CLOUDINARY_API_KEY'),
+            api_secret=os.environ.get('CLOUDINARY_API_SECRET'),
+            secure=True  # Use HTTPS URLs
+        )
+        logger.info(f"Cloudinary configured: {os.environ.get('CLOUDINARY_CLOUD_NAME')}")
+        _cloudinary = cloudinary
+    return _cloudinary
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
@@ -84,6 +108,54 @@ db = client[os.environ['DB_NAME']]
 async def get_db():
     return db
 
+
+async def _load_recipe_catalog():
+    return await db.recipes.find({}, {"_id": 0}).to_list(length=None)
+
+# In-memory snapshot of db.recipes - every endpoint that writes to db.recipes
+# must call catalog_cache.invalidate(). The TTL covers other workers' writes.
+catalog_cache = CatalogCache(
+    loader=_load_recipe_catalog,
+    translate=lambda recipe, lang: apply_translation(recipe, lang, include_translations=False),
+    ttl_seconds=float(os.environ.get('CATALOG_CACHE_TTL_SECONDS', '60')),
+    languages=SUPPORTED_LANGUAGES
+)
+
+# Ingredient-substring index for the include/exclude filter of GET /api/recipes,
+# keyed by (collection name, recipe id)
+ingredient_index = IngredientIndex()
+
+# Recipe detail views (view_count increments and recipe_views events) are
+# buffered and written in batches by a background task started on startup
+recipe_view_buffer = RecipeViewBuffer(
+    interval_seconds=float(os.environ.get('RECIPE_VIEW_FLUSH_SECONDS', '5'))
+)
+
+
+# Hash-gated seeding on boot (one read when unchanged); "python manage.py --seed" runs it explicitly
+SEED_RECIPES_ON_STARTUP = os.environ.get('SEED_RECIPES_ON_STARTUP', 'true').lower() in ('1', 'true', 'yes')
+
+# Redirect, product and ad clicks are queued and written in batches
+click_ingestor = ClickIngestor(
+    max_queue=int(os.environ.get('CLICK_QUEUE_SIZE', '10000')),
+    flush_size=int(os.environ.get('CLICK_FLUSH_SIZE', '500')),
+    flush_interval=float(os.environ.get('CLICK_FLUSH_INTERVAL_SECONDS', '1'))
+)
+
+# First pages of the tips feed; tip writes must call tips_cache.invalidate()
+tips_cache = tips_feed.TipsFeedCache(
+    ttl_seconds=float(os.environ.get('TIPS_CACHE_TTL_SECONDS', '30'))
+)
+
+# Data migrations started from the admin, pollable by job id
+comment_backfill_jobs = BackgroundJobs("Comment language backfill")
+
+
+async def find_recipe(recipe_id: str, projection: Optional[Dict] = None) -> Optional[ResolvedRecipe]:
+    """Look a recipe up in db.recipes or db.user_recipes with a single query"""
+    snapshot = await catalog_cache.get_snapshot()
+    return await resolve_recipe(db, recipe_id, snapshot.ids, projection)
+
 # Wrapper for get_current_user that injects db
 async def get_current_user_with_db(
     request: Request,
@@ -92,9 +164,8 @@ async def get_current_user_with_db(
     return await get_current_user(request, credentials, db)
 
 
-# Create uploads directory
+# Uploads directory (created on startup)
 UPLOADS_DIR = ROOT_DIR / 'uploads'
-UPLOADS_DIR.mkdir(exist_ok=True)
 
 # Create the main app
 app = FastAPI()
@@ -403,1718 +474,25 @@ class AdUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
 
-# Seed initial recipes
-async def seed_recipes():
-    logger.info("[SEED] Starting recipe seeding process...")
-    try:
-        count = await db.recipes.count_documents({"author": "system"})
-        logger.info(f"[SEED] Found {count} existing system recipes")
-        # Don't return - allow re-seeding with upsert to update translations
-    except Exception as e:
-        logger.warning(f"Cannot check existing recipes (permissions): {e}")
-    
-    recipes_data = [
-        {
-            "name": "Jordbær Klassisk",
-            "description": "En klassisk jordbær slushice perfekt til varme sommerdage",
-            "image_url": "https://images.unsplash.com/photo-1488477181946-6428a0291777?w=400&h=600&fit=crop",
-            "color": "red",
-            "alcohol_flag": False,
-            "target_brix": 14.0,
-            "tags": ["børn", "frisk", "sød", "populær"],
-            "ingredients": [
-                {"name": "Jordbær sirup", "category_key": "sirup.baer.jordbaer", "quantity": 250, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 700, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Citron saft", "category_key": "citrus.citron", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland jordbær sirup og vand grundigt", "Tilføj citron saft for ekstra friskhed", "Justér mod 14°Bx hvis nødvendigt", "Fyld i maskinen og vent til slush-konsistens"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Jordbær Klassisk",
-                        "description": "En klassisk jordbærslush med frisk og naturlig sødme, perfekt afbalanceret med en let syrlighed fra citron.\nIdeel til varme sommerdage – både for børn og voksne, som elsker den rene frugtsmag.",
-                        "steps": [
-                                    "Hæld jordbær-sirup og vand i en kande, og rør grundigt.",
-                                    "Tilsæt citronsaft for at give friskhed og balance.",
-                                    "Justér evt. sukkergraden mod 14 °Bx, hvis der bruges anden sirup.",
-                                    "Hæld blandingen i maskinen og kør ved ca. –3 °C, til ønsket slush-konsistens opnås."
-                        ]
-            },
-            "de": {
-                        "name": "Jordbær Klassisk",
-                        "description": "Ein klassisk jordbærslush mit frisk und naturlig sødme, perfekt afbalanceret mit ein let syrlighed fra citron.\nIdeel bis varme alsmerdage – både für børn und voksne, als elsker dein reine frugtsmag.",
-                        "steps": [
-                                    "Gießein Sie jordbær-sirup und vand in einein Krug, und rør gründlich.",
-                                    "Fügein Sie hinzu citronsaft für at give friskhed und balance.",
-                                    "Justér ggf. sukkergradein mod 14 °Bx, hvis der bruges andein sirup.",
-                                    "Gießein Sie die Mischung in die Maschine und kør ved ca. –3 °C, bis ønsket slush-konsisteins opnås."
-                        ]
-            },
-            "fr": {
-                        "name": "Jordbær Klassisk",
-                        "description": "Un klassisk jordbærslush avec frisk et naturlig sødme, parfait afbalanceret avec un let syrlighed fra citron.\nIdeel jusqu'à varme commemerdage – både pour børn et voksne, comme elsker dun rune frugtsmag.",
-                        "steps": [
-                                    "Versez jordbær-sirup et vand dans un pichet, et rør soigneusemunt.",
-                                    "Ajoutez citronsaft pour at give friskhed et balance.",
-                                    "Justér évuntuellemunt sukkergradun mod 14 °Bx, hvis der bruges andun sirup.",
-                                    "Versez le mélange dans la machine et kør ved ca. –3 °C, jusqu'à ønsket slush-konsistuns opnås."
-                        ]
-            },
-            "en": {
-                        "name": "Jordbær Klassisk",
-                        "description": "A klassisk jordbærslush with frisk and naturlig sødme, perfect afbalanceret with a let syrlighed fra citron.\nIdeel until varme asmerdage – både for børn and voksne, as elsker da rae frugtsmag.",
-                        "steps": [
-                                    "Pour jordbær-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Add citronsaft for at give friskhed and balance.",
-                                    "Justér optionally sukkergrada mod 14 °Bx, hvis der bruges anda sirup.",
-                                    "Pour the mixture in the machine and kør ved ca. –3 °C, until ønsket slush-konsistas opnås."
-                        ]
-            },
-            "en_us": {
-                        "name": "Jordbær Klassisk",
-                        "description": "A klassisk jordbærslush with frisk and naturlig sødme, perfect afbalanceret with a let syrlighed fra citron.\nIdeel until varme asmerdage – både for børn and voksne, as elsker da rae frugtsmag.",
-                        "steps": [
-                                    "Pour jordbær-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Add citronsaft for at give friskhed and balance.",
-                                    "Justér optionally sukkergrada mod 14 °Bx, hvis der bruges anda sirup.",
-                                    "Pour the mixture in the machine and kør ved ca. –3 °C, until ønsket slush-konsistas opnås."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Blå Hawaii",
-            "description": "Eksotisk blå slushice med tropisk smag",
-            "image_url": "https://images.unsplash.com/photo-1551024601-bec78aea704b?w=400&h=600&fit=crop",
-            "color": "blue",
-            "alcohol_flag": False,
-            "target_brix": 13.0,
-            "tags": ["tropisk", "eksotisk", "børn"],
-            "ingredients": [
-                {"name": "Blå curaçao sirup", "category_key": "sirup.blue", "quantity": 200, "unit": "ml", "role": "required", "brix": 60},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 750, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Kokos sirup", "category_key": "sirup.kokos", "quantity": 50, "unit": "ml", "role": "optional", "brix": 65}
-            ],
-            "steps": ["Bland blå curaçao sirup med vand", "Tilsæt kokos sirup for tropisk twist", "Rør godt og fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Blå Hawaii",
-                        "description": "Eksotisk blå slushice med tropisk smag af kokos og citrus – en farverig klassiker, der bringer smagen af sommer og Hawaii til glasset.",
-                        "steps": [
-                                    "Bland blå curaçao-sirup, kokos-sirup og vand i en kande, og rør grundigt.",
-                                    "Hæld blandingen direkte i slushmaskinen.",
-                                    "Kør til ønsket slush-konsistens (ca. –3 °C til –5 °C).",
-                                    "Server straks – pynt evt. med en ananasskive eller et kirsebær for tropisk look."
-                        ]
-            },
-            "de": {
-                        "name": "Blå Hawaii",
-                        "description": "Eksotisk blå slushice mit tropisk smag af kokos und citrus – ein farverig klassiker, der bringer smagein af alsmer und Hawaii bis glasset.",
-                        "steps": [
-                                    "Mischein Sie blå curaçao-sirup, kokos-sirup und vand in einein Krug, und rør gründlich.",
-                                    "Gießein Sie die Mischung direkte in die Slushmaschine.",
-                                    "Lassein Sie laufein bis ønsket slush-konsisteins (ca. –3 °C bis –5 °C).",
-                                    "Servierein Sie sofürt – pynt ggf. mit ein ananasskive oder et kirsebær für tropisk look."
-                        ]
-            },
-            "fr": {
-                        "name": "Blå Hawaii",
-                        "description": "Eksotisk blå slushice avec tropisk smag af kokos et citrus – un farverig klassiker, der bringer smagun af commemer et Hawaii jusqu'à glasset.",
-                        "steps": [
-                                    "Mélangez blå curaçao-sirup, kokos-sirup et vand dans un pichet, et rør soigneusemunt.",
-                                    "Versez le mélange direkte dans la machine à slush.",
-                                    "Faites tourner jusqu'à ønsket slush-konsistuns (ca. –3 °C jusqu'à –5 °C).",
-                                    "Servez immédiatemunt – pynt évuntuellemunt avec un ananasskive ou et kirsebær pour tropisk look."
-                        ]
-            },
-            "en": {
-                        "name": "Blå Hawaii",
-                        "description": "Eksotisk blå slushice with tropisk smag af kokos and citrus – a farverig klassiker, der bringer smaga af asmer and Hawaii until glasset.",
-                        "steps": [
-                                    "Mix blå curaçao-sirup, kokos-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Pour the mixture direkte in the slush machine.",
-                                    "Run until ønsket slush-konsistas (ca. –3 °C until –5 °C).",
-                                    "Serve imwithiately – pynt optionally with a ananasskive or et kirsebær for tropisk look."
-                        ]
-            },
-            "en_us": {
-                        "name": "Blå Hawaii",
-                        "description": "Eksotisk blå slushice with tropisk smag af kokos and citrus – a farverig klassiker, der bringer smaga af asmer and Hawaii until glasset.",
-                        "steps": [
-                                    "Mix blå curaçao-sirup, kokos-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Pour the mixture direkte in the slush machine.",
-                                    "Run until ønsket slush-konsistas (ca. –3 °C until –5 °C).",
-                                    "Serve imwithiately – pynt optionally with a ananasskive or et kirsebær for tropisk look."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Citron Frisk",
-            "description": "Forfriskende citron slushice med mint",
-            "image_url": "https://images.unsplash.com/photo-1622597467836-f3285f2131b8?w=400&h=600&fit=crop",
-            "color": "yellow",
-            "alcohol_flag": False,
-            "target_brix": 15.0,
-            "tags": ["frisk", "sur", "sommer"],
-            "ingredients": [
-                {"name": "Citron sirup", "category_key": "sirup.citrus.citron", "quantity": 300, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 650, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Mynte sirup", "category_key": "sirup.mynte", "quantity": 50, "unit": "ml", "role": "optional", "brix": 60}
-            ],
-            "steps": ["Bland citron sirup og vand", "Tilføj mynte for ekstra friskhed", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Citron Frisk",
-                        "description": "En frisk og forfriskende citron-slushice med et hint af mynte. Den skarpe citrus og den bløde sødme fra siruppen giver en balanceret smag, der minder om lemonade på frost. Perfekt på varme sommerdage.",
-                        "steps": [
-                                    "Hæld citron- og mynte-sirup i en kande sammen med vand, og rør grundigt.",
-                                    "Hæld blandingen direkte i slushmaskinen.",
-                                    "Kør maskinen til du får en jævn, frossen konsistens (–3 °C til –5 °C).",
-                                    "Server straks – pynt gerne med en skive citron eller et lille mynteblad for et frisk udtryk."
-                        ]
-            },
-            "de": {
-                        "name": "Citron Frisk",
-                        "description": "Ein frisk und fürfriskeinde citron-slushice mit et hint af mynte. Dein skarpe citrus und dein bløde sødme fra siruppein giver ein balanceret smag, der minder om lemonade auf frost. Perfekt auf varme alsmerdage.",
-                        "steps": [
-                                    "Gießein Sie citron- und mynte-sirup in einein Krug sammein mit vand, und rør gründlich.",
-                                    "Gießein Sie die Mischung direkte in die Slushmaschine.",
-                                    "Lassein Sie laufein maskinein bis du får ein glatt, frossein konsisteins (–3 °C bis –5 °C).",
-                                    "Servierein Sie sofürt – garnierein Sie gerne mit ein skive citron oder et lille mynteblad für et frisk udtryk."
-                        ]
-            },
-            "fr": {
-                        "name": "Citron Frisk",
-                        "description": "Un frisk et pourfriskunde citron-slushice avec et hint af mynte. Dun skarpe citrus et dun bløde sødme fra siruppun giver un balanceret smag, der minder om lemonade sur frost. Perfekt sur varme commemerdage.",
-                        "steps": [
-                                    "Versez citron- et mynte-sirup dans un pichet sammun avec vand, et rør soigneusemunt.",
-                                    "Versez le mélange direkte dans la machine à slush.",
-                                    "Faites tourner maskinun jusqu'à du får un lisse, frossun konsistuns (–3 °C jusqu'à –5 °C).",
-                                    "Servez immédiatemunt – garnissez avec un skive citron ou et lille mynteblad pour et frisk udtryk."
-                        ]
-            },
-            "en": {
-                        "name": "Citron Frisk",
-                        "description": "A frisk and forfriskade citron-slushice with et hint af mynte. Da skarpe citrus and da bløde sødme fra siruppa giver a balanceret smag, der minder om lemonade on frost. Perfekt on varme asmerdage.",
-                        "steps": [
-                                    "Pour citron- and mynte-sirup in a pitcher samma with vand, and rør thoroughly.",
-                                    "Pour the mixture direkte in the slush machine.",
-                                    "Run maskina until du får a smooth, frossa konsistas (–3 °C until –5 °C).",
-                                    "Serve imwithiately – garnish with a skive citron or et lille mynteblad for et frisk udtryk."
-                        ]
-            },
-            "en_us": {
-                        "name": "Citron Frisk",
-                        "description": "A frisk and forfriskade citron-slushice with et hint af mynte. Da skarpe citrus and da bløde sødme fra siruppa giver a balanceret smag, der minder om lemonade on frost. Perfekt on varme asmerdage.",
-                        "steps": [
-                                    "Pour citron- and mynte-sirup in a pitcher samma with vand, and rør thoroughly.",
-                                    "Pour the mixture direkte in the slush machine.",
-                                    "Run maskina until du får a smooth, frossa konsistas (–3 °C until –5 °C).",
-                                    "Serve imwithiately – garnish with a skive citron or et lille mynteblad for et frisk udtryk."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Cola Original",
-            "description": "Klassisk cola slushice - altid en favorit",
-            "image_url": "https://images.unsplash.com/photo-1581006852262-e4307cf6283a?w=400&h=600&fit=crop",
-            "color": "brown",
-            "alcohol_flag": False,
-            "target_brix": 16.0,
-            "tags": ["klassisk", "populær", "børn"],
-            "ingredients": [
-                {"name": "Cola sirup", "category_key": "sirup.cola", "quantity": 350, "unit": "ml", "role": "required", "brix": 68},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 650, "unit": "ml", "role": "required", "brix": 0}
-            ],
-            "steps": ["Bland cola sirup og vand grundigt", "Fyld i maskinen og vent på den perfekte konsistens"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Cola Original",
-                        "description": "En ægte klassiker, iskold, boblende og uimodståelig. Den klassiske cola-slush, som alle kender, med den perfekte balance mellem sødme og friskhed. Ideel til både børn og voksne, der elsker den velkendte smag.",
-                        "steps": [
-                                    "Bland cola-sirup og vand i en kande, og rør grundigt, til siruppen er helt opløst.",
-                                    "Hæld blandingen direkte i slushmaskinen.",
-                                    "Kør, til du opnår den ønskede frosne konsistens (–3 °C til –5 °C).",
-                                    "Server straks – klassisk, iskold og forfriskende."
-                        ]
-            },
-            "de": {
-                        "name": "Cola Original",
-                        "description": "Ein ægte klassiker, iskold, bobleinde und uimodståelig. Dein klassiske cola-slush, als alle keinder, mit dein perfekte balance mellem sødme und friskhed. Ideel bis både børn und voksne, der elsker dein velkeindte smag.",
-                        "steps": [
-                                    "Mischein Sie cola-sirup und vand in einein Krug, und rør gründlich, bis siruppein er helt opløst.",
-                                    "Gießein Sie die Mischung direkte in die Slushmaschine.",
-                                    "Lassein Sie laufein, bis du opnår dein ønskede frosne konsisteins (–3 °C bis –5 °C).",
-                                    "Servierein Sie sofürt – klassisk, iskold und fürfriskeinde."
-                        ]
-            },
-            "fr": {
-                        "name": "Cola Original",
-                        "description": "Un ægte klassiker, iskold, boblunde et uimodståelig. Dun klassiske cola-slush, comme alle kunder, avec dun parfaite balance mellem sødme et friskhed. Ideel jusqu'à både børn et voksne, der elsker dun velkundte smag.",
-                        "steps": [
-                                    "Mélangez cola-sirup et vand dans un pichet, et rør soigneusemunt, jusqu'à siruppun er helt opløst.",
-                                    "Versez le mélange direkte dans la machine à slush.",
-                                    "Faites tourner, jusqu'à du opnår dun ønskede frosne konsistuns (–3 °C jusqu'à –5 °C).",
-                                    "Servez immédiatemunt – klassisk, iskold et pourfriskunde."
-                        ]
-            },
-            "en": {
-                        "name": "Cola Original",
-                        "description": "A ægte klassiker, iskold, boblade and uimodståelig. Da klassiske cola-slush, as alle kader, with da perfecte balance mellem sødme and friskhed. Ideel until både børn and voksne, der elsker da velkadte smag.",
-                        "steps": [
-                                    "Mix cola-sirup and vand in a pitcher, and rør thoroughly, until siruppa er helt opløst.",
-                                    "Pour the mixture direkte in the slush machine.",
-                                    "Run, until du opnår da ønskede frosne konsistas (–3 °C until –5 °C).",
-                                    "Serve imwithiately – klassisk, iskold and forfriskade."
-                        ]
-            },
-            "en_us": {
-                        "name": "Cola Original",
-                        "description": "A ægte klassiker, iskold, boblade and uimodståelig. Da klassiske cola-slush, as alle kader, with da perfecte balance mellem sødme and friskhed. Ideel until både børn and voksne, der elsker da velkadte smag.",
-                        "steps": [
-                                    "Mix cola-sirup and vand in a pitcher, and rør thoroughly, until siruppa er helt opløst.",
-                                    "Pour the mixture direkte in the slush machine.",
-                                    "Run, until du opnår da ønskede frosne konsistas (–3 °C until –5 °C).",
-                                    "Serve imwithiately – klassisk, iskold and forfriskade."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Appelsin Sol",
-            "description": "Solrig appelsin slushice med vaniljesmag",
-            "image_url": "https://images.unsplash.com/photo-1600271886742-f049cd451bba?w=400&h=600&fit=crop",
-            "color": "orange",
-            "alcohol_flag": False,
-            "target_brix": 14.0,
-            "tags": ["sød", "frugtig", "sommer"],
-            "ingredients": [
-                {"name": "Appelsin sirup", "category_key": "sirup.citrus.appelsin", "quantity": 280, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 670, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Vanilje sirup", "category_key": "sirup.vanilje", "quantity": 50, "unit": "ml", "role": "optional", "brix": 60}
-            ],
-            "steps": ["Bland appelsin sirup, vand og vanilje", "Rør godt og fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Appelsin Sol",
-                        "description": "Solrig appelsin-slushice med let vaniljesmag. En frisk og sød sommerfavorit med rund fylde og frugtig karakter.",
-                        "steps": [
-                                    "Bland appelsin-sirup, vanilje-sirup og vand i en kande og rør grundigt.",
-                                    "Fyld blandingen i maskinen.",
-                                    "Rør til ønsket slush-konsistens (ca. –3 °C til –4 °C).",
-                                    "Server straks og pynt evt. med en skive appelsin."
-                        ]
-            },
-            "de": {
-                        "name": "Appelsin Sol",
-                        "description": "Solrig appelsin-slushice mit let vaniljesmag. Ein frisk und sød alsmerfavorit mit rund fylde und frugtig karakter.",
-                        "steps": [
-                                    "Mischein Sie appelsin-sirup, vanilje-sirup und vand in einein Krug und rør gründlich.",
-                                    "Füllein Sie die Mischung in die Maschine.",
-                                    "Rührein Sie bis ønsket slush-konsisteins (ca. –3 °C bis –4 °C).",
-                                    "Servierein Sie sofürt und pynt ggf. mit ein skive appelsin."
-                        ]
-            },
-            "fr": {
-                        "name": "Appelsin Sol",
-                        "description": "Solrig appelsin-slushice avec let vaniljesmag. Un frisk et sød commemerfavorit avec rund fylde et frugtig karakter.",
-                        "steps": [
-                                    "Mélangez appelsin-sirup, vanilje-sirup et vand dans un pichet et rør soigneusemunt.",
-                                    "Remplissez le mélange dans la machine.",
-                                    "Remuez jusqu'à ønsket slush-konsistuns (ca. –3 °C jusqu'à –4 °C).",
-                                    "Servez immédiatemunt et pynt évuntuellemunt avec un skive appelsin."
-                        ]
-            },
-            "en": {
-                        "name": "Appelsin Sol",
-                        "description": "Solrig appelsin-slushice with let vaniljesmag. A frisk and sød asmerfavorit with rund fylde and frugtig karakter.",
-                        "steps": [
-                                    "Mix appelsin-sirup, vanilje-sirup and vand in a pitcher and rør thoroughly.",
-                                    "Fill the mixture in the machine.",
-                                    "Stir until ønsket slush-konsistas (ca. –3 °C until –4 °C).",
-                                    "Serve imwithiately and pynt optionally with a skive appelsin."
-                        ]
-            },
-            "en_us": {
-                        "name": "Appelsin Sol",
-                        "description": "Solrig appelsin-slushice with let vaniljesmag. A frisk and sød asmerfavorit with rund fylde and frugtig karakter.",
-                        "steps": [
-                                    "Mix appelsin-sirup, vanilje-sirup and vand in a pitcher and rør thoroughly.",
-                                    "Fill the mixture in the machine.",
-                                    "Stir until ønsket slush-konsistas (ca. –3 °C until –4 °C).",
-                                    "Serve imwithiately and pynt optionally with a skive appelsin."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Hindbær Drøm",
-            "description": "Skøn hindbær slushice med lime",
-            "image_url": "https://images.unsplash.com/photo-1505252585461-04db1eb84625?w=400&h=600&fit=crop",
-            "color": "pink",
-            "alcohol_flag": False,
-            "target_brix": 14.0,
-            "tags": ["sød", "frisk", "sommerlig"],
-            "ingredients": [
-                {"name": "Hindbær sirup", "category_key": "sirup.baer.hindbaer", "quantity": 250, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 700, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Lime saft", "category_key": "citrus.lime", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland hindbær sirup med vand", "Tilføj lime for balance", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Hindbær Drøm",
-                        "description": "En frisk og let syrlig hindbær-slush med et strejf af lime.\nDen dybe røde farve og friske smag gør den perfekt til både sommerfester og caféservering.",
-                        "steps": [
-                                    "Hæld hindbær-sirup og vand i en kande, og rør grundigt.",
-                                    "Tilsæt lime-saft for at justere friskhed.",
-                                    "Fyld blandingen i maskinen, og kør ved ca. –3 °C, indtil den får klassisk slush-konsistens."
-                        ]
-            },
-            "de": {
-                        "name": "Hindbær Drøm",
-                        "description": "Ein frisk und let syrlig hindbær-slush mit et strejf af lime.\nDein dybe røde farve und friske smag gør dein perfekt bis både alsmerfester und caféservering.",
-                        "steps": [
-                                    "Gießein Sie hindbær-sirup und vand in einein Krug, und rør gründlich.",
-                                    "Fügein Sie hinzu lime-saft für at justere friskhed.",
-                                    "Füllein Sie die Mischung in die Maschine, und kør ved ca. –3 °C, indbis dein får klassisk slush-konsisteins."
-                        ]
-            },
-            "fr": {
-                        "name": "Hindbær Drøm",
-                        "description": "Un frisk et let syrlig hindbær-slush avec et strejf af lime.\nDun dybe røde farve et friske smag gør dun parfait jusqu'à både commemerfester et caféservering.",
-                        "steps": [
-                                    "Versez hindbær-sirup et vand dans un pichet, et rør soigneusemunt.",
-                                    "Ajoutez lime-saft pour at justere friskhed.",
-                                    "Remplissez le mélange dans la machine, et kør ved ca. –3 °C, indjusqu'à dun får klassisk slush-konsistuns."
-                        ]
-            },
-            "en": {
-                        "name": "Hindbær Drøm",
-                        "description": "A frisk and let syrlig hindbær-slush with et strejf af lime.\nDa dybe røde farve and friske smag gør da perfect until både asmerfester and caféservering.",
-                        "steps": [
-                                    "Pour hindbær-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Add lime-saft for at justere friskhed.",
-                                    "Fill the mixture in the machine, and kør ved ca. –3 °C, induntil da får klassisk slush-konsistas."
-                        ]
-            },
-            "en_us": {
-                        "name": "Hindbær Drøm",
-                        "description": "A frisk and let syrlig hindbær-slush with et strejf af lime.\nDa dybe røde farve and friske smag gør da perfect until både asmerfester and caféservering.",
-                        "steps": [
-                                    "Pour hindbær-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Add lime-saft for at justere friskhed.",
-                                    "Fill the mixture in the machine, and kør ved ca. –3 °C, induntil da får klassisk slush-konsistas."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Grøn Æble",
-            "description": "Frisk grøn æble slushice",
-            "image_url": "https://images.unsplash.com/photo-1568702846914-96b305d2aaeb?w=400&h=600&fit=crop",
-            "color": "green",
-            "alcohol_flag": False,
-            "target_brix": 14.0,
-            "tags": ["frisk", "sur", "æble"],
-            "ingredients": [
-                {"name": "Grøn æble sirup", "category_key": "sirup.aeble", "quantity": 270, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 680, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Citron saft", "category_key": "citrus.citron", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland grøn æble sirup og vand", "Tilføj citron for ekstra syre", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Grøn Æble",
-                        "description": "Frisk grøn æble-slushice med en sprød syrlighed og let sødme.\nPerfekt balanceret mellem frugtig friskhed og klassisk slush-konsistens.",
-                        "steps": [
-                                    "Hæld grøn æble-sirup og vand i en kande, og rør grundigt.",
-                                    "Tilsæt citronsaft for ekstra friskhed.",
-                                    "Hæld blandingen i maskinen og kør ved ca. –3 °C, til ønsket slush-konsistens opnås."
-                        ]
-            },
-            "de": {
-                        "name": "Grøn Æble",
-                        "description": "Frisk grøn æble-slushice mit ein sprød syrlighed und let sødme.\nPerfekt balanceret mellem frugtig friskhed und klassisk slush-konsisteins.",
-                        "steps": [
-                                    "Gießein Sie grøn æble-sirup und vand in einein Krug, und rør gründlich.",
-                                    "Fügein Sie hinzu citronsaft für ekstra friskhed.",
-                                    "Gießein Sie die Mischung in die Maschine und kør ved ca. –3 °C, bis ønsket slush-konsisteins opnås."
-                        ]
-            },
-            "fr": {
-                        "name": "Grøn Æble",
-                        "description": "Frisk grøn æble-slushice avec un sprød syrlighed et let sødme.\nPerfekt balanceret mellem frugtig friskhed et klassisk slush-konsistuns.",
-                        "steps": [
-                                    "Versez grøn æble-sirup et vand dans un pichet, et rør soigneusemunt.",
-                                    "Ajoutez citronsaft pour ekstra friskhed.",
-                                    "Versez le mélange dans la machine et kør ved ca. –3 °C, jusqu'à ønsket slush-konsistuns opnås."
-                        ]
-            },
-            "en": {
-                        "name": "Grøn Æble",
-                        "description": "Frisk grøn æble-slushice with a sprød syrlighed and let sødme.\nPerfekt balanceret mellem frugtig friskhed and klassisk slush-konsistas.",
-                        "steps": [
-                                    "Pour grøn æble-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Add citronsaft for ekstra friskhed.",
-                                    "Pour the mixture in the machine and kør ved ca. –3 °C, until ønsket slush-konsistas opnås."
-                        ]
-            },
-            "en_us": {
-                        "name": "Grøn Æble",
-                        "description": "Frisk grøn æble-slushice with a sprød syrlighed and let sødme.\nPerfekt balanceret mellem frugtig friskhed and klassisk slush-konsistas.",
-                        "steps": [
-                                    "Pour grøn æble-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Add citronsaft for ekstra friskhed.",
-                                    "Pour the mixture in the machine and kør ved ca. –3 °C, until ønsket slush-konsistas opnås."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Fersken Sommer",
-            "description": "Dejlig fersken slushice med ingefær",
-            "image_url": "https://images.unsplash.com/photo-1629828874514-d4b56b1d8e46?w=400&h=600&fit=crop",
-            "color": "orange",
-            "alcohol_flag": False,
-            "target_brix": 13.0,
-            "tags": ["fruity", "sommer", "sød"],
-            "ingredients": [
-                {"name": "Fersken sirup", "category_key": "sirup.fersken", "quantity": 260, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 690, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Ginger Ale", "category_key": "sodavand.ginger", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland fersken sirup og vand", "Tilføj Ginger Ale for krydderi", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Fersken Sommer",
-                        "description": "En frisk og sød sommer-slush med rund ferskensmag og et let strejf af ingefær fra Ginger Ale. Perfekt balanceret mellem sødme og friskhed, en sommerfavorit med et lille twist.",
-                        "steps": [
-                                    "Hæld fersken-sirup og vand i en kande, og rør grundigt.",
-                                    "Ginger Ale tilfører kulsyre og aromatisk balance uden at påvirke frysepunktet væsentligt.",
-                                    "Hæld blandingen i slushmaskinen, og kør ved ca. –3 °C.",
-                                    "Server straks – pynt eventuelt med frisk fersken eller en spiselig blomst."
-                        ]
-            },
-            "de": {
-                        "name": "Fersken Sommer",
-                        "description": "Ein frisk und sød alsmer-slush mit rund ferskeinsmag und et let strejf af ingefær fra Ginger Ale. Perfekt balanceret mellem sødme und friskhed, ein alsmerfavorit mit et lille twist.",
-                        "steps": [
-                                    "Gießein Sie ferskein-sirup und vand in einein Krug, und rør gründlich.",
-                                    "Ginger Ale bisfører kulsyre und aromatisk balance udein at aufvirke frysepunktet væseintligt.",
-                                    "Gießein Sie die Mischung in die Slushmaschine, und kør ved ca. –3 °C.",
-                                    "Servierein Sie sofürt – pynt eveintuelt mit frisk ferskein oder ein spiselig blomst."
-                        ]
-            },
-            "fr": {
-                        "name": "Fersken Sommer",
-                        "description": "Un frisk et sød commemer-slush avec rund ferskunsmag et et let strejf af ingefær fra Ginger Ale. Perfekt balanceret mellem sødme et friskhed, un commemerfavorit avec et lille twist.",
-                        "steps": [
-                                    "Versez ferskun-sirup et vand dans un pichet, et rør soigneusemunt.",
-                                    "Ginger Ale jusqu'àfører kulsyre et aromatisk balance udun at survirke frysepunktet væsuntligt.",
-                                    "Versez le mélange dans la machine à slush, et kør ved ca. –3 °C.",
-                                    "Servez immédiatemunt – pynt evuntuelt avec frisk ferskun ou un spiselig blomst."
-                        ]
-            },
-            "en": {
-                        "name": "Fersken Sommer",
-                        "description": "A frisk and sød asmer-slush with rund ferskasmag and et let strejf af ingefær fra Ginger Ale. Perfekt balanceret mellem sødme and friskhed, a asmerfavorit with et lille twist.",
-                        "steps": [
-                                    "Pour ferska-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Ginger Ale untilfører kulsyre and aromatisk balance uda at onvirke frysepunktet væsatligt.",
-                                    "Pour the mixture in the slush machine, and kør ved ca. –3 °C.",
-                                    "Serve imwithiately – pynt evatuelt with frisk ferska or a spiselig blomst."
-                        ]
-            },
-            "en_us": {
-                        "name": "Fersken Sommer",
-                        "description": "A frisk and sød asmer-slush with rund ferskasmag and et let strejf af ingefær fra Ginger Ale. Perfekt balanceret mellem sødme and friskhed, a asmerfavorit with et lille twist.",
-                        "steps": [
-                                    "Pour ferska-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Ginger Ale untilfører kulsyre and aromatisk balance uda at onvirke frysepunktet væsatligt.",
-                                    "Pour the mixture in the slush machine, and kør ved ca. –3 °C.",
-                                    "Serve imwithiately – pynt evatuelt with frisk ferska or a spiselig blomst."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Tropisk Paradise",
-            "description": "Eksotisk blanding af mango og passionsfrugt",
-            "image_url": "https://images.unsplash.com/photo-1546069901-ba9599a7e63c?w=400&h=600&fit=crop",
-            "color": "yellow",
-            "alcohol_flag": False,
-            "target_brix": 14.0,
-            "tags": ["tropisk", "eksotisk", "frugtig"],
-            "ingredients": [
-                {"name": "Mango sirup", "category_key": "sirup.mango", "quantity": 200, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Passionsfrugt sirup", "category_key": "sirup.passion", "quantity": 150, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 600, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Lime saft", "category_key": "citrus.lime", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland mango og passionsfrugt sirup", "Tilføj vand og lime", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Tropisk Paradise",
-                        "description": "En silkeblød, eksotisk slush med frisk mango og passionsfrugt – let syrlig, rund i smagen og med tropisk sødme, der giver ren feriestemning i hvert glas. Lime tilføjer en frisk kant, som fremhæver den frugtagtige balance.",
-                        "steps": [
-                                    "Bland mango- og passionsfrugtsirup i en kande.",
-                                    "Tilsæt vand og lime, og rør grundigt.",
-                                    "Fyld blandingen i maskinen og kør til ønsket slushkonsistens.",
-                                    "Server med frisk mango- eller passionsfrugt som pynt.",
-                                    "Teknisk note:\n\t•\tDenne opskrift giver en stabil fryseevne ved 14°Bx – ideel til både standard- og kompakte maskiner.\n\t•\tLime kan udelades, men anbefales for at balancere sødmen og give friskhed.\n\t•\tHvis du ønsker en tykkere struktur, kan 20–30 ml sirup tilføjes uden at påvirke frysepunktet væsentligt."
-                        ]
-            },
-            "de": {
-                        "name": "Tropisk Paradise",
-                        "description": "Ein silkeblød, eksotisk slush mit frisk mango und passionsfrugt – let syrlig, rund i smagein und mit tropisk sødme, der giver rein feriestemning i hvert glas. Lime bisføjer ein frisk kant, als fremhæver dein frugtagtige balance.",
-                        "steps": [
-                                    "Mischein Sie mango- und passionsfrugtsirup in einein Krug.",
-                                    "Fügein Sie hinzu vand und lime, und rør gründlich.",
-                                    "Füllein Sie die Mischung in die Maschine und kør bis ønsket slushkonsisteins.",
-                                    "Servierein Sie mit frisk mango- oder passionsfrugt als pynt.",
-                                    "Teknisk note:\n\t•\tDeinne Rezept giver ein stabil fryseevne ved 14°Bx – ideel bis både standard- und kompakte maskiner.\n\t•\tLime kan udelades, mein anbefales für at balancere sødmein und give friskhed.\n\t•\tHvis du ønsker ein tykkere struktur, kan 20–30 ml sirup bisføjes udein at aufvirke frysepunktet væseintligt."
-                        ]
-            },
-            "fr": {
-                        "name": "Tropisk Paradise",
-                        "description": "Un silkeblød, eksotisk slush avec frisk mango et passionsfrugt – let syrlig, rund i smagun et avec tropisk sødme, der giver run feriestemning i hvert glas. Lime jusqu'àføjer un frisk kant, comme fremhæver dun frugtagtige balance.",
-                        "steps": [
-                                    "Mélangez mango- et passionsfrugtsirup dans un pichet.",
-                                    "Ajoutez vand et lime, et rør soigneusemunt.",
-                                    "Remplissez le mélange dans la machine et kør jusqu'à ønsket slushkonsistuns.",
-                                    "Servez avec frisk mango- ou passionsfrugt comme pynt.",
-                                    "Teknisk note:\n\t•\tDunne recette giver un stabil fryseevne ved 14°Bx – ideel jusqu'à både standard- et kompakte maskiner.\n\t•\tLime kan udelades, mun anbefales pour at balancere sødmun et give friskhed.\n\t•\tHvis du ønsker un tykkere struktur, kan 20–30 ml sirup jusqu'àføjes udun at survirke frysepunktet væsuntligt."
-                        ]
-            },
-            "en": {
-                        "name": "Tropisk Paradise",
-                        "description": "A silkeblød, eksotisk slush with frisk mango and passionsfrugt – let syrlig, rund i smaga and with tropisk sødme, der giver ra feriestemning i hvert glas. Lime untilføjer a frisk kant, as fremhæver da frugtagtige balance.",
-                        "steps": [
-                                    "Mix mango- and passionsfrugtsirup in a pitcher.",
-                                    "Add vand and lime, and rør thoroughly.",
-                                    "Fill the mixture in the machine and kør until ønsket slushkonsistas.",
-                                    "Serve with frisk mango- or passionsfrugt as pynt.",
-                                    "Teknisk note:\n\t•\tDane recipe giver a stabil fryseevne ved 14°Bx – ideel until både standard- and kompakte maskiner.\n\t•\tLime kan udelades, ma anbefales for at balancere sødma and give friskhed.\n\t•\tHvis du ønsker a tykkere struktur, kan 20–30 ml sirup untilføjes uda at onvirke frysepunktet væsatligt."
-                        ]
-            },
-            "en_us": {
-                        "name": "Tropisk Paradise",
-                        "description": "A silkeblød, eksotisk slush with frisk mango and passionsfrugt – let syrlig, rund i smaga and with tropisk sødme, der giver ra feriestemning i hvert glas. Lime untilføjer a frisk kant, as fremhæver da frugtagtige balance.",
-                        "steps": [
-                                    "Mix mango- and passionsfrugtsirup in a pitcher.",
-                                    "Add vand and lime, and rør thoroughly.",
-                                    "Fill the mixture in the machine and kør until ønsket slushkonsistas.",
-                                    "Serve with frisk mango- or passionsfrugt as pynt.",
-                                    "Teknisk note:\n\t•\tDane recipe giver a stabil fryseevne ved 14°Bx – ideel until både standard- and kompakte maskiner.\n\t•\tLime kan udelades, ma anbefales for at balancere sødma and give friskhed.\n\t•\tHvis du ønsker a tykkere struktur, kan 20–30 ml sirup untilføjes uda at onvirke frysepunktet væsatligt."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Kirsebær Luksus",
-            "description": "Lækker kirsebær slushice med mandel",
-            "image_url": "https://images.unsplash.com/photo-1528821128474-27f963b062bf?w=400&h=600&fit=crop",
-            "color": "red",
-            "alcohol_flag": False,
-            "target_brix": 15.0,
-            "tags": ["sød", "luksus", "kirsebær"],
-            "ingredients": [
-                {"name": "Kirsebær sirup", "category_key": "sirup.kirsebaer", "quantity": 280, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 670, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Mandel sirup", "category_key": "sirup.mandel", "quantity": 50, "unit": "ml", "role": "optional", "brix": 60}
-            ],
-            "steps": ["Bland kirsebær sirup og vand", "Tilføj mandel sirup", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Kirsebær Luksus",
-                        "description": "Elegant kirsebærslushice med et strejf af mandel – en smag der minder om klassisk kirsebærtrøffel, men frisk og afkølende.\nPerfekt som luksusvariant til dessert eller som et sofistikeret alternativ til almindelig frugtslush.",
-                        "steps": [
-                                    "Hæld kirsebær-sirup og vand i en kande, og rør grundigt.",
-                                    "Tilsæt mandel-sirup for rund og luksuriøs smag.",
-                                    "Hæld blandingen i maskinen og kør ved ca. –3 °C, indtil du får en jævn og cremet slush-konsistens.",
-                                    "Teknisk note:\n\t•\tAl væske fryses i maskinen – ingen knust is skal tilsættes.\n\t•\tKombinationen af kirsebær og mandel giver en fyldig, aromatisk slush med stabil fryseevne.\n\t•\tSukkerbalancen på ca. 15 °Bx sikrer cremet tekstur uden at belaste sneglen."
-                        ]
-            },
-            "de": {
-                        "name": "Kirsebær Luksus",
-                        "description": "Elegant kirsebærslushice mit et strejf af mandel – ein smag der minder om klassisk kirsebærtrøffel, mein frisk und afkøleinde.\nPerfekt als luksusvariant bis dessert oder als et sofistikeret alternativ bis almindelig frugtslush.",
-                        "steps": [
-                                    "Gießein Sie kirsebær-sirup und vand in einein Krug, und rør gründlich.",
-                                    "Fügein Sie hinzu mandel-sirup für rund und luksuriøs smag.",
-                                    "Gießein Sie die Mischung in die Maschine und kør ved ca. –3 °C, indbis du får ein glatt und cremig slush-konsisteins.",
-                                    "Teknisk note:\n\t•\tAl væske fryses in die Maschine – ingein knust is skal bissættes.\n\t•\tGebein Siebinationein af kirsebær und mandel giver ein fyldig, aromatisk slush mit stabil fryseevne.\n\t•\tSukkerbalancein auf ca. 15 °Bx sikrer cremig tekstur udein at belaste sneglein."
-                        ]
-            },
-            "fr": {
-                        "name": "Kirsebær Luksus",
-                        "description": "Elegant kirsebærslushice avec et strejf af mandel – un smag der minder om klassisk kirsebærtrøffel, mun frisk et afkølunde.\nPerfekt comme luksusvariant jusqu'à dessert ou comme et sofistikeret alternativ jusqu'à almindelig frugtslush.",
-                        "steps": [
-                                    "Versez kirsebær-sirup et vand dans un pichet, et rør soigneusemunt.",
-                                    "Ajoutez mandel-sirup pour rund et luksuriøs smag.",
-                                    "Versez le mélange dans la machine et kør ved ca. –3 °C, indjusqu'à du får un lisse et crémeux slush-konsistuns.",
-                                    "Teknisk note:\n\t•\tAl væske fryses dans la machine – ingun knust is skal jusqu'àsættes.\n\t•\tMettezbinationun af kirsebær et mandel giver un fyldig, aromatisk slush avec stabil fryseevne.\n\t•\tSukkerbalancun sur ca. 15 °Bx sikrer crémeux tekstur udun at belaste sneglun."
-                        ]
-            },
-            "en": {
-                        "name": "Kirsebær Luksus",
-                        "description": "Elegant kirsebærslushice with et strejf af mandel – a smag der minder om klassisk kirsebærtrøffel, ma frisk and afkølade.\nPerfekt as luksusvariant until dessert or as et sofistikeret alternativ until almindelig frugtslush.",
-                        "steps": [
-                                    "Pour kirsebær-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Add mandel-sirup for rund and luksuriøs smag.",
-                                    "Pour the mixture in the machine and kør ved ca. –3 °C, induntil du får a smooth and creamy slush-konsistas.",
-                                    "Teknisk note:\n\t•\tAl væske fryses in the machine – inga knust is skal untilsættes.\n\t•\tPutbinationa af kirsebær and mandel giver a fyldig, aromatisk slush with stabil fryseevne.\n\t•\tSukkerbalanca on ca. 15 °Bx sikrer creamy tekstur uda at belaste snegla."
-                        ]
-            },
-            "en_us": {
-                        "name": "Kirsebær Luksus",
-                        "description": "Elegant kirsebærslushice with et strejf af mandel – a smag der minder om klassisk kirsebærtrøffel, ma frisk and afkølade.\nPerfekt as luksusvariant until dessert or as et sofistikeret alternativ until almindelig frugtslush.",
-                        "steps": [
-                                    "Pour kirsebær-sirup and vand in a pitcher, and rør thoroughly.",
-                                    "Add mandel-sirup for rund and luksuriøs smag.",
-                                    "Pour the mixture in the machine and kør ved ca. –3 °C, induntil du får a smooth and creamy slush-konsistas.",
-                                    "Teknisk note:\n\t•\tAl væske fryses in the machine – inga knust is skal untilsættes.\n\t•\tPutbinationa af kirsebær and mandel giver a fyldig, aromatisk slush with stabil fryseevne.\n\t•\tSukkerbalanca on ca. 15 °Bx sikrer creamy tekstur uda at belaste snegla."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Vandmelon Splash",
-            "description": "Forfriskende vandmelon slushice med mynte",
-            "image_url": "https://images.unsplash.com/photo-1587049352846-4a222e784099?w=400&h=600&fit=crop",
-            "color": "pink",
-            "alcohol_flag": False,
-            "target_brix": 13.0,
-            "tags": ["frisk", "sommer", "let"],
-            "ingredients": [
-                {"name": "Vandmelon sirup", "category_key": "sirup.vandmelon", "quantity": 300, "unit": "ml", "role": "required", "brix": 60},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 650, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Mynte sirup", "category_key": "sirup.mynte", "quantity": 50, "unit": "ml", "role": "optional", "brix": 60}
-            ],
-            "steps": ["Bland vandmelon sirup med vand", "Tilføj mynte for friskhed", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Vandmelon Splash",
-                        "description": "En let og forfriskende sommerklassiker med den naturlige sødme fra vandmelon og et strejf af mynte, der giver en frisk og kølig afslutning. Perfekt til varme dage, hvor du ønsker noget frugtrigt, men ikke for tungt.",
-                        "steps": [
-                                    "Bland vandmelon- og eventuelt myntesirup i en kande.",
-                                    "Tilsæt vand og rør grundigt, indtil blandingen er ensartet.",
-                                    "Fyld i maskinen og kør til ønsket slushkonsistens.",
-                                    "Server med friske mynteblade og et par melontern for friskhed og farve.",
-                                    "Teknisk note:\n\t•\t13°Bx giver en blød og letflydende slush, som passer perfekt til vandmelonens karakter.\n\t•\tTilsætning af 50 ml myntesirup øger friskheden og giver en let urtebalance uden at påvirke fryseevnen.\n\t•\tFor en mere sød version kan du øge siruppen med +30 ml og reducere vand tilsvarende."
-                        ]
-            },
-            "de": {
-                        "name": "Vandmelon Splash",
-                        "description": "Ein let und fürfriskeinde alsmerklassiker mit dein naturlige sødme fra vandmelon und et strejf af mynte, der giver ein frisk und kølig afslutning. Perfekt bis varme dage, hvor du ønsker nundet frugtrigt, mein ikke für tungt.",
-                        "steps": [
-                                    "Mischein Sie vandmelon- und eveintuelt myntesirup in einein Krug.",
-                                    "Fügein Sie hinzu vand und rør gründlich, indbis die Mischung er gleichmäßig.",
-                                    "Füllein Sie in die Maschine und kør bis ønsket slushkonsisteins.",
-                                    "Servierein Sie mit friske mynteblade und et par melontern für friskhed und farve.",
-                                    "Teknisk note:\n\t•\t13°Bx giver ein blød und letflydeinde slush, als passer perfekt bis vandmeloneins karakter.\n\t•\tFügein Sie hinzuning af 50 ml myntesirup øger friskhedein und giver ein let urtebalance udein at aufvirke fryseevnein.\n\t•\tFor ein mere sød version kan du øge siruppein mit +30 ml und reducere vand bissvareinde."
-                        ]
-            },
-            "fr": {
-                        "name": "Vandmelon Splash",
-                        "description": "Un let et pourfriskunde commemerklassiker avec dun naturlige sødme fra vandmelon et et strejf af mynte, der giver un frisk et kølig afslutning. Perfekt jusqu'à varme dage, hvor du ønsker netet frugtrigt, mun ikke pour tungt.",
-                        "steps": [
-                                    "Mélangez vandmelon- et evuntuelt myntesirup dans un pichet.",
-                                    "Ajoutez vand et rør soigneusemunt, indjusqu'à le mélange er unipourme.",
-                                    "Remplissez dans la machine et kør jusqu'à ønsket slushkonsistuns.",
-                                    "Servez avec friske mynteblade et et par melontern pour friskhed et farve.",
-                                    "Teknisk note:\n\t•\t13°Bx giver un blød et letflydunde slush, comme passer parfait jusqu'à vandmelonuns karakter.\n\t•\tAjoutezning af 50 ml myntesirup øger friskhedun et giver un let urtebalance udun at survirke fryseevnun.\n\t•\tFor un mere sød version kan du øge siruppun avec +30 ml et reducere vand jusqu'àsvarunde."
-                        ]
-            },
-            "en": {
-                        "name": "Vandmelon Splash",
-                        "description": "A let and forfriskade asmerklassiker with da naturlige sødme fra vandmelon and et strejf af mynte, der giver a frisk and kølig afslutning. Perfekt until varme dage, hvor du ønsker nandet frugtrigt, ma ikke for tungt.",
-                        "steps": [
-                                    "Mix vandmelon- and evatuelt myntesirup in a pitcher.",
-                                    "Add vand and rør thoroughly, induntil the mixture er uniform.",
-                                    "Fill in the machine and kør until ønsket slushkonsistas.",
-                                    "Serve with friske mynteblade and et par melontern for friskhed and farve.",
-                                    "Teknisk note:\n\t•\t13°Bx giver a blød and letflydade slush, as passer perfect until vandmelonas karakter.\n\t•\tAddning af 50 ml myntesirup øger friskheda and giver a let urtebalance uda at onvirke fryseevna.\n\t•\tFor a mere sød version kan du øge siruppa with +30 ml and reducere vand untilsvarade."
-                        ]
-            },
-            "en_us": {
-                        "name": "Vandmelon Splash",
-                        "description": "A let and forfriskade asmerklassiker with da naturlige sødme fra vandmelon and et strejf af mynte, der giver a frisk and kølig afslutning. Perfekt until varme dage, hvor du ønsker nandet frugtrigt, ma ikke for tungt.",
-                        "steps": [
-                                    "Mix vandmelon- and evatuelt myntesirup in a pitcher.",
-                                    "Add vand and rør thoroughly, induntil the mixture er uniform.",
-                                    "Fill in the machine and kør until ønsket slushkonsistas.",
-                                    "Serve with friske mynteblade and et par melontern for friskhed and farve.",
-                                    "Teknisk note:\n\t•\t13°Bx giver a blød and letflydade slush, as passer perfect until vandmelonas karakter.\n\t•\tAddning af 50 ml myntesirup øger friskheda and giver a let urtebalance uda at onvirke fryseevna.\n\t•\tFor a mere sød version kan du øge siruppa with +30 ml and reducere vand untilsvarade."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Ananas Tropical",
-            "description": "Sød ananas slushice med kokos",
-            "image_url": "https://images.unsplash.com/photo-1550258987-190a2d41a8ba?w=400&h=600&fit=crop",
-            "color": "yellow",
-            "alcohol_flag": False,
-            "target_brix": 14.0,
-            "tags": ["tropisk", "sød", "ananas"],
-            "ingredients": [
-                {"name": "Ananas sirup", "category_key": "sirup.ananas", "quantity": 270, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 680, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Kokos sirup", "category_key": "sirup.kokos", "quantity": 50, "unit": "ml", "role": "optional", "brix": 65}
-            ],
-            "steps": ["Bland ananas sirup og vand", "Tilføj kokos", "Fyld i maskinen"]
-        },
-        {
-            "name": "Blåbær Vild",
-            "description": "Intens blåbær slushice",
-            "image_url": "https://images.unsplash.com/photo-1498557850523-fd3d118b962e?w=400&h=600&fit=crop",
-            "color": "purple",
-            "alcohol_flag": False,
-            "target_brix": 14.0,
-            "tags": ["bær", "intens", "sød"],
-            "ingredients": [
-                {"name": "Blåbær sirup", "category_key": "sirup.baer.blabaer", "quantity": 250, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 700, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Citron saft", "category_key": "citrus.citron", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland blåbær sirup og vand", "Tilføj citron", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Blåbær Vild",
-                        "description": "Intens blåbær-slushice med frisk citrus og en afrundet sødme. Den dybblå farve og fyldige smag gør den til en klar favorit blandt frugtslushies.",
-                        "steps": [
-                                    "Bland blå curaçao-sirup, kokos-sirup, vand og evt. citronsaft i en kande, og rør grundigt.",
-                                    "Hæld blandingen direkte i slushmaskinen.",
-                                    "Kør til ønsket konsistens (ca. –3 °C til –5 °C afhængig af maskine).",
-                                    "Server straks – en intens og frisk blåbær-oplevelse med tropisk sødme."
-                        ]
-            },
-            "de": {
-                        "name": "Blåbær Vild",
-                        "description": "Inteins blåbær-slushice mit frisk citrus und ein afrundet sødme. Dein dybblå farve und fyldige smag gør dein bis ein klar favorit blandt frugtslushies.",
-                        "steps": [
-                                    "Mischein Sie blå curaçao-sirup, kokos-sirup, vand und ggf. citronsaft in einein Krug, und rør gründlich.",
-                                    "Gießein Sie die Mischung direkte in die Slushmaschine.",
-                                    "Lassein Sie laufein bis gewünschte Konsisteinz (ca. –3 °C bis –5 °C afhængig af maskine).",
-                                    "Servierein Sie sofürt – ein inteins und frisk blåbær-oplevelse mit tropisk sødme."
-                        ]
-            },
-            "fr": {
-                        "name": "Blåbær Vild",
-                        "description": "Intuns blåbær-slushice avec frisk citrus et un afrundet sødme. Dun dybblå farve et fyldige smag gør dun jusqu'à un klar favorit blandt frugtslushies.",
-                        "steps": [
-                                    "Mélangez blå curaçao-sirup, kokos-sirup, vand et évuntuellemunt citronsaft dans un pichet, et rør soigneusemunt.",
-                                    "Versez le mélange direkte dans la machine à slush.",
-                                    "Faites tourner jusqu'à consistance souhaitée (ca. –3 °C jusqu'à –5 °C afhængig af maskine).",
-                                    "Servez immédiatemunt – un intuns et frisk blåbær-oplevelse avec tropisk sødme."
-                        ]
-            },
-            "en": {
-                        "name": "Blåbær Vild",
-                        "description": "Intas blåbær-slushice with frisk citrus and a afrundet sødme. Da dybblå farve and fyldige smag gør da until a klar favorit blandt frugtslushies.",
-                        "steps": [
-                                    "Mix blå curaçao-sirup, kokos-sirup, vand and optionally citronsaft in a pitcher, and rør thoroughly.",
-                                    "Pour the mixture direkte in the slush machine.",
-                                    "Run until desired consistacy (ca. –3 °C until –5 °C afhængig af maskine).",
-                                    "Serve imwithiately – a intas and frisk blåbær-oplevelse with tropisk sødme."
-                        ]
-            },
-            "en_us": {
-                        "name": "Blåbær Vild",
-                        "description": "Intas blåbær-slushice with frisk citrus and a afrundet sødme. Da dybblå farve and fyldige smag gør da until a klar favorit blandt frugtslushies.",
-                        "steps": [
-                                    "Mix blå curaçao-sirup, kokos-sirup, vand and optionally citronsaft in a pitcher, and rør thoroughly.",
-                                    "Pour the mixture direkte in the slush machine.",
-                                    "Run until desired consistacy (ca. –3 °C until –5 °C afhængig af maskine).",
-                                    "Serve imwithiately – a intas and frisk blåbær-oplevelse with tropisk sødme."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Solbær Intense",
-            "description": "Kraftig solbær slushice med ingefær",
-            "image_url": "https://images.unsplash.com/photo-1464454709131-ffd692591ee5?w=400&h=600&fit=crop",
-            "color": "purple",
-            "alcohol_flag": False,
-            "target_brix": 15.0,
-            "tags": ["intens", "bær", "kraftig"],
-            "ingredients": [
-                {"name": "Solbær sirup", "category_key": "sirup.baer.solbaer", "quantity": 280, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 670, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Ingefær sirup", "category_key": "sirup.ingefaer", "quantity": 50, "unit": "ml", "role": "optional", "brix": 60}
-            ],
-            "steps": ["Bland solbær sirup og vand", "Tilføj ingefær", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Solbær Intense",
-                        "description": "Kraftfuld solbærslushice med et strejf af ingefær, der giver en intens og let krydret eftersmag. Den dybe bærsmag balanceres med friskhed og let varme fra ingefæren – perfekt til dem, der elsker en markant og elegant smagsprofil.",
-                        "steps": [
-                                    "Bland solbærsirup og vand i en kande.",
-                                    "Tilsæt ingefær sirup for et krydret twist og rør grundigt.",
-                                    "Hæld blandingen i slushmaskinen og kør til ønsket konsistens.",
-                                    "Server straks – pynt evt. med friske solbær og et mynteblad.",
-                                    "Teknisk note:\nDenne opskrift er rig på naturlig syre fra solbær, som hjælper med at bevare en frisk og stabil fryseprofil.\nFor en mildere version kan sirupsmængden reduceres med 10 %, mens en kraftigere “intense” variant opnås ved at øge ingefærsiruppen."
-                        ]
-            },
-            "de": {
-                        "name": "Solbær Intense",
-                        "description": "Kraftfuld solbærslushice mit et strejf af ingefær, der giver ein inteins und let krydret eftersmag. Dein dybe bærsmag balanceres mit friskhed und let varme fra ingefærein – perfekt bis dem, der elsker ein markant und elegant smagsprofil.",
-                        "steps": [
-                                    "Mischein Sie solbærsirup und vand in einein Krug.",
-                                    "Fügein Sie hinzu ingefær sirup für et krydret twist und rør gründlich.",
-                                    "Gießein Sie die Mischung in die Slushmaschine und kør bis gewünschte Konsisteinz.",
-                                    "Servierein Sie sofürt – pynt ggf. mit friske solbær und et mynteblad.",
-                                    "Teknisk note:\nDeinne Rezept er rig auf naturlig syre fra solbær, als hjælper mit at bevare ein frisk und stabil fryseprofil.\nFor ein mildere version kan sirupsmængdein reduceres mit 10 %, meins ein kraftigere “inteinse” variant opnås ved at øge ingefærsiruppein."
-                        ]
-            },
-            "fr": {
-                        "name": "Solbær Intense",
-                        "description": "Kraftfuld solbærslushice avec et strejf af ingefær, der giver un intuns et let krydret eftersmag. Dun dybe bærsmag balanceres avec friskhed et let varme fra ingefærun – parfait jusqu'à dem, der elsker un markant et elegant smagsprofil.",
-                        "steps": [
-                                    "Mélangez solbærsirup et vand dans un pichet.",
-                                    "Ajoutez ingefær sirup pour et krydret twist et rør soigneusemunt.",
-                                    "Versez le mélange dans la machine à slush et kør jusqu'à consistance souhaitée.",
-                                    "Servez immédiatemunt – pynt évuntuellemunt avec friske solbær et et mynteblad.",
-                                    "Teknisk note:\nDunne recette er rig sur naturlig syre fra solbær, comme hjælper avec at bevare un frisk et stabil fryseprofil.\nFor un mildere version kan sirupsmængdun reduceres avec 10 %, muns un kraftigere “intunse” variant opnås ved at øge ingefærsiruppun."
-                        ]
-            },
-            "en": {
-                        "name": "Solbær Intense",
-                        "description": "Kraftfuld solbærslushice with et strejf af ingefær, der giver a intas and let krydret eftersmag. Da dybe bærsmag balanceres with friskhed and let varme fra ingefæra – perfect until dem, der elsker a markant and elegant smagsprofil.",
-                        "steps": [
-                                    "Mix solbærsirup and vand in a pitcher.",
-                                    "Add ingefær sirup for et krydret twist and rør thoroughly.",
-                                    "Pour the mixture in the slush machine and kør until desired consistacy.",
-                                    "Serve imwithiately – pynt optionally with friske solbær and et mynteblad.",
-                                    "Teknisk note:\nDane recipe er rig on naturlig syre fra solbær, as hjælper with at bevare a frisk and stabil fryseprofil.\nFor a mildere version kan sirupsmængda reduceres with 10 %, mas a kraftigere “intase” variant opnås ved at øge ingefærsiruppa."
-                        ]
-            },
-            "en_us": {
-                        "name": "Solbær Intense",
-                        "description": "Kraftfuld solbærslushice with et strejf af ingefær, der giver a intas and let krydret eftersmag. Da dybe bærsmag balanceres with friskhed and let varme fra ingefæra – perfect until dem, der elsker a markant and elegant smagsprofil.",
-                        "steps": [
-                                    "Mix solbærsirup and vand in a pitcher.",
-                                    "Add ingefær sirup for et krydret twist and rør thoroughly.",
-                                    "Pour the mixture in the slush machine and kør until desired consistacy.",
-                                    "Serve imwithiately – pynt optionally with friske solbær and et mynteblad.",
-                                    "Teknisk note:\nDane recipe er rig on naturlig syre fra solbær, as hjælper with at bevare a frisk and stabil fryseprofil.\nFor a mildere version kan sirupsmængda reduceres with 10 %, mas a kraftigere “intase” variant opnås ved at øge ingefærsiruppa."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Lime Cool",
-            "description": "Super frisk lime slushice med mynte",
-            "image_url": "https://images.unsplash.com/photo-1598256989800-fe5f95da9787?w=400&h=600&fit=crop",
-            "color": "green",
-            "alcohol_flag": False,
-            "target_brix": 15.0,
-            "tags": ["frisk", "sur", "mynte"],
-            "ingredients": [
-                {"name": "Lime sirup", "category_key": "sirup.citrus.lime", "quantity": 300, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 650, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Mynte sirup", "category_key": "sirup.mynte", "quantity": 50, "unit": "ml", "role": "optional", "brix": 60}
-            ],
-            "steps": ["Bland lime sirup og vand", "Tilføj mynte", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Lime Cool",
-                        "description": "En super frisk lime-slush med et strejf af mynte.\nDen syrlige lime og den kølige mynte giver en sprød, forfriskende smag, der passer perfekt til varme dage eller som en opkvikkende pause i hverdagen.",
-                        "steps": [
-                                    "Hæld sirupper og vand i en kande, og rør grundigt.",
-                                    "Justér evt. sødmen med lidt ekstra vand, hvis smagen ønskes mere frisk.",
-                                    "Hæld i maskinen og kør ved ca. –3 °C, til konsistensen er jævn."
-                        ]
-            },
-            "de": {
-                        "name": "Lime Cool",
-                        "description": "Ein super frisk lime-slush mit et strejf af mynte.\nDein syrlige lime und dein kølige mynte giver ein sprød, fürfriskeinde smag, der passer perfekt bis varme dage oder als ein opkvikkeinde pause i hverdagein.",
-                        "steps": [
-                                    "Gießein Sie sirupper und vand in einein Krug, und rør gründlich.",
-                                    "Justér ggf. sødmein mit lidt ekstra vand, hvis smagein ønskes mere frisk.",
-                                    "Gießein Sie in die Maschine und kør ved ca. –3 °C, bis konsisteinsein er glatt."
-                        ]
-            },
-            "fr": {
-                        "name": "Lime Cool",
-                        "description": "Un super frisk lime-slush avec et strejf af mynte.\nDun syrlige lime et dun kølige mynte giver un sprød, pourfriskunde smag, der passer parfait jusqu'à varme dage ou comme un opkvikkunde pause i hverdagun.",
-                        "steps": [
-                                    "Versez sirupper et vand dans un pichet, et rør soigneusemunt.",
-                                    "Justér évuntuellemunt sødmun avec lidt ekstra vand, hvis smagun ønskes mere frisk.",
-                                    "Versez dans la machine et kør ved ca. –3 °C, jusqu'à konsistunsun er lisse."
-                        ]
-            },
-            "en": {
-                        "name": "Lime Cool",
-                        "description": "A super frisk lime-slush with et strejf af mynte.\nDa syrlige lime and da kølige mynte giver a sprød, forfriskade smag, der passer perfect until varme dage or as a opkvikkade pause i hverdaga.",
-                        "steps": [
-                                    "Pour sirupper and vand in a pitcher, and rør thoroughly.",
-                                    "Justér optionally sødma with lidt ekstra vand, hvis smaga ønskes mere frisk.",
-                                    "Pour in the machine and kør ved ca. –3 °C, until konsistasa er smooth."
-                        ]
-            },
-            "en_us": {
-                        "name": "Lime Cool",
-                        "description": "A super frisk lime-slush with et strejf af mynte.\nDa syrlige lime and da kølige mynte giver a sprød, forfriskade smag, der passer perfect until varme dage or as a opkvikkade pause i hverdaga.",
-                        "steps": [
-                                    "Pour sirupper and vand in a pitcher, and rør thoroughly.",
-                                    "Justér optionally sødma with lidt ekstra vand, hvis smaga ønskes mere frisk.",
-                                    "Pour in the machine and kør ved ca. –3 °C, until konsistasa er smooth."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Mojito Slush (18+)",
-            "description": "Klassisk mojito som frozen slushice",
-            "image_url": "https://images.unsplash.com/photo-1551538827-9c037cb4f32a?w=400&h=600&fit=crop",
-            "color": "green",
-            "alcohol_flag": True,
-            "target_brix": 12.0,
-            "tags": ["alkohol", "mojito", "mynte", "voksen"],
-            "ingredients": [
-                {"name": "Lime sirup", "category_key": "sirup.citrus.lime", "quantity": 200, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Hvid rom", "category_key": "alkohol.rom", "quantity": 100, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 650, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Mynte sirup", "category_key": "sirup.mynte", "quantity": 50, "unit": "ml", "role": "required", "brix": 60}
-            ],
-            "steps": ["Bland lime sirup, rom og vand", "Tilføj mynte sirup", "Fyld i maskinen - bemærk lavere frysepunkt pga. alkohol"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Mojito Slush (18+)",
-                        "description": "En frisk og sprød frozen version af den klassiske Mojito. Kombinationen af sød lime, kølig mynte og hvid rom giver en balanceret og forfriskende oplevelse med et eksotisk pust af Caribien. Perfekt til sommeraftener, hvor man ønsker sig et glas, der både køler og løfter stemningen.",
-                        "steps": [
-                                    "Bland lime sirup og vand grundigt.",
-                                    "Hæld blandingen i maskinen og kør, indtil den får en fast slush-konsistens.",
-                                    "Tilsæt derefter rom og mynte sirup – rør let rundt.",
-                                    "Server med frisk mynte og en skive lime.",
-                                    "Alkohol tilsættes altid til sidst, når slushen er færdig, for at bevare fryseevnen og sikre en stabil konsistens."
-                        ]
-            },
-            "de": {
-                        "name": "Mojito Slush (18+)",
-                        "description": "Ein frisk und sprød frozein version af dein klassiske Mojito. Gebein Siebinationein af sød lime, kølig mynte und hvid rom giver ein balanceret und fürfriskeinde oplevelse mit et eksotisk pust af Caribiein. Perfekt bis alsmerafteiner, hvor man ønsker sig et glas, der både køler und løfter stemningein.",
-                        "steps": [
-                                    "Mischein Sie lime sirup und vand gründlich.",
-                                    "Gießein Sie die Mischung in die Maschine und kør, indbis dein får ein fast slush-konsisteins.",
-                                    "Fügein Sie hinzu derefter rom und mynte sirup – rør let rundt.",
-                                    "Servierein Sie mit frisk mynte und ein skive lime.",
-                                    "Alkohol bissættes altid bis sidst, når slushein er færdig, für at bevare fryseevnein und sikre ein stabil konsisteins."
-                        ]
-            },
-            "fr": {
-                        "name": "Mojito Slush (18+)",
-                        "description": "Un frisk et sprød frozun version af dun klassiske Mojito. Mettezbinationun af sød lime, kølig mynte et hvid rom giver un balanceret et pourfriskunde oplevelse avec et eksotisk pust af Caribiun. Perfekt jusqu'à commemeraftuner, hvor man ønsker sig et glas, der både køler et løfter stemningun.",
-                        "steps": [
-                                    "Mélangez lime sirup et vand soigneusemunt.",
-                                    "Versez le mélange dans la machine et kør, indjusqu'à dun får un fast slush-konsistuns.",
-                                    "Ajoutez derefter rom et mynte sirup – rør let rundt.",
-                                    "Servez avec frisk mynte et un skive lime.",
-                                    "Alkohol jusqu'àsættes altid jusqu'à sidst, når slushun er færdig, pour at bevare fryseevnun et sikre un stabil konsistuns."
-                        ]
-            },
-            "en": {
-                        "name": "Mojito Slush (18+)",
-                        "description": "A frisk and sprød froza version af da klassiske Mojito. Putbinationa af sød lime, kølig mynte and hvid rom giver a balanceret and forfriskade oplevelse with et eksotisk pust af Caribia. Perfekt until asmeraftaer, hvor man ønsker sig et glas, der både køler and løfter stemninga.",
-                        "steps": [
-                                    "Mix lime sirup and vand thoroughly.",
-                                    "Pour the mixture in the machine and kør, induntil da får a fast slush-konsistas.",
-                                    "Add derefter rom and mynte sirup – rør let rundt.",
-                                    "Serve with frisk mynte and a skive lime.",
-                                    "Alkohol untilsættes altid until sidst, når slusha er færdig, for at bevare fryseevna and sikre a stabil konsistas."
-                        ]
-            },
-            "en_us": {
-                        "name": "Mojito Slush (18+)",
-                        "description": "A frisk and sprød froza version af da klassiske Mojito. Putbinationa af sød lime, kølig mynte and hvid rom giver a balanceret and forfriskade oplevelse with et eksotisk pust af Caribia. Perfekt until asmeraftaer, hvor man ønsker sig et glas, der både køler and løfter stemninga.",
-                        "steps": [
-                                    "Mix lime sirup and vand thoroughly.",
-                                    "Pour the mixture in the machine and kør, induntil da får a fast slush-konsistas.",
-                                    "Add derefter rom and mynte sirup – rør let rundt.",
-                                    "Serve with frisk mynte and a skive lime.",
-                                    "Alkohol untilsættes altid until sidst, når slusha er færdig, for at bevare fryseevna and sikre a stabil konsistas."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Margarita Ice (18+)",
-            "description": "Frozen margarita slushice",
-            "image_url": "https://images.unsplash.com/photo-1618890111938-16d077babb67?w=400&h=600&fit=crop",
-            "color": "yellow",
-            "alcohol_flag": True,
-            "target_brix": 12.0,
-            "tags": ["alkohol", "margarita", "mexicansk", "voksen"],
-            "ingredients": [
-                {"name": "Lime sirup", "category_key": "sirup.citrus.lime", "quantity": 200, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Tequila", "category_key": "alkohol.tequila", "quantity": 100, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 650, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Triple sec", "category_key": "alkohol.triplesec", "quantity": 50, "unit": "ml", "role": "optional", "brix": 30}
-            ],
-            "steps": ["Bland lime sirup, tequila og vand", "Tilføj triple sec", "Server med salt på kanten"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Margarita Ice (18+)",
-                        "description": "En frisk og sprød frossen Margarita, skabt til varme aftener og solglimt ved baren. Den bløde sødme fra limesirup møder den skarpe tequila og et strejf af appelsin fra Triple Sec. Resultatet er en iskold, balanceret cocktail, der smager af ferie og havbris – klassisk, men med slush-twist.\nAlkoholprocent (beregnet): ca. 5,6 % vol.",
-                        "steps": [
-                                    "Bland lime sirup og vand grundigt i en kande.",
-                                    "Hæld blandingen i maskinen og kør til den får slush-konsistens.",
-                                    "Tilsæt tequila og Triple Sec til sidst, når blandingen er frosset.",
-                                    "Server straks i et afkølet glas med saltet kant og frisk lime.",
-                                    "Alkohol tilsættes altid til sidst, når slushen er færdig, for at bevare den rette fryseevne og sikre en stabil konsistens."
-                        ]
-            },
-            "de": {
-                        "name": "Margarita Ice (18+)",
-                        "description": "Ein frisk und sprød frossein Margarita, skabt bis varme afteiner und solglimt ved barein. Dein bløde sødme fra limesirup møder dein skarpe tequila und et strejf af appelsin fra Triple Sec. Resultatet er ein iskold, balanceret cocktail, der smager af ferie und havbris – klassisk, mein mit slush-twist.\nAlkoholproceint (beregnet): ca. 5,6 % vol.",
-                        "steps": [
-                                    "Mischein Sie lime sirup und vand gründlich in einein Krug.",
-                                    "Gießein Sie die Mischung in die Maschine und kør bis dein får slush-konsisteins.",
-                                    "Fügein Sie hinzu tequila und Triple Sec bis sidst, når die Mischung er frosset.",
-                                    "Servierein Sie sofürt i et afkølet glas mit saltet kant und frisk lime.",
-                                    "Alkohol bissættes altid bis sidst, når slushein er færdig, für at bevare dein rette fryseevne und sikre ein stabil konsisteins."
-                        ]
-            },
-            "fr": {
-                        "name": "Margarita Ice (18+)",
-                        "description": "Un frisk et sprød frossun Margarita, skabt jusqu'à varme aftuner et solglimt ved barun. Dun bløde sødme fra limesirup møder dun skarpe tequila et et strejf af appelsin fra Triple Sec. Resultatet er un iskold, balanceret cocktail, der smager af ferie et havbris – klassisk, mun avec slush-twist.\nAlkoholprocunt (beregnet): ca. 5,6 % vol.",
-                        "steps": [
-                                    "Mélangez lime sirup et vand soigneusemunt dans un pichet.",
-                                    "Versez le mélange dans la machine et kør jusqu'à dun får slush-konsistuns.",
-                                    "Ajoutez tequila et Triple Sec jusqu'à sidst, når le mélange er frosset.",
-                                    "Servez immédiatemunt i et afkølet glas avec saltet kant et frisk lime.",
-                                    "Alkohol jusqu'àsættes altid jusqu'à sidst, når slushun er færdig, pour at bevare dun rette fryseevne et sikre un stabil konsistuns."
-                        ]
-            },
-            "en": {
-                        "name": "Margarita Ice (18+)",
-                        "description": "A frisk and sprød frossa Margarita, skabt until varme aftaer and solglimt ved bara. Da bløde sødme fra limesirup møder da skarpe tequila and et strejf af appelsin fra Triple Sec. Resultatet er a iskold, balanceret cocktail, der smager af ferie and havbris – klassisk, ma with slush-twist.\nAlkoholprocat (beregnet): ca. 5,6 % vol.",
-                        "steps": [
-                                    "Mix lime sirup and vand thoroughly in a pitcher.",
-                                    "Pour the mixture in the machine and kør until da får slush-konsistas.",
-                                    "Add tequila and Triple Sec until sidst, når the mixture er frosset.",
-                                    "Serve imwithiately i et afkølet glas with saltet kant and frisk lime.",
-                                    "Alkohol untilsættes altid until sidst, når slusha er færdig, for at bevare da rette fryseevne and sikre a stabil konsistas."
-                        ]
-            },
-            "en_us": {
-                        "name": "Margarita Ice (18+)",
-                        "description": "A frisk and sprød frossa Margarita, skabt until varme aftaer and solglimt ved bara. Da bløde sødme fra limesirup møder da skarpe tequila and et strejf af appelsin fra Triple Sec. Resultatet er a iskold, balanceret cocktail, der smager af ferie and havbris – klassisk, ma with slush-twist.\nAlkoholprocat (beregnet): ca. 5,6 % vol.",
-                        "steps": [
-                                    "Mix lime sirup and vand thoroughly in a pitcher.",
-                                    "Pour the mixture in the machine and kør until da får slush-konsistas.",
-                                    "Add tequila and Triple Sec until sidst, når the mixture er frosset.",
-                                    "Serve imwithiately i et afkølet glas with saltet kant and frisk lime.",
-                                    "Alkohol untilsættes altid until sidst, når slusha er færdig, for at bevare da rette fryseevne and sikre a stabil konsistas."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Piña Colada Slush (18+)",
-            "description": "Tropisk piña colada som slushice",
-            "image_url": "https://images.unsplash.com/photo-1514362545857-3bc16c4c7d1b?w=400&h=600&fit=crop",
-            "color": "yellow",
-            "alcohol_flag": True,
-            "target_brix": 13.0,
-            "tags": ["alkohol", "tropisk", "kokos", "voksen"],
-            "ingredients": [
-                {"name": "Kokos creme", "category_key": "sirup.kokos", "quantity": 250, "unit": "ml", "role": "required", "brix": 60},
-                {"name": "Hvid rom", "category_key": "alkohol.rom", "quantity": 100, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Ananas juice", "category_key": "juice.ananas", "quantity": 600, "unit": "ml", "role": "required", "brix": 12},
-                {"name": "Fløde", "category_key": "mejeriprodukter.floede", "quantity": 50, "unit": "ml", "role": "optional", "brix": 5}
-            ],
-            "steps": ["Bland kokos creme, rom og ananas juice", "Tilføj fløde for ekstra creminess", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Piña Colada Slush (18+)",
-                        "description": "Tropisk, cremet og uimodståeligt lækker – Piña Colada Slush bringer Caribien direkte i glasset. Den bløde kokos og søde ananas forenes med en mild rom, der giver varme og balance. Resultatet er en silkeagtig slush med en let fylde, frisk sødme og et strejf af luksus.\nAlkoholprocent (beregnet): ca. 6,5 % vol.",
-                        "steps": [
-                                    "Hæld blandingen i slushmaskinen og kør til ønsket konsistens.",
-                                    "Hæld blandingen i slushmaskinen og kør til ønsket konsistens.",
-                                    "Tilsæt rom til sidst, når slushen er færdig, og rør forsigtigt rundt.",
-                                    "Server straks – gerne pyntet med tørret ananas, frisk mynte eller et drys kokos.",
-                                    "Alkohol tilsættes altid til sidst, når slushen er færdig, for at bevare fryseevnen og sikre en stabil, cremet struktur."
-                        ]
-            },
-            "de": {
-                        "name": "Piña Colada Slush (18+)",
-                        "description": "Tropisk, cremig und uimodståeligt lækker – Piña Colada Slush bringer Caribiein direkte ins Glasset. Dein bløde kokos und søde ananas füreines mit ein mild rom, der giver varme und balance. Resultatet er ein silkeagtig slush mit ein let fylde, frisk sødme und et strejf af luksus.\nAlkoholproceint (beregnet): ca. 6,5 % vol.",
-                        "steps": [
-                                    "Gießein Sie die Mischung in die Slushmaschine und kør bis gewünschte Konsisteinz.",
-                                    "Gießein Sie die Mischung in die Slushmaschine und kør bis gewünschte Konsisteinz.",
-                                    "Fügein Sie hinzu rom bis sidst, når slushein er færdig, und rør vorsichtig rundt.",
-                                    "Servierein Sie sofürt – gerne pyntet mit tørret ananas, frisk mynte oder et drys kokos.",
-                                    "Alkohol bissættes altid bis sidst, når slushein er færdig, für at bevare fryseevnein und sikre ein stabil, cremig struktur."
-                        ]
-            },
-            "fr": {
-                        "name": "Piña Colada Slush (18+)",
-                        "description": "Tropisk, crémeux et uimodståeligt lækker – Piña Colada Slush bringer Caribiun direkte dans un verreset. Dun bløde kokos et søde ananas pourunes avec un mild rom, der giver varme et balance. Resultatet er un silkeagtig slush avec un let fylde, frisk sødme et et strejf af luksus.\nAlkoholprocunt (beregnet): ca. 6,5 % vol.",
-                        "steps": [
-                                    "Versez le mélange dans la machine à slush et kør jusqu'à consistance souhaitée.",
-                                    "Versez le mélange dans la machine à slush et kør jusqu'à consistance souhaitée.",
-                                    "Ajoutez rom jusqu'à sidst, når slushun er færdig, et rør délicatemunt rundt.",
-                                    "Servez immédiatemunt – gerne pyntet avec tørret ananas, frisk mynte ou et drys kokos.",
-                                    "Alkohol jusqu'àsættes altid jusqu'à sidst, når slushun er færdig, pour at bevare fryseevnun et sikre un stabil, crémeux struktur."
-                        ]
-            },
-            "en": {
-                        "name": "Piña Colada Slush (18+)",
-                        "description": "Tropisk, creamy and uimodståeligt lækker – Piña Colada Slush bringer Caribia direkte in a glassset. Da bløde kokos and søde ananas foraes with a mild rom, der giver varme and balance. Resultatet er a silkeagtig slush with a let fylde, frisk sødme and et strejf af luksus.\nAlkoholprocat (beregnet): ca. 6,5 % vol.",
-                        "steps": [
-                                    "Pour the mixture in the slush machine and kør until desired consistacy.",
-                                    "Pour the mixture in the slush machine and kør until desired consistacy.",
-                                    "Add rom until sidst, når slusha er færdig, and rør gatly rundt.",
-                                    "Serve imwithiately – gerne pyntet with tørret ananas, frisk mynte or et drys kokos.",
-                                    "Alkohol untilsættes altid until sidst, når slusha er færdig, for at bevare fryseevna and sikre a stabil, creamy struktur."
-                        ]
-            },
-            "en_us": {
-                        "name": "Piña Colada Slush (18+)",
-                        "description": "Tropisk, creamy and uimodståeligt lækker – Piña Colada Slush bringer Caribia direkte in a glassset. Da bløde kokos and søde ananas foraes with a mild rom, der giver varme and balance. Resultatet er a silkeagtig slush with a let fylde, frisk sødme and et strejf af luksus.\nAlkoholprocat (beregnet): ca. 6,5 % vol.",
-                        "steps": [
-                                    "Pour the mixture in the slush machine and kør until desired consistacy.",
-                                    "Pour the mixture in the slush machine and kør until desired consistacy.",
-                                    "Add rom until sidst, når slusha er færdig, and rør gatly rundt.",
-                                    "Serve imwithiately – gerne pyntet with tørret ananas, frisk mynte or et drys kokos.",
-                                    "Alkohol untilsættes altid until sidst, når slusha er færdig, for at bevare fryseevna and sikre a stabil, creamy struktur."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Strawberry Daiquiri (18+)",
-            "description": "Klassisk strawberry daiquiri frozen",
-            "image_url": "https://images.unsplash.com/photo-1597306687537-a252f6f71f49?w=400&h=600&fit=crop",
-            "color": "red",
-            "alcohol_flag": True,
-            "target_brix": 12.0,
-            "tags": ["alkohol", "jordbær", "klassisk", "voksen"],
-            "ingredients": [
-                {"name": "Jordbær sirup", "category_key": "sirup.baer.jordbaer", "quantity": 250, "unit": "ml", "role": "required", "brix": 65},
-                {"name": "Hvid rom", "category_key": "alkohol.rom", "quantity": 100, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 600, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Lime saft", "category_key": "citrus.lime", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland jordbær sirup, rom og vand", "Tilføj lime", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Strawberry Daiquiri (18+)",
-                        "description": "Klassisk og forførende strawberry daiquiri – en frisk balance mellem sød jordbær, syrlig lime og rund rom. Perfekt som en tropisk frozen cocktail til varme aftener.\nAlkoholprocent (beregnet): ca. 5,2 % vol.",
-                        "steps": [
-                                    "Hæld jordbærsirup, vand og lime i en kande og rør grundigt.",
-                                    "Kør blandingen i slushmaskinen ved ca. –3 °C.",
-                                    "Når ønsket konsistens er opnået, tilsæt rommen og rør kort.",
-                                    "Server straks – pynt med et friskt jordbær eller en limekant.",
-                                    "Teknisk note:\nAlkoholen tilsættes altid til sidst, når slushen er frossen, for at bevare fryseevnen og sikre en stabil konsistens.\nRom bidrager med både aroma og frysepunktssænkning, så overdosér ikke – ellers bliver blandingen for tynd."
-                        ]
-            },
-            "de": {
-                        "name": "Strawberry Daiquiri (18+)",
-                        "description": "Klassisk und fürføreinde strawberry daiquiri – ein frisk balance mellem sød jordbær, syrlig lime und rund rom. Perfekt als ein tropisk frozein cocktail bis varme afteiner.\nAlkoholproceint (beregnet): ca. 5,2 % vol.",
-                        "steps": [
-                                    "Gießein Sie jordbærsirup, vand und lime in einein Krug und rør gründlich.",
-                                    "Lassein Sie laufein die Mischung in die Slushmaschine ved ca. –3 °C.",
-                                    "Når gewünschte Konsisteinz er opnået, bissæt rommein und rør kort.",
-                                    "Servierein Sie sofürt – pynt mit et friskt jordbær oder ein limekant.",
-                                    "Teknisk note:\nAlkoholein bissættes altid bis sidst, når slushein er frossein, für at bevare fryseevnein und sikre ein stabil konsisteins.\nRom bidrager mit både aroma und frysepunktssænkning, så overdosér ikke – oders bliver die Mischung für tynd."
-                        ]
-            },
-            "fr": {
-                        "name": "Strawberry Daiquiri (18+)",
-                        "description": "Klassisk et pourførunde strawberry daiquiri – un frisk balance mellem sød jordbær, syrlig lime et rund rom. Perfekt comme un tropisk frozun cocktail jusqu'à varme aftuner.\nAlkoholprocunt (beregnet): ca. 5,2 % vol.",
-                        "steps": [
-                                    "Versez jordbærsirup, vand et lime dans un pichet et rør soigneusemunt.",
-                                    "Faites tourner le mélange dans la machine à slush ved ca. –3 °C.",
-                                    "Når consistance souhaitée er opnået, jusqu'àsæt rommun et rør kort.",
-                                    "Servez immédiatemunt – pynt avec et friskt jordbær ou un limekant.",
-                                    "Teknisk note:\nAlkoholun jusqu'àsættes altid jusqu'à sidst, når slushun er frossun, pour at bevare fryseevnun et sikre un stabil konsistuns.\nRom bidrager avec både aroma et frysepunktssænkning, så overdosér ikke – ous bliver le mélange pour tynd."
-                        ]
-            },
-            "en": {
-                        "name": "Strawberry Daiquiri (18+)",
-                        "description": "Klassisk and forførade strawberry daiquiri – a frisk balance mellem sød jordbær, syrlig lime and rund rom. Perfekt as a tropisk froza cocktail until varme aftaer.\nAlkoholprocat (beregnet): ca. 5,2 % vol.",
-                        "steps": [
-                                    "Pour jordbærsirup, vand and lime in a pitcher and rør thoroughly.",
-                                    "Run the mixture in the slush machine ved ca. –3 °C.",
-                                    "Når desired consistacy er opnået, untilsæt romma and rør kort.",
-                                    "Serve imwithiately – pynt with et friskt jordbær or a limekant.",
-                                    "Teknisk note:\nAlkohola untilsættes altid until sidst, når slusha er frossa, for at bevare fryseevna and sikre a stabil konsistas.\nRom bidrager with både aroma and frysepunktssænkning, så overdosér ikke – ors bliver the mixture for tynd."
-                        ]
-            },
-            "en_us": {
-                        "name": "Strawberry Daiquiri (18+)",
-                        "description": "Klassisk and forførade strawberry daiquiri – a frisk balance mellem sød jordbær, syrlig lime and rund rom. Perfekt as a tropisk froza cocktail until varme aftaer.\nAlkoholprocat (beregnet): ca. 5,2 % vol.",
-                        "steps": [
-                                    "Pour jordbærsirup, vand and lime in a pitcher and rør thoroughly.",
-                                    "Run the mixture in the slush machine ved ca. –3 °C.",
-                                    "Når desired consistacy er opnået, untilsæt romma and rør kort.",
-                                    "Serve imwithiately – pynt with et friskt jordbær or a limekant.",
-                                    "Teknisk note:\nAlkohola untilsættes altid until sidst, når slusha er frossa, for at bevare fryseevna and sikre a stabil konsistas.\nRom bidrager with både aroma and frysepunktssænkning, så overdosér ikke – ors bliver the mixture for tynd."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Blue Lagoon Frozen (18+)",
-            "description": "Blå lagune som frozen drink",
-            "image_url": "https://images.unsplash.com/photo-1571613316887-6f8d5cbf7ef7?w=400&h=600&fit=crop",
-            "color": "blue",
-            "alcohol_flag": True,
-            "target_brix": 12.0,
-            "tags": ["alkohol", "blå", "vodka", "voksen"],
-            "ingredients": [
-                {"name": "Blå curaçao sirup", "category_key": "sirup.blue", "quantity": 200, "unit": "ml", "role": "required", "brix": 60},
-                {"name": "Vodka", "category_key": "alkohol.vodka", "quantity": 100, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Lemonade", "category_key": "sodavand.lemon", "quantity": 650, "unit": "ml", "role": "required", "brix": 10},
-                {"name": "Lime saft", "category_key": "citrus.lime", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland blå curaçao, vodka og lemonade", "Tilføj lime", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Blue Lagoon Frozen (18+)",
-                        "description": "En frisk og sprudlende frozen version af den klassiske Blue Lagoon. Kombinationen af blå curaçao, vodka og lemonade giver en sød, syrlig og let bitter balance.\nAlkoholprocent (beregnet): ca. 5,8 % vol.",
-                        "steps": [
-                                    "Bland blå curaçao-sirup, vodka og lemonade i en kande.",
-                                    "Tilsæt lime saft for friskhed og balance.",
-                                    "Hæld blandingen i slushmaskinen.",
-                                    "Kør til passende frozen-konsistens.",
-                                    "Server straks og pynt med en skive citron eller et kirsebær."
-                        ]
-            },
-            "de": {
-                        "name": "Blue Lagoon Frozen (18+)",
-                        "description": "Ein frisk und sprudleinde frozein version af dein klassiske Blue Lagoon. Gebein Siebinationein af blå curaçao, vodka und lemonade giver ein sød, syrlig und let bitter balance.\nAlkoholproceint (beregnet): ca. 5,8 % vol.",
-                        "steps": [
-                                    "Mischein Sie blå curaçao-sirup, vodka und lemonade in einein Krug.",
-                                    "Fügein Sie hinzu lime saft für friskhed und balance.",
-                                    "Gießein Sie die Mischung in die Slushmaschine.",
-                                    "Lassein Sie laufein bis passeinde frozein-konsisteins.",
-                                    "Servierein Sie sofürt und pynt mit ein skive citron oder et kirsebær."
-                        ]
-            },
-            "fr": {
-                        "name": "Blue Lagoon Frozen (18+)",
-                        "description": "Un frisk et sprudlunde frozun version af dun klassiske Blue Lagoon. Mettezbinationun af blå curaçao, vodka et lemonade giver un sød, syrlig et let bitter balance.\nAlkoholprocunt (beregnet): ca. 5,8 % vol.",
-                        "steps": [
-                                    "Mélangez blå curaçao-sirup, vodka et lemonade dans un pichet.",
-                                    "Ajoutez lime saft pour friskhed et balance.",
-                                    "Versez le mélange dans la machine à slush.",
-                                    "Faites tourner jusqu'à passunde frozun-konsistuns.",
-                                    "Servez immédiatemunt et pynt avec un skive citron ou et kirsebær."
-                        ]
-            },
-            "en": {
-                        "name": "Blue Lagoon Frozen (18+)",
-                        "description": "A frisk and sprudlade froza version af da klassiske Blue Lagoon. Putbinationa af blå curaçao, vodka and lemonade giver a sød, syrlig and let bitter balance.\nAlkoholprocat (beregnet): ca. 5,8 % vol.",
-                        "steps": [
-                                    "Mix blå curaçao-sirup, vodka and lemonade in a pitcher.",
-                                    "Add lime saft for friskhed and balance.",
-                                    "Pour the mixture in the slush machine.",
-                                    "Run until passade froza-konsistas.",
-                                    "Serve imwithiately and pynt with a skive citron or et kirsebær."
-                        ]
-            },
-            "en_us": {
-                        "name": "Blue Lagoon Frozen (18+)",
-                        "description": "A frisk and sprudlade froza version af da klassiske Blue Lagoon. Putbinationa af blå curaçao, vodka and lemonade giver a sød, syrlig and let bitter balance.\nAlkoholprocat (beregnet): ca. 5,8 % vol.",
-                        "steps": [
-                                    "Mix blå curaçao-sirup, vodka and lemonade in a pitcher.",
-                                    "Add lime saft for friskhed and balance.",
-                                    "Pour the mixture in the slush machine.",
-                                    "Run until passade froza-konsistas.",
-                                    "Serve imwithiately and pynt with a skive citron or et kirsebær."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Sex on the Beach Slush (18+)",
-            "description": "Populær cocktail som slushice",
-            "image_url": "https://images.unsplash.com/photo-1609951651556-5334e2706168?w=400&h=600&fit=crop",
-            "color": "orange",
-            "alcohol_flag": True,
-            "target_brix": 12.0,
-            "tags": ["alkohol", "cocktail", "frugtig", "voksen"],
-            "ingredients": [
-                {"name": "Tranebær saft", "category_key": "juice.tranebaer", "quantity": 200, "unit": "ml", "role": "required", "brix": 12},
-                {"name": "Appelsin juice", "category_key": "juice.appelsin", "quantity": 150, "unit": "ml", "role": "required", "brix": 12},
-                {"name": "Vodka", "category_key": "alkohol.vodka", "quantity": 100, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Peach Schnapps", "category_key": "alkohol.schnapps", "quantity": 50, "unit": "ml", "role": "required", "brix": 30},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 500, "unit": "ml", "role": "required", "brix": 0}
-            ],
-            "steps": ["Bland alle juicer og alkohol", "Tilføj vand", "Fyld i maskinen"]
-        },
-        {
-            "name": "Aperol Spritz Frozen (18+)",
-            "description": "Italiensk favorit som slushice",
-            "image_url": "https://images.unsplash.com/photo-1595981267035-7b04ca84a82d?w=400&h=600&fit=crop",
-            "color": "orange",
-            "alcohol_flag": True,
-            "target_brix": 11.0,
-            "tags": ["alkohol", "italiensk", "aperol", "voksen"],
-            "ingredients": [
-                {"name": "Aperol", "category_key": "alkohol.aperol", "quantity": 250, "unit": "ml", "role": "required", "brix": 25},
-                {"name": "Prosecco", "category_key": "alkohol.prosecco", "quantity": 150, "unit": "ml", "role": "required", "brix": 5},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 550, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Danskvand", "category_key": "sodavand.danskvand", "quantity": 50, "unit": "ml", "role": "optional", "brix": 0}
-            ],
-            "steps": ["Bland Aperol, prosecco og vand", "Tilføj danskvand", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Aperol Spritz Frozen (18+)",
-                        "description": "taliensk favorit som forfriskende slushice. Den klassiske aperol spritz i iskold udgave, let bitter med frisk syrlighed fra prosecco og danskvand.\nAlkoholprocent (beregnet): ca. 6,2 % vol.",
-                        "steps": [
-                                    "Bland Aperol, prosecco og vand i en kande og rør forsigtigt.",
-                                    "Tilsæt danskvand for let brus og balance.",
-                                    "Fyld blandingen i slushmaskinen sammen med den knuste is.",
-                                    "Kør til passende slush-konsistens.",
-                                    "Server straks og pynt med en skive appelsin eller et kirsebær."
-                        ]
-            },
-            "de": {
-                        "name": "Aperol Spritz Frozen (18+)",
-                        "description": "talieinsk favorit als fürfriskeinde slushice. Dein klassiske aperol spritz i iskold udgave, let bitter mit frisk syrlighed fra prosecco und danskvand.\nAlkoholproceint (beregnet): ca. 6,2 % vol.",
-                        "steps": [
-                                    "Mischein Sie Aperol, prosecco und vand in einein Krug und rør vorsichtig.",
-                                    "Fügein Sie hinzu danskvand für let brus und balance.",
-                                    "Füllein Sie die Mischung in die Slushmaschine sammein mit dein knuste is.",
-                                    "Lassein Sie laufein bis passeinde slush-konsisteins.",
-                                    "Servierein Sie sofürt und pynt mit ein skive appelsin oder et kirsebær."
-                        ]
-            },
-            "fr": {
-                        "name": "Aperol Spritz Frozen (18+)",
-                        "description": "taliunsk favorit comme pourfriskunde slushice. Dun klassiske aperol spritz i iskold udgave, let bitter avec frisk syrlighed fra prosecco et danskvand.\nAlkoholprocunt (beregnet): ca. 6,2 % vol.",
-                        "steps": [
-                                    "Mélangez Aperol, prosecco et vand dans un pichet et rør délicatemunt.",
-                                    "Ajoutez danskvand pour let brus et balance.",
-                                    "Remplissez le mélange dans la machine à slush sammun avec dun knuste is.",
-                                    "Faites tourner jusqu'à passunde slush-konsistuns.",
-                                    "Servez immédiatemunt et pynt avec un skive appelsin ou et kirsebær."
-                        ]
-            },
-            "en": {
-                        "name": "Aperol Spritz Frozen (18+)",
-                        "description": "taliask favorit as forfriskade slushice. Da klassiske aperol spritz i iskold udgave, let bitter with frisk syrlighed fra prosecco and danskvand.\nAlkoholprocat (beregnet): ca. 6,2 % vol.",
-                        "steps": [
-                                    "Mix Aperol, prosecco and vand in a pitcher and rør gatly.",
-                                    "Add danskvand for let brus and balance.",
-                                    "Fill the mixture in the slush machine samma with da knuste is.",
-                                    "Run until passade slush-konsistas.",
-                                    "Serve imwithiately and pynt with a skive appelsin or et kirsebær."
-                        ]
-            },
-            "en_us": {
-                        "name": "Aperol Spritz Frozen (18+)",
-                        "description": "taliask favorit as forfriskade slushice. Da klassiske aperol spritz i iskold udgave, let bitter with frisk syrlighed fra prosecco and danskvand.\nAlkoholprocat (beregnet): ca. 6,2 % vol.",
-                        "steps": [
-                                    "Mix Aperol, prosecco and vand in a pitcher and rør gatly.",
-                                    "Add danskvand for let brus and balance.",
-                                    "Fill the mixture in the slush machine samma with da knuste is.",
-                                    "Run until passade slush-konsistas.",
-                                    "Serve imwithiately and pynt with a skive appelsin or et kirsebær."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Frozen Bellini (18+)",
-            "description": "Elegant fersken prosecco slushice",
-            "image_url": "https://images.unsplash.com/photo-1587223075055-82e9a937ddff?w=400&h=600&fit=crop",
-            "color": "orange",
-            "alcohol_flag": True,
-            "target_brix": 12.0,
-            "tags": ["alkohol", "elegant", "fersken", "voksen"],
-            "ingredients": [
-                {"name": "Fersken puré", "category_key": "sirup.fersken", "quantity": 250, "unit": "ml", "role": "required", "brix": 60},
-                {"name": "Prosecco", "category_key": "alkohol.prosecco", "quantity": 150, "unit": "ml", "role": "required", "brix": 5},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 550, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Sukker sirup", "category_key": "sirup.sukker", "quantity": 50, "unit": "ml", "role": "optional", "brix": 70}
-            ],
-            "steps": ["Bland fersken puré, prosecco og vand", "Justér sødme med sukker sirup", "Fyld i maskinen"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Frozen Bellini (18+)",
-                        "description": "En elegant og forfriskende frozen version af den klassiske Bellini. Den søde ferskenpuré møder den sprøde prosecco, som giver et perlende let og sofistikeret udtryk. Alkoholen tilsættes til sidst for at bevare den perfekte frysebalance.",
-                        "steps": [
-                                    "Hæld fersken-sirup, prosecco og vand i en kande, og rør forsigtigt sammen.",
-                                    "Tilsæt sukkerlage efter smag for at justere sødmen.",
-                                    "Hæld blandingen i slushmaskinen, og kør ved ca. –3 °C.",
-                                    "Prosecco tilsættes til sidst, så alkoholen ikke forstyrrer frysningen.",
-                                    "Server straks – pynt gerne med et stykke fersken eller en myntekvist."
-                        ]
-            },
-            "de": {
-                        "name": "Frozen Bellini (18+)",
-                        "description": "Ein elegant und fürfriskeinde frozein version af dein klassiske Bellini. Dein søde ferskeinpuré møder dein sprøde prosecco, als giver et perleinde let und sofistikeret udtryk. Alkoholein bissættes bis sidst für at bevare dein perfekte frysebalance.",
-                        "steps": [
-                                    "Gießein Sie ferskein-sirup, prosecco und vand in einein Krug, und rør vorsichtig sammein.",
-                                    "Fügein Sie hinzu sukkerlage nach Geschmack für at justere sødmein.",
-                                    "Gießein Sie die Mischung in die Slushmaschine, und kør ved ca. –3 °C.",
-                                    "Prosecco bissættes bis sidst, så alkoholein ikke fürstyrrer frysningein.",
-                                    "Servierein Sie sofürt – garnierein Sie gerne mit et stykke ferskein oder ein myntekvist."
-                        ]
-            },
-            "fr": {
-                        "name": "Frozen Bellini (18+)",
-                        "description": "Un elegant et pourfriskunde frozun version af dun klassiske Bellini. Dun søde ferskunpuré møder dun sprøde prosecco, comme giver et perlunde let et sofistikeret udtryk. Alkoholun jusqu'àsættes jusqu'à sidst pour at bevare dun parfaite frysebalance.",
-                        "steps": [
-                                    "Versez ferskun-sirup, prosecco et vand dans un pichet, et rør délicatemunt sammun.",
-                                    "Ajoutez sukkerlage selon le goût pour at justere sødmun.",
-                                    "Versez le mélange dans la machine à slush, et kør ved ca. –3 °C.",
-                                    "Prosecco jusqu'àsættes jusqu'à sidst, så alkoholun ikke pourstyrrer frysningun.",
-                                    "Servez immédiatemunt – garnissez avec et stykke ferskun ou un myntekvist."
-                        ]
-            },
-            "en": {
-                        "name": "Frozen Bellini (18+)",
-                        "description": "A elegant and forfriskade froza version af da klassiske Bellini. Da søde ferskapuré møder da sprøde prosecco, as giver et perlade let and sofistikeret udtryk. Alkohola untilsættes until sidst for at bevare da perfecte frysebalance.",
-                        "steps": [
-                                    "Pour ferska-sirup, prosecco and vand in a pitcher, and rør gatly samma.",
-                                    "Add sukkerlage to taste for at justere sødma.",
-                                    "Pour the mixture in the slush machine, and kør ved ca. –3 °C.",
-                                    "Prosecco untilsættes until sidst, så alkohola ikke forstyrrer frysninga.",
-                                    "Serve imwithiately – garnish with et stykke ferska or a myntekvist."
-                        ]
-            },
-            "en_us": {
-                        "name": "Frozen Bellini (18+)",
-                        "description": "A elegant and forfriskade froza version af da klassiske Bellini. Da søde ferskapuré møder da sprøde prosecco, as giver et perlade let and sofistikeret udtryk. Alkohola untilsættes until sidst for at bevare da perfecte frysebalance.",
-                        "steps": [
-                                    "Pour ferska-sirup, prosecco and vand in a pitcher, and rør gatly samma.",
-                                    "Add sukkerlage to taste for at justere sødma.",
-                                    "Pour the mixture in the slush machine, and kør ved ca. –3 °C.",
-                                    "Prosecco untilsættes until sidst, så alkohola ikke forstyrrer frysninga.",
-                                    "Serve imwithiately – garnish with et stykke ferska or a myntekvist."
-                        ]
-            }
-}
-        },
-        {
-            "name": "Cosmopolitan Slush (18+)",
-            "description": "Trendy cosmopolitan som frozen drink",
-            "image_url": "https://images.unsplash.com/photo-1514361892635-6b07e31e75f9?w=400&h=600&fit=crop",
-            "color": "pink",
-            "alcohol_flag": True,
-            "target_brix": 11.0,
-            "tags": ["alkohol", "trendy", "elegant", "voksen"],
-            "ingredients": [
-                {"name": "Tranebær juice", "category_key": "juice.tranebaer", "quantity": 200, "unit": "ml", "role": "required", "brix": 12},
-                {"name": "Vodka", "category_key": "alkohol.vodka", "quantity": 100, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Triple sec", "category_key": "alkohol.triplesec", "quantity": 50, "unit": "ml", "role": "required", "brix": 30},
-                {"name": "Lime saft", "category_key": "citrus.lime", "quantity": 50, "unit": "ml", "role": "required", "brix": 10},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 600, "unit": "ml", "role": "required", "brix": 0}
-            ],
-            "steps": ["Bland tranebær juice, vodka, triple sec og lime", "Tilføj vand", "Fyld i maskinen"]
-        },
-        {
-            "name": "Long Island Iced Tea Frozen (18+)",
-            "description": "Stærk klassiker som slushice",
-            "image_url": "https://images.unsplash.com/photo-1544145945-35c4e5f2b6cb?w=400&h=600&fit=crop",
-            "color": "brown",
-            "alcohol_flag": True,
-            "target_brix": 11.0,
-            "tags": ["alkohol", "stærk", "cocktail", "voksen"],
-            "ingredients": [
-                {"name": "Vodka", "category_key": "alkohol.vodka", "quantity": 50, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Hvid rom", "category_key": "alkohol.rom", "quantity": 50, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Gin", "category_key": "alkohol.gin", "quantity": 50, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Tequila", "category_key": "alkohol.tequila", "quantity": 50, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Cola sirup", "category_key": "sirup.cola", "quantity": 100, "unit": "ml", "role": "required", "brix": 68},
-                {"name": "Vand/knust is", "category_key": "base.vand", "quantity": 650, "unit": "ml", "role": "required", "brix": 0},
-                {"name": "Lime saft", "category_key": "citrus.lime", "quantity": 50, "unit": "ml", "role": "optional", "brix": 10}
-            ],
-            "steps": ["Bland alle alkohol typer", "Tilføj cola sirup og vand", "Afslut med lime", "Fyld i maskinen - meget stærk!"]
-        ,
-            "translations": {
-            "da": {
-                        "name": "Long Island Iced Tea Frozen (18+)",
-                        "description": "Stærk klassiker som slushice",
-                        "steps": [
-                                    "Bland alle alkohol typer",
-                                    "Tilføj cola sirup og vand",
-                                    "Afslut med lime",
-                                    "Fyld i maskinen - meget stærk!"
-                        ]
-            },
-            "de": {
-                        "name": "Long Island Iced Tea Frozen (18+)",
-                        "description": "Stærk klassiker als slushice",
-                        "steps": [
-                                    "Mischein Sie alle alkohol typer",
-                                    "Tilføj cola sirup und vand",
-                                    "Afslut mit lime",
-                                    "Füllein Sie in die Maschine - meget stærk!"
-                        ]
-            },
-            "fr": {
-                        "name": "Long Island Iced Tea Frozen (18+)",
-                        "description": "Stærk klassiker comme slushice",
-                        "steps": [
-                                    "Mélangez alle alkohol typer",
-                                    "Tilføj cola sirup et vand",
-                                    "Afslut avec lime",
-                                    "Remplissez dans la machine - meget stærk!"
-                        ]
-            },
-            "en": {
-                        "name": "Long Island Iced Tea Frozen (18+)",
-                        "description": "Stærk klassiker as slushice",
-                        "steps": [
-                                    "Mix alle alkohol typer",
-                                    "Tilføj cola sirup and vand",
-                                    "Afslut with lime",
-                                    "Fill in the machine - meget stærk!"
-                        ]
-            },
-            "en_us": {
-                        "name": "Long Island Iced Tea Frozen (18+)",
-                        "description": "Stærk klassiker as slushice",
-                        "steps": [
-                                    "Mix alle alkohol typer",
-                                    "Tilføj cola sirup and vand",
-                                    "Afslut with lime",
-                                    "Fill in the machine - meget stærk!"
-                        ]
-            }
-}
-        }
-    ]
-    
-    # Load translations from file
-    translations_file = os.path.join(os.path.dirname(__file__), 'recipe_translations.json')
-    logger.info(f"[SEED] Looking for translations file at: {translations_file}")
-    recipe_translations_map = {}
-    try:
-        if os.path.exists(translations_file):
-            logger.info(f"[SEED] Translations file exists, loading...")
-            with open(translations_file, 'r', encoding='utf-8') as f:
-                recipe_translations_map = json.load(f)
-            logger.info(f"[SEED] Loaded translations for {len(recipe_translations_map)} recipes")
-        else:
-            logger.warning(f"[SEED] Translations file not found at {translations_file}")
-    except Exception as e:
-        logger.warning(f"[SEED] Could not load recipe translations: {e}")
-    
-    for recipe_data in recipes_data:
-        recipe = Recipe(
-            **recipe_data,
-            base_volume_ml=1000,
-            author="system",
-            author_name="SLUSHBOOK"
-        )
-        doc = recipe.model_dump()
-        doc['created_at'] = doc['created_at'].isoformat()
-        
-        # Add translations if available (match by name since ID doesn't exist yet)
-        if recipe_translations_map:
-            for trans_id, trans_data in recipe_translations_map.items():
-                if trans_data['name'] == recipe_data['name']:
-                    doc['translations'] = trans_data['translations']
-                    logger.info(f"[SEED] Added translations for {recipe_data['name']}")
-                    break
-        
-        # Ensure Danish translation exists
-        if 'translations' not in doc or 'da' not in doc.get('translations', {}):
-            doc['translations'] = {
-                'da': {
-                    'name': recipe_data['name'],
-                    'description': recipe_data.get('description', ''),
-                    'steps': recipe_data.get('steps', [])
-                }
-            }
-        
-        try:
-            # Use upsert to insert or update
-            await db.recipes.update_one(
-                {'name': recipe_data['name'], 'author': 'system'},
-                {'$set': doc},
-                upsert=True
-            )
-        except Exception as e:
-            logger.warning(f"Failed to upsert recipe {recipe_data['name']}: {e}")
-    
-    logger.info(f"Seeded {len(recipes_data)} recipes with translations")
+# Seed initial recipes (seed_data/recipes.json; skipped when the data is unchanged)
+def make_seed_doc(recipe_data: dict) -> dict:
+    recipe = Recipe(
+        **recipe_data,
+        base_volume_ml=1000,
+        author="system",
+        author_name="SLUSHBOOK"
+    )
+    doc = recipe.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    return doc
 
-# Helper functions
-def calculate_match_score(recipe: Dict, pantry_items: List[Dict]) -> Dict:
-    score = 0
-    missing = []
-    have = []
-    
-    # Build pantry items with normalized names (lowercase, no extra spaces)
-    pantry_items_normalized = []
-    for item in pantry_items:
-        normalized_name = ' '.join(item['ingredient_name'].lower().split())
-        pantry_items_normalized.append({
-            'original': item['ingredient_name'],
-            'normalized': normalized_name,
-            'category': item.get('category_key', '')
-        })
-    
-    for ingredient in recipe['ingredients']:
-        if ingredient['role'] == 'garnish':
-            continue
-        
-        ingredient_name_normalized = ' '.join(ingredient['name'].lower().split())
-        
-        # Try exact normalized match first
-        matched = any(
-            ingredient_name_normalized == pantry_item['normalized']
-            for pantry_item in pantry_items_normalized
-        )
-        
-        if matched:
-            if ingredient['role'] == 'required':
-                score += 2
-                have.append(ingredient['name'])
-            else:
-                score += 1
-                have.append(ingredient['name'])
-        else:
-            if ingredient['role'] == 'required':
-                score -= 2
-                missing.append(ingredient['name'])
-    
-    total_required = len([i for i in recipe['ingredients'] if i['role'] == 'required'])
-    matched_required = len([i for i in have if any(ing['name'] == i and ing['role'] == 'required' for ing in recipe['ingredients'])])
-    match_pct = (matched_required / total_required * 100) if total_required > 0 else 0
-    
-    return {
-        'score': score,
-        'match_pct': round(match_pct, 1),
-        'have': have,
-        'missing': missing,
-        'can_make_now': len(missing) == 0 and score > 0,
-        'almost': len(missing) <= 2 and len(missing) > 0
-    }
+async def seed_recipes(force: bool = False):
+    result = await run_recipe_seed(db, make_seed_doc, force=force)
+    if result["seeded"]:
+        catalog_cache.invalidate()
+    return result
 
+# Helper functions
 def scale_recipe(recipe: Dict, target_volume_ml: int, margin_pct: float = 5.0) -> Dict:
     base_volume = recipe['base_volume_ml']
     scale_factor = (target_volume_ml * (1 + margin_pct/100)) / base_volume
@@ -2173,6 +551,45 @@ async def health_check():
         "version": __version__
     }
 
+@api_router.get("/admin/cache-stats")
+async def get_cache_stats(request: Request):
+    """Hit/miss counters for the in-process caches (admin only)"""
+    user = await get_current_user(request, None, db)
+    if not user or user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+    
+    return {
+        "recipe_catalog": catalog_cache.stats(),
+        "sessions": session_cache.stats(),
+        "session_touches": session_touches.stats(),
+        "recipe_views": recipe_view_buffer.stats(),
+        "redirects": redirect_routes.redirect_table.stats(),
+        "clicks": click_ingestor.stats(),
+        "tips": tips_cache.stats()
+    }
+
+@api_router.get("/admin/startup-profile")
+async def get_startup_profile(request: Request):
+    """Import timings, boot phases and time to first request of this worker (admin only, STARTUP_PROFILE=1)"""
+    user = await get_current_user(request, None, db)
+    if not user or user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+    
+    return startup_profile.report()
+
+@api_router.get("/admin/db-indexes")
+async def get_db_indexes(request: Request, apply: bool = False):
+    """Registered indexes and explain() of the hot query shapes, flagging COLLSCANs (admin only)"""
+    user = await get_current_user(request, None, db)
+    if not user or user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+    
+    result = {}
+    if apply:
+        result["applied"] = await ensure_indexes(db)
+    result.update(await index_report(db))
+    return result
+
 # =============================================================================
 # AUTHENTICATION ENDPOINTS
 # =============================================================================
@@ -2287,6 +704,7 @@ async def login(request: LoginRequest, response: Response, http_request: Request
         for i in range(sessions_to_remove):
             oldest_session = active_sessions[i]
             await db.user_sessions.delete_one({"_id": oldest_session["_id"]})
+            invalidate_session(oldest_session.get("session_token"))
             logger.info(f"Removed oldest session for user {user_doc['id']} due to device limit")
     
     # Create new session with 30 day expiration
@@ -2420,6 +838,7 @@ async def logout_device(request: Request):
     
     # Delete the session
     result = await db.user_sessions.delete_one(query)
+    invalidate_user_sessions(user.id)
     
     if result.deleted_count > 0:
         return {"message": "Device logged out successfully"}
@@ -2441,6 +860,7 @@ async def logout_all_devices(request: Request):
         "user_id": user.id,
         "session_token": {"$ne": current_token}
     })
+    invalidate_user_sessions(user.id)
     
     return {
         "message": f"Logged out {result.deleted_count} devices",
@@ -2478,6 +898,7 @@ async def logout(request: Request, response: Response):
     if session_token:
         # Delete session from database
         await db.user_sessions.delete_one({"session_token": session_token})
+        invalidate_session(session_token)
     
     # Clear cookie
     response.delete_cookie("session_token")
@@ -2502,6 +923,7 @@ async def complete_tour(request: Request, tour_data: dict):
             {"id": user.id},
             {"$addToSet": {"completed_tours": tour_id}}
         )
+        invalidate_user_sessions(user.id)
         
         # Get updated user
         updated_user = await db.users.find_one({"id": user.id}, {"_id": 0})
@@ -2527,6 +949,7 @@ async def reset_all_tours(request: Request):
             {"id": user.id},
             {"$set": {"completed_tours": []}}
         )
+        invalidate_user_sessions(user.id)
         
         return {
             "success": True,
@@ -2552,6 +975,7 @@ async def reset_single_tour(request: Request, tour_data: dict):
             {"id": user.id},
             {"$pull": {"completed_tours": tour_id}}
         )
+        invalidate_user_sessions(user.id)
         
         return {
             "success": True,
@@ -2626,6 +1050,7 @@ async def reset_password(request: ResetPasswordRequest):
     user = await db.users.find_one({"email": reset["email"]})
     if user:
         await db.user_sessions.delete_many({"user_id": user["id"]})
+        invalidate_user_sessions(user["id"])
     
     return {"message": "Password reset successful"}
 
@@ -2800,6 +1225,7 @@ async def update_profile(request: Request, update_data: dict):
             {"id": user.id},
             {"$set": update_fields}
         )
+        invalidate_user_sessions(user.id)
     
     return {"message": "Profil opdateret"}
 
@@ -2879,6 +1305,9 @@ async def delete_all_recipes(request: Request):
         
         # Delete all system recipes
         result = await db.recipes.delete_many({'author': 'system'})
+        catalog_cache.invalidate()
+        # The stored seed hash would otherwise keep the seed from being re-applied
+        await forget_seed(db)
         
         return {
             "success": True,
@@ -2942,6 +1371,7 @@ async def fix_all_approvals(request: Request):
                 }
             }
         )
+        catalog_cache.invalidate()
         
         total_found = len(problematic_user) + len(problematic_system)
         total_updated = result_user.modified_count + result_system.modified_count
@@ -3072,6 +1502,7 @@ async def update_member_role(user_id: str, role_data: dict, request: Request):
         {"id": user_id},
         {"$set": {"role": new_role}}
     )
+    invalidate_user_sessions(user_id)
     
     if result.modified_count == 0:
         raise HTTPException(
@@ -3162,6 +1593,7 @@ async def reset_member_password(user_id: str, password_data: dict, request: Requ
     
     # Delete all sessions for this user
     await db.user_sessions.delete_many({"user_id": user_id})
+    invalidate_user_sessions(user_id)
     
     return {"message": "Password nulstillet"}
 
@@ -3195,7 +1627,9 @@ async def delete_member(user_id: str, request: Request):
     
     # Clean up user data
     await db.user_sessions.delete_many({"user_id": user_id})
+    invalidate_user_sessions(user_id)
     await db.recipes.delete_many({"created_by": user_id})
+    catalog_cache.invalidate()
     await db.favorites.delete_many({"session_id": user_id})
     await db.pantry_items.delete_many({"session_id": user_id})
     await db.shopping_list.delete_many({"session_id": user_id})
@@ -3267,7 +1701,10 @@ async def get_recipes(
     include_ingredients: Optional[str] = None,  # Comma-separated list
     exclude_ingredients: Optional[str] = None,   # Comma-separated list
     author: Optional[str] = None,  # Filter by author ID
-    lang: str = "da"  # Language code for translations
+    lang: str = "da",  # Language code for translations
+    limit: Optional[int] = None,  # Page size - enables paginated response
+    cursor: Optional[str] = None,  # next_cursor from the previous page
+    fields: Optional[str] = None  # Comma-separated list of fields to return
 ):
     # Get current user (can be None for guests)
     user = await get_current_user(request, None, db)
@@ -3296,26 +1733,19 @@ async def get_recipes(
     # IMPORTANT: Only show published recipes (is_published=True) unless user is admin
     # Guests see ALL published recipes (including locked ones) to create "hook" for upgrading
     # Frontend will display locked recipes with blur/overlay
-    if user and user.role == "admin":
+    is_admin = bool(user and user.role == "admin")
+    if is_admin:
         # Admin users see ALL system recipes (including unpublished)
-        system_recipes = await db.recipes.find({**query, "author": "system"}, {"_id": 0}).to_list(1000)
-        logger.info(f"[RECIPES] Admin user, returning {len(system_recipes)} system recipes (all)")
+        system_query = {**query, "author": "system"}
     else:
         # Pro and Guest users see ONLY published system recipes
-        system_recipes = await db.recipes.find(
-            {**query, "author": "system", "is_published": True},
-            {"_id": 0}
-        ).to_list(1000)
-        logger.info(f"[RECIPES] Non-admin user, returning {len(system_recipes)} published system recipes")
+        system_query = {**query, "author": "system", "is_published": True}
     
-    # Get published user recipes (is_published = true AND approved)
-    published_user_recipes = await db.user_recipes.find(
-        {**query, "is_published": True, "approval_status": "approved"},
-        {"_id": 0}
-    ).to_list(1000)
+    # Published user recipes (is_published = true AND approved)
+    published_query = {**query, "is_published": True, "approval_status": "approved"}
     
-    # Get current user's own recipes (private + pending + rejected) if logged in
-    own_recipes = []
+    # Current user's own recipes (private + pending + rejected) if logged in
+    own_queries = []
     if session_id:
         # Get current user to access their id and email
         user = await db.users.find_one({"id": session_id})
@@ -3333,125 +1763,126 @@ async def get_recipes(
                 {"session_id": user_id}       # Session_id is user ID (some recipes)
             ]}
             
-            # Get user's private recipes (not published)
-            private_recipes = await db.user_recipes.find(
+            own_queries = [
+                # User's private recipes (not published)
                 {**query, **user_query, "is_published": {"$ne": True}},
-                {"_id": 0}
-            ).to_list(1000)
-            
-            # Get user's pending/rejected published recipes (so they can see their own submissions)
-            pending_recipes = await db.user_recipes.find(
-                {**query, **user_query, "is_published": True, "approval_status": {"$in": ["pending", "rejected"]}},
-                {"_id": 0}
-            ).to_list(1000)
-            
-            own_recipes = private_recipes + pending_recipes
+                # User's pending/rejected published recipes (so they can see their own submissions)
+                {**query, **user_query, "is_published": True, "approval_status": {"$in": ["pending", "rejected"]}}
+            ]
     
-    all_recipes = system_recipes + published_user_recipes + own_recipes
+    include_list = [ing.strip().lower() for ing in include_ingredients.split(',')] if include_ingredients else []
+    exclude_list = [ing.strip().lower() for ing in exclude_ingredients.split(',')] if exclude_ingredients else []
     
-    # Filter by author if specified
-    if author:
-        all_recipes = [r for r in all_recipes if r.get('author') == author]
+    requested_fields = parse_fields(fields)
+    projection = build_projection(requested_fields, {"ingredients"} if include_list or exclude_list else set())
+    # Published system recipes already translated by the catalog cache, by id
+    translated_views = {}
     
-    # Filter by ingredients if specified
-    if include_ingredients or exclude_ingredients:
-        include_list = [ing.strip().lower() for ing in include_ingredients.split(',')] if include_ingredients else []
-        exclude_list = [ing.strip().lower() for ing in exclude_ingredients.split(',')] if exclude_ingredients else []
+    if limit is not None or cursor is not None:
+        # Paginated response: k-way merge of the sources, reading about one page per source
+        page_size = min(max(limit or DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+        sources = [(db.recipes, system_query), (db.user_recipes, published_query)]
+        if own_queries:
+            sources.append((db.user_recipes, {"$or": own_queries}))
+        if author:
+            sources = [(collection, {"$and": [source_query, {"author": author}]}) for collection, source_query in sources]
         
-        filtered_recipes = []
-        for recipe in all_recipes:
-            # Get all ingredient names from recipe (lowercase for case-insensitive matching)
-            recipe_ingredients = [ing['name'].lower() for ing in recipe.get('ingredients', [])]
-            
-            # Check if recipe contains ALL included ingredients
-            if include_list:
-                has_all_included = all(
-                    any(include_ing in recipe_ing for recipe_ing in recipe_ingredients)
-                    for include_ing in include_list
-                )
-                if not has_all_included:
-                    continue  # Skip this recipe
-            
-            # Check if recipe contains ANY excluded ingredients
-            if exclude_list:
-                has_any_excluded = any(
-                    any(exclude_ing in recipe_ing for recipe_ing in recipe_ingredients)
-                    for exclude_ing in exclude_list
-                )
-                if has_any_excluded:
-                    continue  # Skip this recipe
-            
-            # Recipe passed all filters
-            filtered_recipes.append(recipe)
+        predicate = None
+        if include_list or exclude_list:
+            predicate = lambda recipe: recipe_matches_ingredients(recipe, include_list, exclude_list)
         
-        all_recipes = filtered_recipes
+        try:
+            all_recipes, next_cursor = await paginate_recipe_sources(
+                sources, page_size, cursor, projection, predicate
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    else:
+        snapshot = None
+        if search:
+            system_recipes = await db.recipes.find(system_query, projection).to_list(1000)
+        else:
+            # Serve system recipes from the in-memory catalog; the remaining
+            # filters are plain equality matches
+            snapshot = await catalog_cache.get_snapshot()
+            system_recipes = [
+                dict(r) for r in (snapshot.recipes if is_admin else snapshot.published)
+                if r.get('author') == 'system' and all(r.get(key) == value for key, value in query.items())
+            ][:1000]
+            translated_views = snapshot.translated(lang)
+        if is_admin:
+            logger.info(f"[RECIPES] Admin user, returning {len(system_recipes)} system recipes (all)")
+        else:
+            logger.info(f"[RECIPES] Non-admin user, returning {len(system_recipes)} published system recipes")
+        
+        published_user_recipes = await db.user_recipes.find(published_query, projection).to_list(1000)
+        
+        own_recipes = []
+        for own_query in own_queries:
+            own_recipes += await db.user_recipes.find(own_query, projection).to_list(1000)
+        
+        keyed_recipes = [(("recipes", r['id']), r) for r in system_recipes]
+        keyed_recipes += [(("user_recipes", r['id']), r) for r in published_user_recipes + own_recipes]
+        
+        # Filter by author if specified
+        if author:
+            keyed_recipes = [(key, r) for key, r in keyed_recipes if r.get('author') == author]
+        
+        # Filter by ingredients if specified (bitset lookups in the ingredient index;
+        # cached system recipes are indexed once per catalog snapshot)
+        if include_list or exclude_list:
+            if snapshot is not None:
+                ingredient_index.sync_snapshot("recipes", snapshot, snapshot.recipes)
+            for key, recipe in keyed_recipes:
+                if snapshot is None or key[0] != "recipes":
+                    ingredient_index.sync(key, recipe)
+            all_recipes = ingredient_index.filter(keyed_recipes, include_list, exclude_list)
+        else:
+            all_recipes = [recipe for _, recipe in keyed_recipes]
     
     # Parse datetime
     for recipe in all_recipes:
         if isinstance(recipe.get('created_at'), str):
             recipe['created_at'] = datetime.fromisoformat(recipe['created_at'])
     
-    # IMPORTANT: Sort recipes so FREE recipes appear FIRST
-    # This ensures guests see free recipes before locked ones on homepage
-    all_recipes.sort(key=lambda r: (
-        # Primary sort: Free recipes first (is_free=True comes before is_free=False)
-        not r.get('is_free', False),
-        # Secondary sort: Newest first
-        -(r.get('created_at', datetime.min.replace(tzinfo=timezone.utc)).timestamp())
-    ))
+    if limit is None and cursor is None:
+        # IMPORTANT: Sort recipes so FREE recipes appear FIRST
+        # This ensures guests see free recipes before locked ones on homepage
+        # (paginated results are already merged in this order)
+        all_recipes.sort(key=lambda r: (
+            # Primary sort: Free recipes first (is_free=True comes before is_free=False)
+            not r.get('is_free', False),
+            # Secondary sort: Newest first
+            -(r.get('created_at', datetime.min.replace(tzinfo=timezone.utc)).timestamp())
+        ))
     
     # Add favorite and rating info + author name for user recipes
-    if session_id:
-        favorites = await db.favorites.find({"session_id": session_id}, {"_id": 0}).to_list(1000)
-        favorite_ids = {fav['recipe_id'] for fav in favorites}
-        
-        for recipe in all_recipes:
-            recipe['is_favorite'] = recipe['id'] in favorite_ids
-            
-            # Get user rating
-            rating = await db.ratings.find_one(
-                {"session_id": session_id, "recipe_id": recipe['id']},
-                {"_id": 0}
-            )
-            recipe['user_rating'] = rating.get('stars') if rating else None
-            
-            # Add author name for user-created recipes
-            if recipe.get('author') and recipe.get('author') != 'system':
-                author_user = await db.users.find_one({"id": recipe['author']}, {"_id": 0, "name": 1})
-                if author_user:
-                    recipe['author_name'] = author_user.get('name', 'Ukendt')
-                    # Count author's published recipes for badge system
-                    author_recipe_count = await db.user_recipes.count_documents({
-                        "author": recipe['author'],
-                        "is_published": True,
-                        "approval_status": "approved"
-                    })
-                    recipe['author_recipe_count'] = author_recipe_count
-                else:
-                    recipe['author_name'] = 'Ukendt'
-                    recipe['author_recipe_count'] = 0
-    else:
-        # Even without session_id, add author names for display
-        for recipe in all_recipes:
-            if recipe.get('author') and recipe.get('author') != 'system':
-                author_user = await db.users.find_one({"id": recipe['author']}, {"_id": 0, "name": 1})
-                if author_user:
-                    recipe['author_name'] = author_user.get('name', 'Ukendt')
-                    # Count author's published recipes for badge system
-                    author_recipe_count = await db.user_recipes.count_documents({
-                        "author": recipe['author'],
-                        "is_published": True,
-                        "approval_status": "approved"
-                    })
-                    recipe['author_recipe_count'] = author_recipe_count
-                else:
-                    recipe['author_name'] = 'Ukendt'
-                    recipe['author_recipe_count'] = 0
-    
-    # Apply translations to all recipes
-    all_recipes = [apply_translation(recipe, lang) for recipe in all_recipes]
+    # (bulk lookups, so the number of queries does not grow with the catalog)
+    await enrich_recipes(db, all_recipes, session_id)
     
-    return all_recipes
+    # Apply translations to all recipes (reusing the precomputed per-language
+    # view for system recipes and adding this request's enrichment on top).
+    # Only admins (translation editor) or an explicit fields=translations
+    # get the texts of every language.
+    keep_translations = is_admin or (requested_fields is not None and "translations" in requested_fields)
+    
+    def translate(recipe):
+        view = translated_views.get(recipe['id']) if recipe.get('author') == 'system' else None
+        if view is None:
+            return apply_translation(recipe, lang, include_translations=keep_translations)
+        view = {**view, **{key: recipe[key] for key in ENRICHMENT_FIELDS if key in recipe}}
+        return with_translations(view, recipe) if keep_translations else view
+    
+    all_recipes = [trim_fields(translate(recipe), requested_fields) for recipe in all_recipes]
+    
+    if limit is None and cursor is None:
+        return all_recipes
+    
+    return {
+        "recipes": all_recipes,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
+    }
 
 @api_router.get("/recipes/{recipe_id}")
 async def get_recipe(recipe_id: str, session_id: Optional[str] = None, request: Request = None, lang: str = "da"):
@@ -3466,43 +1897,11 @@ async def get_recipe(recipe_id: str, session_id: Optional[str] = None, request:
             logger.debug(f"Recipe view - Authentication failed: {str(e)}")
             pass
     
-    # Try system recipes first
-    recipe = await db.recipes.find_one({"id": recipe_id}, {"_id": 0})
-    
-    # If system recipe found, check if user has access
-    if recipe:
-        is_admin = user and user.role == "admin"
-        is_published = recipe.get("is_published", False)
-        
-        # Non-admin users can only see published system recipes
-        if not is_admin and not is_published:
-            raise HTTPException(status_code=404, detail="Recipe not found")
-    
-    # Try user recipes if not found in system recipes
-    if not recipe:
-        # First, try to find approved user recipes (public to all)
-        approved_recipe = await db.user_recipes.find_one({
-            "id": recipe_id,
-            "approval_status": "approved"
-        }, {"_id": 0})
-        
-        if approved_recipe:
-            recipe = approved_recipe
-        elif session_id:
-            # If not approved, search by session_id OR author (for logged-in users)
-            query = {"id": recipe_id}
-            if user:
-                # If logged in, search by author (user.id) or session_id
-                query["$or"] = [
-                    {"session_id": session_id},
-                    {"author": user.id},
-                    {"author": user.email}
-                ]
-            else:
-                # If guest, search by session_id only
-                query["session_id"] = session_id
-                
-            recipe = await db.user_recipes.find_one(query, {"_id": 0})
+    # One lookup in whichever collection holds the recipe, then check access:
+    # non-admins only see published system recipes; user recipes must be
+    # approved or belong to the session / logged-in author
+    resolved = await find_recipe(recipe_id)
+    recipe = resolved.recipe if resolved and is_visible(resolved, user, session_id) else None
     
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
@@ -3525,42 +1924,27 @@ async def get_recipe(recipe_id: str, session_id: Optional[str] = None, request:
         recipe['user_rating'] = rating.get('stars') if rating else None
     
     # Add author name for user-created recipes
-    if recipe.get('author') and recipe.get('author') != 'system':
-        author_user = await db.users.find_one({"id": recipe['author']}, {"_id": 0, "name": 1})
-        if author_user:
-            recipe['author_name'] = author_user.get('name', 'Ukendt')
-            # Count author's published recipes for badge system
-            author_recipe_count = await db.user_recipes.count_documents({
-                "author": recipe['author'],
-                "is_published": True,
-                "approval_status": "approved"
-            })
-            recipe['author_recipe_count'] = author_recipe_count
-        else:
-            recipe['author_name'] = 'Ukendt'
-            recipe['author_recipe_count'] = 0
-    
-    # Increment view count (only for system recipes)
-    if recipe.get('author') == 'system':
-        await db.recipes.update_one(
-            {"id": recipe_id},
-            {"$inc": {"view_count": 1}}
-        )
+    await attach_author_info(db, [recipe])
     
+    # Increment view count (only for system recipes) - buffered, written in batches
     # ===== TEMPORARY: Track recipe views for testing period =====
-    # TODO: Remove this before final production release
+    # TODO: Remove the recipe_views event before final production release
+    view_event = None
     if user:
-        await db.recipe_views.insert_one({
+        view_event = {
             "user_id": user.id,
             "user_email": user.email,
             "recipe_id": recipe_id,
             "recipe_name": recipe.get('name', ''),
             "timestamp": datetime.now(timezone.utc).isoformat()
-        })
+        }
     # ===== END TEMPORARY =====
+    recipe_view_buffer.record(recipe_id, recipe.get('author') == 'system', view_event)
+    if recipe_view_buffer.pending_count >= recipe_view_buffer.max_pending:
+        await recipe_view_buffer.flush(db)
     
-    # Apply translation
-    recipe = apply_translation(recipe, lang)
+    # Apply translation (the other languages are only sent to admins)
+    recipe = apply_translation(recipe, lang, include_translations=bool(user and user.role == "admin"))
     
     return recipe
 
@@ -3577,15 +1961,14 @@ async def delete_recipe(recipe_id: str, request: Request):
         )
     
     # Check if recipe exists and get it
-    recipe = await db.recipes.find_one({"id": recipe_id})
-    if not recipe:
-        recipe = await db.user_recipes.find_one({"id": recipe_id})
+    resolved = await find_recipe(recipe_id)
     
-    if not recipe:
+    if not resolved:
         raise HTTPException(
             status_code=404,
             detail="Opskrift ikke fundet"
         )
+    recipe = resolved.recipe
     
     # Check if user is admin OR the recipe author
     is_admin = user.role == "admin"
@@ -3597,12 +1980,13 @@ async def delete_recipe(recipe_id: str, request: Request):
             detail="Du kan kun slette dine egne opskrifter"
         )
     
-    # Delete recipe from main recipes collection
-    result = await db.recipes.delete_one({"id": recipe_id})
-    
-    # Also try to delete from user_recipes if it exists there
-    if result.deleted_count == 0:
-        result = await db.user_recipes.delete_one({"id": recipe_id})
+    # Delete recipe from the collection it was found in
+    if resolved.is_system:
+        await db.recipes.delete_one({"id": recipe_id})
+        catalog_cache.invalidate()
+    else:
+        await db.user_recipes.delete_one({"id": recipe_id})
+        ingredient_index.remove(("user_recipes", recipe_id))
     
     # Clean up related data
     await db.favorites.delete_many({"recipe_id": recipe_id})
@@ -3681,6 +2065,7 @@ async def create_recipe(recipe_data: RecipeCreate, request: Request):
     doc['created_at'] = doc['created_at'].isoformat()
     
     await db.user_recipes.insert_one(doc)
+    catalog_cache.invalidate()
     
     # Check for badge achievement (only for registered users, not guests)
     if user and user.id == author_id:
@@ -3724,21 +2109,17 @@ async def create_recipe(recipe_data: RecipeCreate, request: Request):
     # Create notification for all pro users when a new recipe is published
     if recipe.is_published and recipe.approval_status == 'approved':
         try:
-            # Get all pro/admin users except the author
-            users = await db.users.find({
-                "role": {"$in": ["pro", "admin", "editor"]},
-                "id": {"$ne": author_id}
-            }, {"_id": 0, "id": 1}).to_list(length=None)
-            
-            for user_doc in users:
-                await create_notification(
-                    user_id=user_doc["id"],
-                    type="new_recipe",
-                    title="Ny opskrift tilgængelig!",
-                    message=f'{author_name} har delt en ny opskrift: "{recipe.name}"',
-                    link=f"/recipes/{recipe.id}",
-                    data={"recipe_id": recipe.id, "author_id": author_id}
-                )
+            # One broadcast to all pro/admin users except the author
+            await broadcast_notifications.create_broadcast(
+                db,
+                type="new_recipe",
+                title="Ny opskrift tilgængelig!",
+                message=f'{author_name} har delt en ny opskrift: "{recipe.name}"',
+                link=f"/recipes/{recipe.id}",
+                data={"recipe_id": recipe.id, "author_id": author_id},
+                roles=["pro", "admin", "editor"],
+                exclude_user_ids=[author_id]
+            )
         except Exception as e:
             logger.error(f"Failed to create new recipe notifications: {e}")
     
@@ -3749,14 +2130,13 @@ async def update_recipe(recipe_id: str, recipe_data: RecipeCreate, request: Requ
     # Get current user
     user = await get_current_user(request, None, db)
     
-    # Check if recipe exists in user_recipes first
-    existing_user = await db.user_recipes.find_one({"id": recipe_id})
+    # Find the recipe (system recipes take precedence over user recipes)
+    resolved = await find_recipe(recipe_id)
     
-    # Check if it's a system recipe
-    existing_system = await db.recipes.find_one({"id": recipe_id})
-    
-    if not existing_user and not existing_system:
+    if not resolved:
         raise HTTPException(status_code=404, detail="Recipe not found")
+    existing_system = resolved.recipe if resolved.is_system else None
+    existing_user = None if resolved.is_system else resolved.recipe
     
     recipe_dict = recipe_data.model_dump()
     session_id = recipe_dict.pop('session_id')
@@ -3837,6 +2217,7 @@ async def update_recipe(recipe_id: str, recipe_data: RecipeCreate, request: Requ
         {"id": recipe_id},
         doc
     )
+    catalog_cache.invalidate()
     
     return recipe
 
@@ -3851,17 +2232,12 @@ async def update_recipe_translations(recipe_id: str, body: RecipeTranslationsUpd
     
     translations = body.translations
     
-    # Check if recipe exists in system recipes FIRST
-    existing = await db.recipes.find_one({"id": recipe_id})
-    is_system_recipe = existing is not None
+    # Find the recipe (system recipes FIRST, then user_recipes)
+    resolved = await find_recipe(recipe_id)
     
-    # If not found in system recipes, check user_recipes
-    if not existing:
-        existing = await db.user_recipes.find_one({"id": recipe_id})
-        is_system_recipe = False
-    
-    if not existing:
+    if not resolved:
         raise HTTPException(status_code=404, detail="Recipe not found")
+    is_system_recipe = resolved.is_system
     
     # Only admin can edit recipes
     if not user or user.role != "admin":
@@ -3876,6 +2252,7 @@ async def update_recipe_translations(recipe_id: str, body: RecipeTranslationsUpd
             {"id": recipe_id},
             {"$set": {"translations": translations}}
         )
+        catalog_cache.invalidate()
         updated = await db.recipes.find_one({"id": recipe_id}, {"_id": 0})
     else:
         await db.user_recipes.update_one(
@@ -3890,58 +2267,43 @@ class RecipeImportRequest(BaseModel):
     recipes: List[dict]
 
 @api_router.post("/admin/import-recipes-bulk")
-async def import_recipes_bulk(data: RecipeImportRequest, request: Request):
+async def import_recipes_bulk(data: RecipeImportRequest, request: Request, dry_run: bool = False):
     """
     Import/update multiple recipes at once (Admin only)
     Updates existing recipes or creates new ones based on ID
+    With dry_run=true nothing is written; the report shows what would happen
     """
     user = await get_current_user(request, None, db)
     if not user or user.role != "admin":
         raise HTTPException(status_code=403, detail="Kun admin kan importere opskrifter")
     
-    created = 0
-    updated = 0
-    errors = 0
+    importer = RecipeImport("recipes", key_field="id", existing_projection={"_id": 0, "id": 1})
+    report = await importer.run(db, data.recipes, dry_run=dry_run)
+    
     details = []
+    for result in report.results:
+        if result["status"] == "created":
+            details.append(f"✨ Oprettet: {result['name']}")
+        elif result["status"] == "updated":
+            details.append(f"✅ Opdateret: {result['name']}")
+        elif result.get("id"):
+            details.append(f"❌ {result['name']}: {result['error']}")
+        else:
+            details.append(f"⚠️ {result['name']}: {result['error']}")
     
-    for recipe_data in data.recipes:
-        recipe_id = recipe_data.get('id')
-        recipe_name = recipe_data.get('name', 'Unknown')
-        
-        if not recipe_id:
-            errors += 1
-            details.append(f"⚠️ {recipe_name}: Mangler ID")
-            continue
-        
-        try:
-            # Check if exists
-            existing = await db.recipes.find_one({'id': recipe_id})
-            
-            if existing:
-                # Update existing
-                await db.recipes.replace_one(
-                    {'id': recipe_id},
-                    recipe_data
-                )
-                updated += 1
-                details.append(f"✅ Opdateret: {recipe_name}")
-            else:
-                # Create new
-                await db.recipes.insert_one(recipe_data)
-                created += 1
-                details.append(f"✨ Oprettet: {recipe_name}")
-        
-        except Exception as e:
-            errors += 1
-            details.append(f"❌ {recipe_name}: {str(e)}")
+    if not dry_run:
+        catalog_cache.invalidate()
     
+    created, updated, errors = report.created, report.updated, report.errors
     return {
         "success": errors == 0,
-        "message": f"Import færdig: {created} oprettet, {updated} opdateret, {errors} fejl",
+        "message": f"{'Prøveimport' if dry_run else 'Import'} færdig: {created} oprettet, {updated} opdateret, {errors} fejl",
         "created": created,
         "updated": updated,
         "errors": errors,
-        "details": details[:50]  # Limit to first 50 details
+        "dry_run": dry_run,
+        "details": details[:50],  # Limit to first 50 details
+        "results": report.results
     }
 
 @api_router.delete("/recipes/{recipe_id}")
@@ -3953,6 +2315,8 @@ async def delete_recipe(recipe_id: str, session_id: str):
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Recipe not found or not owned by you")
     
+    ingredient_index.remove(("user_recipes", recipe_id))
+    
     return {"message": "Recipe deleted"}
 
 # Pantry
@@ -4023,6 +2387,8 @@ async def delete_pantry_item(
     return {"message": "Ingredient removed from pantry"}
 
 # Matching
+MATCH_BATCH_SIZE = 200
+
 @api_router.post("/match")
 async def match_recipes(request: MatchRequest):
     # Get user pantry
@@ -4036,10 +2402,8 @@ async def match_recipes(request: MatchRequest):
     
     # Get all recipes that user has access to
     # System recipes: Only published ones (unless user is admin)
-    recipes = await db.recipes.find(
-        {"author": "system", "is_published": True}, 
-        {"_id": 0}
-    ).to_list(1000)
+    snapshot = await catalog_cache.get_snapshot()
+    catalog_matcher = snapshot.derived("pantry_matcher", lambda: PantryMatcher(snapshot.published[:1000]))
     
     # User recipes: User's own recipes + approved public recipes
     user_recipes_query = {
@@ -4048,50 +2412,44 @@ async def match_recipes(request: MatchRequest):
             {"approval_status": "approved"}  # Approved public recipes
         ]
     }
-    user_recipes = await db.user_recipes.find(user_recipes_query, {"_id": 0}).to_list(1000)
-    
-    all_recipes = recipes + user_recipes
-    
-    # Calculate matches
-    matches = []
-    for recipe in all_recipes:
-        match_result = calculate_match_score(recipe, pantry_items)
-        matches.append({
-            "recipe": recipe,
-            "match": match_result
-        })
-    
-    # Sort by score
-    matches.sort(key=lambda x: x['match']['score'], reverse=True)
-    
-    # Categorize - Show recipes where user has AT LEAST ONE ingredient
-    # Sort by how many ingredients they have (most matches first)
-    recipes_with_matches = [m for m in matches if len(m['match']['have']) > 0]
-    recipes_with_matches.sort(key=lambda x: (len(x['match']['have']), -len(x['match']['missing'])), reverse=True)
     
-    can_make = [m for m in recipes_with_matches if m['match']['can_make_now']]
-    has_some = [m for m in recipes_with_matches if not m['match']['can_make_now']]
+    # Score in vectorized batches and keep only the best 50 per category while
+    # streaming; the catalog comes first so ties keep the original order
+    pantry_names = [item['ingredient_name'] for item in pantry_items]
+    top_matches = TopMatches(limit=50)
+    top_matches.add(catalog_matcher.score(pantry_names))
+    
+    batch = []
+    cursor = db.user_recipes.find(user_recipes_query, {"_id": 0}).limit(1000).batch_size(MATCH_BATCH_SIZE)
+    async for recipe in cursor:
+        batch.append(recipe)
+        if len(batch) == MATCH_BATCH_SIZE:
+            top_matches.add(PantryMatcher(batch).score(pantry_names))
+            batch = []
+    if batch:
+        top_matches.add(PantryMatcher(batch).score(pantry_names))
+    
+    # Categorize - Show recipes where user has AT LEAST ONE ingredient,
+    # most matched ingredients first
+    can_make, has_some, total_matches = top_matches.results()
     
     return {
-        "can_make_now": can_make[:50],  # Increased limit
-        "almost": has_some[:50],  # These are recipes where user has some ingredients
+        "can_make_now": can_make,
+        "almost": has_some,  # These are recipes where user has some ingredients
         "need_more": [],  # Not used
-        "total_matches": len(recipes_with_matches)
+        "total_matches": total_matches
     }
 
 # Scaling
 @api_router.post("/scale")
 async def scale_recipe_endpoint(request: ScaleRequest):
     # Get recipe
-    recipe = await db.recipes.find_one({"id": request.recipe_id}, {"_id": 0})
+    resolved = await find_recipe(request.recipe_id)
     
-    if not recipe:
-        recipe = await db.user_recipes.find_one({"id": request.recipe_id}, {"_id": 0})
-    
-    if not recipe:
+    if not resolved:
         raise HTTPException(status_code=404, detail="Recipe not found")
     
-    scaled = scale_recipe(recipe, request.target_volume_ml, request.margin_pct)
+    scaled = scale_recipe(resolved.recipe, request.target_volume_ml, request.margin_pct)
     return scaled
 
 # Machines
@@ -4157,7 +2515,9 @@ async def get_favorites(
     recipe_ids = [fav['recipe_id'] for fav in favorites]
     
     # Get system recipes
-    recipes = await db.recipes.find({"id": {"$in": recipe_ids}}, {"_id": 0}).to_list(1000)
+    snapshot = await catalog_cache.get_snapshot()
+    favorite_ids = set(recipe_ids)
+    recipes = [dict(r) for r in snapshot.recipes if r.get('id') in favorite_ids][:1000]
     
     # Get user recipes - include approved recipes (public) OR own recipes
     user_recipes = await db.user_recipes.find(
@@ -4179,7 +2539,7 @@ async def get_favorites(
         recipe['is_favorite'] = True
     
     # Apply translations (use 'da' as default for favorites)
-    all_recipes = [apply_translation(recipe, "da") for recipe in all_recipes]
+    all_recipes = [apply_translation(recipe, "da", include_translations=False) for recipe in all_recipes]
     
     return all_recipes
 
@@ -4206,7 +2566,8 @@ async def add_favorite(
     
     # Create notification for recipe author
     try:
-        recipe = await db.recipes.find_one({"id": recipe_id}, {"_id": 0, "author": 1, "name": 1})
+        resolved = await find_recipe(recipe_id, {"_id": 0, "author": 1, "name": 1})
+        recipe = resolved.recipe if resolved else None
         if recipe and recipe.get("author") and recipe["author"] != user.id:
             # Only notify if favorite is not from the recipe author themselves
             await create_notification(
@@ -4291,9 +2652,11 @@ async def create_rating(rating_data: RatingCreate):
 async def get_comments(
     recipe_id: str,
     language: Optional[str] = None,
+    limit: Optional[int] = None,  # Page size - enables paginated response
+    cursor: Optional[str] = None,  # next_cursor from the previous page
     user: Optional[User] = Depends(get_current_user_with_db)
 ):
-    """Get all visible comments for a recipe, filtered by language"""
+    """Get visible comments for a recipe, newest first, filtered by language"""
     query = {
         "recipe_id": recipe_id,
         "status": "visible"
@@ -4304,7 +2667,25 @@ async def get_comments(
     if language:
         query["language"] = language
     
-    comments = await db.recipe_comments.find(query, {"_id": 0}).to_list(1000)
+    paginated = limit is not None or cursor is not None
+    page_size = max(1, min(limit or comment_threads.DEFAULT_PAGE_SIZE, comment_threads.MAX_PAGE_SIZE)) if paginated else 1000
+    if cursor:
+        try:
+            query = {"$and": [query, older_than(*decode_position(cursor))]}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    # Sorted by the (recipe_id, status, created_at, id) index; one extra tells whether more follow
+    comments = await db.recipe_comments.find(
+        query, comment_threads.COMMENT_PROJECTION
+    ).sort(NEWEST_FIRST).limit(page_size + 1 if paginated else page_size).to_list(length=None)
+    
+    next_cursor = None
+    if paginated and len(comments) > page_size:
+        comments = comments[:page_size]
+        next_cursor = encode_position(comments[-1])
+    
+    await comment_threads.attach_viewer_likes(db, comments, user.id if user else None)
     
     # Parse dates
     for comment in comments:
@@ -4313,10 +2694,15 @@ async def get_comments(
         if isinstance(comment.get('updated_at'), str):
             comment['updated_at'] = datetime.fromisoformat(comment['updated_at'])
     
-    # Sort by newest first
-    comments.sort(key=lambda x: x['created_at'], reverse=True)
+    if not paginated:
+        return comments
     
-    return comments
+    return {
+        "comments": comments,
+        "comment_count": await comment_threads.comment_count(db, recipe_id),
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
+    }
 
 @api_router.get("/admin/comments/all")
 async def get_all_comments_admin(
@@ -4340,44 +2726,35 @@ async def get_all_comments_admin(
     
     comments = await db.recipe_comments.find(query, {"_id": 0}).to_list(10000)
     
-    # Parse dates, fix missing languages, and enrich with recipe info
+    # Missing languages (backward compatibility) and recipe names in two batched lookups;
+    # storing the languages is left to POST /admin/comments/backfill-language
+    await enrich_admin_comments(db, comments)
+    
+    # Parse dates
     for comment in comments:
-        # Fix missing language field (backward compatibility)
-        if 'language' not in comment or not comment.get('language'):
-            # Try to detect from user
-            comment_user = await db.users.find_one({"id": comment['user_id']}, {"_id": 0, "country": 1})
-            if comment_user and comment_user.get('country'):
-                country_to_lang = {
-                    'DK': 'da',
-                    'DE': 'de',
-                    'FR': 'fr',
-                    'GB': 'en',
-                    'US': 'en-US',
-                }
-                comment['language'] = country_to_lang.get(comment_user['country'], 'da')
-            else:
-                comment['language'] = 'da'  # Default to Danish
-            
-            # Update in database for future
-            await db.recipe_comments.update_one(
-                {"id": comment['id']},
-                {"$set": {"language": comment['language']}}
-            )
-        
         if isinstance(comment.get('created_at'), str):
             comment['created_at'] = datetime.fromisoformat(comment['created_at'])
         if isinstance(comment.get('updated_at'), str):
             comment['updated_at'] = datetime.fromisoformat(comment['updated_at'])
-        
-        # Add recipe name
-        recipe = await db.recipes.find_one({"id": comment['recipe_id']}, {"_id": 0, "name": 1})
-        comment['recipe_name'] = recipe['name'] if recipe else "Unknown"
     
     # Sort by newest first
     comments.sort(key=lambda x: x['created_at'], reverse=True)
     
     return comments
 
+@api_router.post("/admin/comments/backfill-language")
+async def start_comment_language_backfill(user: User = Depends(require_role(["admin"], db))):
+    """Admin: Store the detected language on old comments (poll GET /admin/comments/backfill-language/{job_id})"""
+    return comment_backfill_jobs.running() or comment_backfill_jobs.start(lambda job: backfill_comment_languages(db, job))
+
+@api_router.get("/admin/comments/backfill-language/{job_id}")
+async def get_comment_language_backfill(job_id: str, user: User = Depends(require_role(["admin"], db))):
+    """Admin: Progress of a comment language backfill job"""
+    job = comment_backfill_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Backfill job not found")
+    return job
+
 @api_router.post("/comments", response_model=Comment)
 async def create_comment(
     comment_data: CommentCreate,
@@ -4411,13 +2788,16 @@ async def create_comment(
     # Save to database
     doc = comment.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
+    doc.pop('liked_by', None)  # Likes live in db.comment_likes
     await db.recipe_comments.insert_one(doc)
+    await comment_threads.adjust_comment_count(db, comment.recipe_id, 1)
     
     logger.info(f"Comment created by {user.name} on recipe {comment_data.recipe_id} in {language}")
     
     # Create notification for recipe author
     try:
-        recipe = await db.recipes.find_one({"id": comment_data.recipe_id}, {"_id": 0, "author": 1, "name": 1})
+        resolved = await find_recipe(comment_data.recipe_id, {"_id": 0, "author": 1, "name": 1})
+        recipe = resolved.recipe if resolved else None
         if recipe and recipe.get("author") and recipe["author"] != user.id:
             # Only notify if comment is not from the recipe author themselves
             await create_notification(
@@ -4485,6 +2865,9 @@ async def delete_comment(
     
     # Delete comment
     await db.recipe_comments.delete_one({"id": comment_id})
+    await db.comment_likes.delete_many({"comment_id": comment_id})
+    if existing.get('status') == "visible":
+        await comment_threads.adjust_comment_count(db, existing['recipe_id'], -1)
     
     logger.info(f"Comment {comment_id} deleted by {user.name}")
     
@@ -4497,31 +2880,15 @@ async def toggle_comment_like(
 ):
     """Toggle like on a comment"""
     # Find comment
-    comment = await db.recipe_comments.find_one({"id": comment_id})
+    comment = await db.recipe_comments.find_one({"id": comment_id}, {"_id": 0, "id": 1})
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    liked_by = comment.get('liked_by', [])
-    
-    if user.id in liked_by:
-        # Unlike
-        liked_by.remove(user.id)
-        action = "unliked"
-    else:
-        # Like
-        liked_by.append(user.id)
-        action = "liked"
-    
-    # Update in database
-    await db.recipe_comments.update_one(
-        {"id": comment_id},
-        {"$set": {
-            "liked_by": liked_by,
-            "likes": len(liked_by)
-        }}
-    )
+    # One like document per user - no array rewrite
+    liked, likes = await comment_threads.toggle_like(db, comment_id, user.id)
+    action = "liked" if liked else "unliked"
     
-    return {"message": f"Comment {action}", "likes": len(liked_by)}
+    return {"message": f"Comment {action}", "likes": likes}
 
 @api_router.put("/comments/{comment_id}/hide")
 async def hide_comment(
@@ -4537,10 +2904,12 @@ async def hide_comment(
     # Toggle status
     new_status = "hidden" if comment.get('status') == "visible" else "visible"
     
-    await db.recipe_comments.update_one(
-        {"id": comment_id},
+    result = await db.recipe_comments.update_one(
+        {"id": comment_id, "status": comment.get('status')},
         {"$set": {"status": new_status}}
     )
+    if result.modified_count:
+        await comment_threads.adjust_comment_count(db, comment['recipe_id'], 1 if new_status == "visible" else -1)
     
     logger.info(f"Comment {comment_id} set to {new_status} by admin {user.name}")
     
@@ -4554,9 +2923,11 @@ async def get_tips(
     language: Optional[str] = None,
     country: Optional[str] = None,
     show_international: bool = True,
+    limit: Optional[int] = None,  # Page size - enables paginated response
+    cursor: Optional[str] = None,  # next_cursor from the previous page
     user: Optional[User] = Depends(get_current_user_with_db)
 ):
-    """Get all approved tips with optional filters"""
+    """Get approved tips with optional filters, best ranked (likes and recency) first"""
     query = {"is_public": True, "approval_status": "approved"}
     
     if category:
@@ -4584,19 +2955,32 @@ async def get_tips(
         query["language"] = language
     # else: show all approved tips (no country filter)
     
-    tips = await db.tips_and_tricks.find(query, {"_id": 0}).to_list(10000)
-    
-    # Parse dates
-    for tip in tips:
-        if isinstance(tip.get('created_at'), str):
-            tip['created_at'] = datetime.fromisoformat(tip['created_at'])
-        if isinstance(tip.get('updated_at'), str):
-            tip['updated_at'] = datetime.fromisoformat(tip['updated_at'])
+    page_size = tips_feed.page_size(limit)
+    # First pages are cached per filter combination (the query) and page size
+    cache_key = json.dumps([query, page_size], sort_keys=True) if not cursor else None
+    if cache_key:
+        cached = tips_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        cache_version = tips_cache.version
     
-    # Sort by likes (most liked first), then by newest
-    tips.sort(key=lambda x: (-x.get('likes', 0), -x['created_at'].timestamp()))
+    # Sorted on the stored rank_score by the compound index for this filter
+    try:
+        tips, next_cursor = await tips_feed.read_page(db, query, "rank_score", page_size, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return tips
+    if page_size is None and cursor is None:
+        result = tips
+    else:
+        result = {
+            "tips": tips,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        }
+    if cache_key:
+        tips_cache.put(cache_key, result, cache_version)
+    return result
 
 @api_router.post("/tips", response_model=Tip)
 async def create_tip(
@@ -4626,7 +3010,9 @@ async def create_tip(
     # Save to database
     doc = tip.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
+    doc['rank_score'] = tips_feed.rank_score(doc)
     await db.tips_and_tricks.insert_one(doc)
+    tips_cache.invalidate()
     
     logger.info(f"Tip created by {user.name}: {tip.title}")
     
@@ -4653,6 +3039,8 @@ async def upload_tip_image(
         raise HTTPException(status_code=400, detail="File must be an image")
     
     try:
+        from PIL import Image
+        
         # Read image
         contents = await file.read()
         image = Image.open(io.BytesIO(contents))
@@ -4710,6 +3098,7 @@ async def upload_tip_image(
             {"id": tip_id},
             {"$set": {"image_url": image_url}}
         )
+        tips_cache.invalidate()
         
         logger.info(f"Image uploaded for tip {tip_id}: {filename} ({size} bytes)")
         
@@ -4748,6 +3137,7 @@ async def update_tip(
     
     # Update in database
     await db.tips_and_tricks.update_one({"id": tip_id}, {"$set": update_data})
+    tips_cache.invalidate()
     
     # Return updated tip
     updated = await db.tips_and_tricks.find_one({"id": tip_id}, {"_id": 0})
@@ -4775,6 +3165,7 @@ async def delete_tip(
     
     # Delete tip
     await db.tips_and_tricks.delete_one({"id": tip_id})
+    tips_cache.invalidate()
     
     logger.info(f"Tip {tip_id} deleted by {user.name}")
     
@@ -4802,62 +3193,57 @@ async def toggle_tip_like(
         liked_by.append(user.id)
         action = "liked"
     
-    # Update in database
+    # Update in database (the ranking moves with the likes)
     await db.tips_and_tricks.update_one(
         {"id": tip_id},
         {"$set": {
             "liked_by": liked_by,
-            "likes": len(liked_by)
+            "likes": len(liked_by),
+            "rank_score": tips_feed.rank_score(tip, likes=len(liked_by))
         }}
     )
+    tips_cache.invalidate()
     
     return {"message": f"Tip {action}", "likes": len(liked_by)}
 
 @api_router.get("/admin/tips/pending")
 async def get_pending_tips(
-    user: User = Depends(require_role(["admin", "editor"], db))
+    user: User = Depends(require_role(["admin", "editor"], db)),
+    limit: Optional[int] = None,  # Page size - enables paginated response
+    cursor: Optional[str] = None  # next_cursor from the previous page
 ):
-    """Admin: Get all pending tips"""
-    tips = await db.tips_and_tricks.find(
-        {"approval_status": "pending"},
-        {"_id": 0}
-    ).to_list(10000)
-    
-    # Parse dates
-    for tip in tips:
-        if isinstance(tip.get('created_at'), str):
-            tip['created_at'] = datetime.fromisoformat(tip['created_at'])
-        if isinstance(tip.get('updated_at'), str):
-            tip['updated_at'] = datetime.fromisoformat(tip['updated_at'])
-    
-    # Sort by newest first
-    tips.sort(key=lambda x: -x['created_at'].timestamp())
-    
-    return tips
+    """Admin: Get pending tips, newest first"""
+    return await admin_tips_page({"approval_status": "pending"}, limit, cursor)
 
 @api_router.get("/admin/tips/all")
 async def get_all_tips_admin(
     user: User = Depends(require_role(["admin", "editor"], db)),
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: Optional[int] = None,  # Page size - enables paginated response
+    cursor: Optional[str] = None  # next_cursor from the previous page
 ):
-    """Admin: Get all tips with optional status filter"""
+    """Admin: Get all tips with optional status filter, newest first"""
     query = {}
     if status:
         query["approval_status"] = status
     
-    tips = await db.tips_and_tricks.find(query, {"_id": 0}).to_list(10000)
-    
-    # Parse dates
-    for tip in tips:
-        if isinstance(tip.get('created_at'), str):
-            tip['created_at'] = datetime.fromisoformat(tip['created_at'])
-        if isinstance(tip.get('updated_at'), str):
-            tip['updated_at'] = datetime.fromisoformat(tip['updated_at'])
-    
-    # Sort by newest first
-    tips.sort(key=lambda x: -x['created_at'].timestamp())
+    return await admin_tips_page(query, limit, cursor)
+
+async def admin_tips_page(query: Dict, limit: Optional[int], cursor: Optional[str]):
+    """Admin tip lists: newest first, sorted by Mongo; paginated when limit/cursor is given"""
+    page_size = tips_feed.page_size(limit)
+    try:
+        tips, next_cursor = await tips_feed.read_page(db, query, "created_at", page_size, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return tips
+    if page_size is None and cursor is None:
+        return tips
+    return {
+        "tips": tips,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
+    }
 
 @api_router.put("/admin/tips/{tip_id}/approve")
 async def approve_tip(
@@ -4869,14 +3255,19 @@ async def approve_tip(
     if not tip:
         raise HTTPException(status_code=404, detail="Tip not found")
     
+    # Ranked from the moment it is published
+    approved_at = datetime.now(timezone.utc).isoformat()
     await db.tips_and_tricks.update_one(
         {"id": tip_id},
         {"$set": {
             "approval_status": "approved",
             "is_public": True,
-            "rejection_reason": None
+            "rejection_reason": None,
+            "approved_at": approved_at,
+            "rank_score": tips_feed.rank_score({**tip, "approved_at": approved_at})
         }}
     )
+    tips_cache.invalidate()
     
     logger.info(f"Tip {tip_id} approved by {user.name}")
     
@@ -4901,6 +3292,7 @@ async def reject_tip(
             "rejection_reason": reason
         }}
     )
+    tips_cache.invalidate()
     
     logger.info(f"Tip {tip_id} rejected by {user.name}")
     
@@ -5132,12 +3524,8 @@ async def get_products(category_key: Optional[str] = None):
 
 @api_router.post("/products/{product_id}/click")
 async def track_product_click(product_id: str):
-    result = await db.products.update_one(
-        {"id": product_id},
-        {"$inc": {"click_count": 1}}
-    )
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Product not found")
+    # Queued; unknown product ids are ignored when the batch is written
+    click_ingestor.increment("products", product_id, "click_count")
     return {"message": "Click tracked"}
 
 # Image upload
@@ -5165,7 +3553,7 @@ async def upload_image(file: UploadFile = File(...), folder: str = "recipes"):
             )
         
         # Upload to Cloudinary with dynamic folder
-        result = cloudinary.uploader.upload(
+        result = get_cloudinary().uploader.upload(
             file_content,
             folder=f"slushbook/{folder}",  # Organize in subfolders
             resource_type="auto",  # Auto-detect image type
@@ -5232,6 +3620,8 @@ async def update_recipe_images():
         if result.modified_count > 0:
             updated_count += 1
     
+    catalog_cache.invalidate()
+    
     return {"message": f"Updated {updated_count} recipes with images", "total_mapped": len(image_mappings)}
 
 # CSV Import for Admin
@@ -5333,10 +3723,11 @@ async def import_recipe_from_csv(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail=f"CSV parsing error: {str(e)}")
 
 @api_router.post("/admin/confirm-import")
-async def confirm_recipe_import(recipes: List[dict], request: Request):
+async def confirm_recipe_import(recipes: List[dict], request: Request, dry_run: bool = False):
     """
     Confirm and create recipes from CSV import (Admin only)
     Creates recipes under admin's account as approved but private
+    With dry_run=true nothing is written; the report shows what would happen
     """
     try:
         # Get admin user
@@ -5344,43 +3735,17 @@ async def confirm_recipe_import(recipes: List[dict], request: Request):
         if not user or user.role != "admin":
             raise HTTPException(status_code=403, detail="Admin only")
         
-        created_count = 0
-        updated_count = 0
-        
-        for recipe_data in recipes:
-            recipe_name = recipe_data.get('name', '')
-            
-            # Check if recipe already exists (by name and author)
-            existing = await db.user_recipes.find_one({
-                "name": recipe_name,
-                "author": user.id
-            })
-            
+        def prepare(recipe_data: dict, existing: Optional[dict]) -> dict:
             if existing:
-                # UPDATE existing recipe
-                recipe_id = existing['id']
-                
-                # Preserve some fields from existing
-                recipe_data['id'] = recipe_id
+                # UPDATE existing recipe - preserve some fields from existing
+                recipe_data['id'] = existing['id']
                 recipe_data['created_at'] = existing.get('created_at', datetime.now(timezone.utc))
                 recipe_data['rating_avg'] = existing.get('rating_avg', 0.0)
                 recipe_data['rating_count'] = existing.get('rating_count', 0)
                 recipe_data['view_count'] = existing.get('view_count', 0)
                 recipe_data['image_url'] = existing.get('image_url')  # Keep existing image
-                
-                # Update other fields
                 recipe_data['is_free'] = recipe_data.get('is_free', False)
                 recipe_data['is_published'] = existing.get('is_published', False)  # Keep publish status
-                recipe_data['author'] = user.id
-                recipe_data['author_name'] = user.name
-                recipe_data['approval_status'] = 'approved'
-                
-                await db.user_recipes.replace_one(
-                    {"id": recipe_id},
-                    recipe_data
-                )
-                updated_count += 1
-                logger.info(f"Updated existing recipe: {recipe_name}")
             else:
                 # INSERT new recipe
                 recipe_data['id'] = str(uuid.uuid4())
@@ -5390,22 +3755,42 @@ async def confirm_recipe_import(recipes: List[dict], request: Request):
                 recipe_data['view_count'] = 0
                 recipe_data['is_free'] = False
                 recipe_data['is_published'] = False
-                recipe_data['author'] = user.id
-                recipe_data['author_name'] = user.name
-                recipe_data['approval_status'] = 'approved'
-                
-                await db.user_recipes.insert_one(recipe_data)
-                created_count += 1
-                logger.info(f"Created new recipe: {recipe_name}")
+            recipe_data['author'] = user.id
+            recipe_data['author_name'] = user.name
+            recipe_data['approval_status'] = 'approved'
+            return recipe_data
+        
+        # Existing recipes are matched by name among the admin's own recipes
+        importer = RecipeImport(
+            "user_recipes",
+            key_field="name",
+            prepare=prepare,
+            scope={"author": user.id},
+            existing_projection={
+                "_id": 0, "id": 1, "name": 1, "created_at": 1, "rating_avg": 1, "rating_count": 1,
+                "view_count": 1, "image_url": 1, "is_published": 1
+            }
+        )
+        report = await importer.run(db, recipes, dry_run=dry_run)
+        created_count, updated_count = report.created, report.updated
+        logger.info(f"Recipe import{' (dry run)' if dry_run else ''}: {created_count} created, {updated_count} updated, {report.errors} errors")
+        
+        if not dry_run:
+            catalog_cache.invalidate()
         
         return {
-            'success': True,
+            'success': report.errors == 0,
             'message': f'Import complete: {created_count} created, {updated_count} updated',
             'count': created_count + updated_count,
             'created': created_count,
-            'updated': updated_count
+            'updated': updated_count,
+            'errors': report.errors,
+            'dry_run': dry_run,
+            'results': report.results
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Import error: {str(e)}")
 
@@ -5418,71 +3803,47 @@ async def export_recipes_csv(request: Request):
     if not user or user.role != "admin":
         raise HTTPException(status_code=403, detail="Admin only")
     
-    try:
-        import io
-        
-        # Get all recipes
-        recipes = await db.recipes.find({}, {"_id": 0}).to_list(length=None)
-        user_recipes = await db.user_recipes.find({}, {"_id": 0}).to_list(length=None)
-        
-        all_recipes = recipes + user_recipes
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header
-        writer.writerow(['Navn', 'Beskrivelse', 'Type', 'Farve', 'Brix', 'Volumen', 'Alkohol', 'Tags', 'Ingredienser', 'Fremgangsmåde', 'Image_URL', 'Is_Free', 'Is_Published', 'Author'])
-        
-        for recipe in all_recipes:
-            # Format ingredients: Navn:Mængde:Enhed:Brix:Rolle (separated by ;)
-            ingredients_list = []
-            for ing in recipe.get('ingredients', []):
-                ing_str = f"{ing.get('name', '')}:{ing.get('quantity', '')}:{ing.get('unit', '')}:{ing.get('brix', '')}:{ing.get('role', 'required')}"
-                ingredients_list.append(ing_str)
-            ingredients_str = ";".join(ingredients_list)
-            
-            # Format steps: Step 1|Step 2|Step 3
-            steps = recipe.get('steps', [])
-            steps_str = "|".join(steps) if steps else ""
-            
-            # Tags as comma-separated
-            tags = recipe.get('tags', [])
-            tags_str = ",".join(tags) if tags else ""
-            
-            writer.writerow([
-                recipe.get('name', ''),
-                recipe.get('description', ''),
-                recipe.get('type', ''),
-                recipe.get('color', ''),
-                recipe.get('target_brix', ''),  # Correct field name
-                recipe.get('base_volume_ml', ''),  # Correct field name
-                'Ja' if recipe.get('alcohol_flag', False) else 'Nej',  # Convert boolean to Ja/Nej
-                tags_str,
-                ingredients_str,
-                steps_str,
-                recipe.get('image_url', ''),  # Billede URL
-                recipe.get('is_free', False),
-                recipe.get('is_published', False),
-                recipe.get('author', 'system')
-            ])
-        
-        csv_content = output.getvalue()
-        output.close()
-        
-        # Add UTF-8 BOM for Excel/Numbers compatibility
-        csv_content_with_bom = '\ufeff' + csv_content
-        
-        return Response(
-            content=csv_content_with_bom.encode('utf-8'),
-            media_type="text/csv; charset=utf-8",
-            headers={
-                "Content-Disposition": "attachment; filename=slushice-recipes.csv"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Error exporting recipes CSV: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    async def rows():
+        # System recipes first, then user recipes - streamed from the cursors
+        for collection in (db.recipes, db.user_recipes):
+            async for recipe in collection.find({}, {"_id": 0}).batch_size(500):
+                # Format ingredients: Navn:Mængde:Enhed:Brix:Rolle (separated by ;)
+                ingredients_list = []
+                for ing in recipe.get('ingredients', []):
+                    ing_str = f"{ing.get('name', '')}:{ing.get('quantity', '')}:{ing.get('unit', '')}:{ing.get('brix', '')}:{ing.get('role', 'required')}"
+                    ingredients_list.append(ing_str)
+                ingredients_str = ";".join(ingredients_list)
+                
+                # Format steps: Step 1|Step 2|Step 3
+                steps = recipe.get('steps', [])
+                steps_str = "|".join(steps) if steps else ""
+                
+                # Tags as comma-separated
+                tags = recipe.get('tags', [])
+                tags_str = ",".join(tags) if tags else ""
+                
+                yield [
+                    recipe.get('name', ''),
+                    recipe.get('description', ''),
+                    recipe.get('type', ''),
+                    recipe.get('color', ''),
+                    recipe.get('target_brix', ''),  # Correct field name
+                    recipe.get('base_volume_ml', ''),  # Correct field name
+                    'Ja' if recipe.get('alcohol_flag', False) else 'Nej',  # Convert boolean to Ja/Nej
+                    tags_str,
+                    ingredients_str,
+                    steps_str,
+                    recipe.get('image_url', ''),  # Billede URL
+                    recipe.get('is_free', False),
+                    recipe.get('is_published', False),
+                    recipe.get('author', 'system')
+                ]
+    
+    return csv_download(
+        ['Navn', 'Beskrivelse', 'Type', 'Farve', 'Brix', 'Volumen', 'Alkohol', 'Tags', 'Ingredienser', 'Fremgangsmåde', 'Image_URL', 'Is_Free', 'Is_Published', 'Author'],
+        rows(),
+        "slushice-recipes.csv"
+    )
 
 # ===== RECIPE APPROVAL ADMIN ENDPOINTS =====
 
@@ -5517,15 +3878,12 @@ async def toggle_recipe_free_status(recipe_id: str, request: Request):
         raise HTTPException(status_code=403, detail="Admin only")
     
     # Check both system recipes and user recipes
-    recipe = await db.recipes.find_one({"id": recipe_id})
-    collection_name = "recipes"
+    resolved = await find_recipe(recipe_id)
     
-    if not recipe:
-        recipe = await db.user_recipes.find_one({"id": recipe_id})
-        collection_name = "user_recipes"
-    
-    if not recipe:
+    if not resolved:
         raise HTTPException(status_code=404, detail="Recipe not found")
+    recipe = resolved.recipe
+    collection_name = resolved.collection
     
     # Toggle is_free status
     new_free_status = not recipe.get('is_free', False)
@@ -5536,6 +3894,7 @@ async def toggle_recipe_free_status(recipe_id: str, request: Request):
         {"id": recipe_id},
         {"$set": {"is_free": new_free_status}}
     )
+    catalog_cache.invalidate()
     
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Recipe not found")
@@ -5567,6 +3926,7 @@ async def approve_recipe(
         {"id": recipe_id},
         {"$set": {"approval_status": "approved", "status": "published"}}
     )
+    catalog_cache.invalidate()
     
     # Create notification for recipe author
     try:
@@ -5624,6 +3984,7 @@ async def bulk_approve_pending(request: Request):
     )
     
     total_updated = result1.modified_count + result2.modified_count
+    catalog_cache.invalidate()
     
     return {
         "success": True, 
@@ -5655,6 +4016,7 @@ async def reject_recipe(
         {"id": recipe_id},
         {"$set": {"approval_status": "rejected", "rejection_reason": reason}}
     )
+    catalog_cache.invalidate()
     
     # Create notification for recipe author
     try:
@@ -5736,7 +4098,8 @@ async def find_similar_recipes(recipe_id: str, request: Request):
             })
     
     # Search in system recipes
-    system_recipes = await db.recipes.find({}).to_list(length=None)
+    snapshot = await catalog_cache.get_snapshot()
+    system_recipes = snapshot.recipes
     
     for r in system_recipes:
         r_name = r['name'].lower()
@@ -5801,7 +4164,7 @@ async def get_recipes_for_image_matching(request: Request):
     
     # Get cloudinary images
     try:
-        result = cloudinary.api.resources(
+        result = get_cloudinary().api.resources(
             type='upload',
             max_results=500,
             resource_type='image',
@@ -5838,6 +4201,7 @@ async def update_recipe_image(data: dict, request: Request):
     )
     
     if result.modified_count > 0:
+        catalog_cache.invalidate()
         return {"success": True, "message": "Billede opdateret"}
     else:
         return {"success": False, "message": "Opskrift ikke fundet"}
@@ -5988,13 +4352,8 @@ async def get_ads(country: Optional[str] = None, placement: Optional[str] = None
 @api_router.post("/ads/{ad_id}/click")
 async def track_ad_click(ad_id: str):
     """Track ad click for analytics"""
-    result = await db.ads.update_one(
-        {"id": ad_id},
-        {"$inc": {"clicks": 1}}
-    )
-    
-    if result.modified_count == 0:
-        raise HTTPException(status_code=404, detail="Ad not found")
+    # Queued; unknown ad ids are ignored when the batch is written
+    click_ingestor.increment("ads", ad_id, "clicks")
     
     return {"message": "Click tracked"}
 
@@ -6072,49 +4431,6 @@ async def delete_ad(ad_id: str, request: Request):
 # TRANSLATION HELPERS
 # ==========================================
 
-def apply_translation(recipe: dict, lang: str = "da") -> dict:
-    """
-    Apply language-specific translation to recipe.
-    Falls back to English if requested language not available.
-    Falls back to Danish if English not available.
-    """
-    # If no translations field, return as-is (legacy recipe or user recipe)
-    if "translations" not in recipe:
-        return recipe
-    
-    translations = recipe.get("translations", {})
-    
-    # Try requested language
-    if lang in translations:
-        translation = translations[lang]
-    # Fallback to English
-    elif "en" in translations:
-        translation = translations["en"]
-    # Fallback to Danish
-    elif "da" in translations:
-        translation = translations["da"]
-    # No translations available
-    else:
-        return recipe
-    
-    # Apply translation to recipe
-    recipe_copy = recipe.copy()
-    recipe_copy["name"] = translation.get("name", recipe.get("name", ""))
-    recipe_copy["description"] = translation.get("description", recipe.get("description", ""))
-    recipe_copy["steps"] = translation.get("steps", recipe.get("steps", []))
-    
-    # Apply translated ingredients if available
-    if "ingredients" in translation:
-        recipe_copy["ingredients"] = translation["ingredients"]
-    
-    # Keep original translations object for admin purposes
-    # but mark which language is currently displayed
-    recipe_copy["_current_language"] = lang
-    recipe_copy["_available_languages"] = list(translations.keys())
-    
-    return recipe_copy
-
-
 # ==========================================
 # BADGE MANAGEMENT
 # ==========================================
@@ -6203,7 +4519,7 @@ async def upload_badge_image(level: str, file: UploadFile = File(...)):
         contents = await file.read()
         
         # Upload to Cloudinary
-        result = cloudinary.uploader.upload(
+        result = get_cloudinary().uploader.upload(
             contents,
             folder="badges",
             public_id=f"badge_{level}_{uuid.uuid4().hex[:8]}",
@@ -6508,6 +4824,7 @@ async def detect_user_location(request: Request):
         client_ip = request.client.host
     
     logger.info(f"[Geolocation] Detecting country for IP: {client_ip}")
+    import geolocation_service
     
     # Try IP-based detection first
     country_code = await geolocation_service.detect_country_from_ip(client_ip)
@@ -6844,6 +5161,7 @@ async def create_notification(
             "data": data or {}
         }
         await db.notifications.insert_one(notification)
+        await notification_feed.record_change(db, user_id, unread_delta=1)
         logger.info(f"Created notification for user {user_id}: {type}")
         return notification
     except Exception as e:
@@ -6853,36 +5171,41 @@ async def create_notification(
 @api_router.get("/notifications")
 async def get_notifications(
     request: Request,
+    response: Response,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    limit: int = 50,
-    unread_only: bool = False
+    limit: int = notification_feed.DEFAULT_LIMIT,
+    unread_only: bool = False,
+    cursor: Optional[str] = None  # next_cursor from the previous page
 ):
-    """Get user's notifications"""
+    """
+    Get user's notifications (personal ones merged with broadcasts), newest first.
+    Answers 304 when If-None-Match carries the ETag of an unchanged feed.
+    """
     user = await get_current_user(request, credentials, db)
     
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    # Build query
-    query = {"user_id": user.id}
-    if unread_only:
-        query["read"] = False
+    limit = max(1, min(limit, notification_feed.MAX_LIMIT))
     
-    # Fetch notifications
-    notifications = await db.notifications.find(
-        query,
-        {"_id": 0}
-    ).sort("created_at", -1).limit(limit).to_list(length=None)
+    # Counters and versions only - the list is read when the ETag changed
+    state = await notification_feed.feed_state(db, user)
+    etag = notification_feed.feed_etag(user, state, limit, unread_only, cursor)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if notification_feed.etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
     
-    # Count unread
-    unread_count = await db.notifications.count_documents({
-        "user_id": user.id,
-        "read": False
-    })
+    try:
+        notifications, next_cursor = await notification_feed.read_page(db, user, state, limit, unread_only, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
+    response.headers.update(cache_headers)
     return {
         "notifications": notifications,
-        "unread_count": unread_count
+        "unread_count": state["unread_count"],
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
     }
 
 @api_router.put("/notifications/{notification_id}/read")
@@ -6902,7 +5225,9 @@ async def mark_notification_read(
         {"$set": {"read": True}}
     )
     
-    if result.modified_count == 0:
+    if result.modified_count:
+        await notification_feed.record_change(db, user.id, unread_delta=-1)
+    elif not await broadcast_notifications.mark_read(db, user, notification_id):
         raise HTTPException(status_code=404, detail="Notification not found")
     
     return {"success": True}
@@ -6922,10 +5247,12 @@ async def mark_all_notifications_read(
         {"user_id": user.id, "read": False},
         {"$set": {"read": True}}
     )
+    await notification_feed.record_change(db, user.id, reset_unread=True)
+    marked_broadcasts = await broadcast_notifications.mark_all_read(db, user)
     
     return {
         "success": True,
-        "marked_count": result.modified_count
+        "marked_count": result.modified_count + marked_broadcasts
     }
 
 @api_router.delete("/notifications/{notification_id}")
@@ -6940,12 +5267,14 @@ async def delete_notification(
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    result = await db.notifications.delete_one({
+    deleted = await db.notifications.find_one_and_delete({
         "id": notification_id,
         "user_id": user.id
-    })
+    }, {"_id": 0, "read": 1})
     
-    if result.deleted_count == 0:
+    if deleted is not None:
+        await notification_feed.record_change(db, user.id, unread_delta=0 if deleted.get("read") else -1)
+    elif not await broadcast_notifications.dismiss(db, user, notification_id):
         raise HTTPException(status_code=404, detail="Notification not found")
     
     return {"success": True}
@@ -6969,20 +5298,18 @@ async def broadcast_notification(
     if not title or not message:
         raise HTTPException(status_code=400, detail="Title and message required")
     
-    # Get all users
-    users = await db.users.find({"role": {"$ne": "guest"}}, {"_id": 0, "id": 1}).to_list(length=None)
-    
-    # Create notification for each user
-    created_count = 0
-    for user_doc in users:
-        await create_notification(
-            user_id=user_doc["id"],
-            type="system",
-            title=title,
-            message=message,
-            link=link
-        )
-        created_count += 1
+    # One document for everyone; users' feeds pick it up when read
+    await broadcast_notifications.create_broadcast(
+        db,
+        type="system",
+        title=title,
+        message=message,
+        link=link,
+        exclude_roles=["guest"]
+    )
+    created_count = await db.users.count_documents(
+        broadcast_notifications.recipients_query(None, ["guest"], [])
+    )
     
     logger.info(f"Admin {user.email} broadcasted notification to {created_count} users")
     
@@ -6997,7 +5324,6 @@ async def broadcast_notification(
 # =============================================================================
 
 from pathlib import Path
-from emergentintegrations.llm.chat import LlmChat, UserMessage
 from utils.brix_calculator import (
     calculate_brix,
     calculate_adjustment_to_target_brix,
@@ -7035,6 +5361,9 @@ async def query_openai(system_prompt: str, user_query: str, context: str = "", m
         context: Optional context (e.g., ingredient data)
         model: OpenAI model to use (default: gpt-5.1)
     """
+    # The LLM client pulls in a large dependency tree - only load it for AI requests
+    from emergentintegrations.llm.chat import LlmChat, UserMessage
+    
     api_key = os.environ.get('EMERGENT_LLM_KEY', 'sk-emergent-0A93663479e74011f0')
     
     # Build full prompt with context if provided
@@ -7293,6 +5622,7 @@ Regler:
 }"""
         
         # Query AI
+        from emergentintegrations.llm.chat import LlmChat, UserMessage
         api_key = os.environ.get('EMERGENT_LLM_KEY', 'sk-emergent-0A93663479e74011f0')
         
         chat = LlmChat(
@@ -7340,6 +5670,7 @@ from utils.translation_helper import (
 
 # Set database for redirect routes
 redirect_routes.set_db(db)
+redirect_routes.set_click_ingestor(click_ingestor)
 
 # Include routers
 app.include_router(api_router)
@@ -7347,9 +5678,16 @@ app.include_router(redirect_routes.router)  # Admin routes: /api/admin/*
 app.include_router(redirect_routes.go_router)  # Redirect routes: /api/go/*
 
 # Mount uploads directory for static file serving under /api/uploads
-uploads_dir = ROOT_DIR / 'uploads'
-uploads_dir.mkdir(exist_ok=True)
-app.mount("/api/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
+app.mount("/api/uploads", StaticFiles(directory=str(UPLOADS_DIR), check_dir=False), name="uploads")
+
+if startup_profile.enabled:
+    @app.middleware("http")
+    async def record_first_request(request: Request, call_next):
+        if startup_profile.request_started():
+            startup_profile.log_report()
+        return await call_next(request)
+
+startup_profile.mark("app configured")
 
 # Logging configuration is done at the top of the file
 # logger = logging.getLogger(__name__) - already defined at line 60
@@ -7357,12 +5695,42 @@ app.mount("/api/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads
 # Startup event
 @app.on_event("startup")
 async def startup_event():
+    UPLOADS_DIR.mkdir(exist_ok=True)
+    try:
+        result = await ensure_indexes(db)
+        logger.info(f"Ensured {len(result['ensured'])} database indexes ({len(result['failed'])} failed)")
+    except Exception as e:
+        logger.warning(f"Failed to ensure database indexes on startup: {e}")
+    startup_profile.mark("startup: indexes")
     try:
-        await seed_recipes()
+        await redirect_routes.redirect_table.refresh(db)
+    except Exception as e:
+        logger.warning(f"Failed to load redirect table on startup: {e}")
+    startup_profile.mark("startup: redirect table")
+    try:
+        if SEED_RECIPES_ON_STARTUP:
+            await seed_recipes()
     except Exception as e:
         logger.warning(f"Failed to seed recipes on startup (this is OK for Atlas MongoDB with read-only user): {e}")
+    startup_profile.mark("startup: seed check")
+    try:
+        await tips_feed.backfill_rank_scores(db)
+    except Exception as e:
+        logger.warning(f"Failed to score tips on startup: {e}")
+    startup_profile.mark("startup: tips ranking")
+    app.state.session_flusher = asyncio.create_task(session_touches.run(db))
+    app.state.view_flusher = asyncio.create_task(recipe_view_buffer.run(db))
+    click_ingestor.start(db)
+    startup_profile.mark("startup complete")
     logger.info("SLUSHBOOK API started with integrated redirect service")
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    for name in ("session_flusher", "view_flusher"):
+        flusher = getattr(app.state, name, None)
+        if flusher:
+            flusher.cancel()
+    await session_touches.flush(db, force=True)
+    await recipe_view_buffer.flush(db)
+    await click_ingestor.drain(db)
     client.close()
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Background Jobs
+Runs admin jobs (link health check, data backfills) as asyncio tasks.
+
+Long admin operations used to run inside the request. BackgroundJobs starts
+them as tasks and keeps the last jobs in memory, so the admin gets a job
+document back right away and can poll it by id for progress (checked/total)
+and the result.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJobs:
+    """Background jobs of one kind, pollable by id (kept in memory, last `keep` jobs)"""
+
+    def __init__(self, name: str, keep: int = 20):
+        self.name = name
+        self.keep = keep
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def running(self) -> Optional[Dict[str, Any]]:
+        return next((job for job in self._jobs.values() if job["status"] == "running"), None)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._jobs.get(job_id)
+
+    def start(self, run: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Start run(job) in the background; it may update job["checked"]/["total"] as it goes"""
+        job = {
+            "id": str(uuid.uuid4()),
+            "status": "running",
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "finished_at": None,
+            "total": 0,
+            "checked": 0,
+            "result": None,
+            "error": None,
+        }
+        self._jobs[job["id"]] = job
+        while len(self._jobs) > self.keep:
+            oldest = next(iter(self._jobs))
+            if self._jobs[oldest]["status"] == "running":
+                break
+            del self._jobs[oldest]
+
+        async def runner():
+            started = time.monotonic()
+            try:
+                job["result"] = await run(job)
+                job["status"] = "done"
+            except Exception as e:
+                logger.error(f"{self.name} job {job['id']} failed: {e}", exc_info=True)
+                job["status"] = "failed"
+                job["error"] = str(e)
+            finally:
+                job["finished_at"] = datetime.now(timezone.utc).isoformat()
+                job["duration_seconds"] = round(time.monotonic() - started, 2)
+                self._tasks.pop(job["id"], None)
+
+        self._tasks[job["id"]] = asyncio.create_task(runner())
+        return job
@@ -0,0 +1,213 @@
+"""
+Broadcast Notifications
+Fan-out-on-read notifications: one document per broadcast, merged into each
+user's feed when it is read.
+
+Broadcasts (the admin broadcast, "new recipe" notices to pro users) used to
+insert one notification per recipient, awaited one by one inside the request
+- a broadcast to 100k users was 100k round trips before the admin got an
+answer. A broadcast is now a single document in notification_broadcasts with
+its audience (roles, excluded roles/users). Per-user state lives in one small
+notification_cursors document: everything up to read_before is read, plus the
+ids of broadcasts read or dismissed individually since.
+
+Only users who existed when a broadcast was sent see it, as before: a
+broadcast is visible to a user when its created_at is not older than the
+user's own created_at.
+
+Every new broadcast bumps a global version in db.app_state and every change
+to a user's broadcast state bumps the version on their cursor, which is what
+the notification feed's unread counter and ETag are keyed on.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.keyset import NEWEST_FIRST, older_than
+
+logger = logging.getLogger(__name__)
+
+BROADCASTS = "notification_broadcasts"
+CURSORS = "notification_cursors"
+STATE_ID = "notification_broadcasts"
+
+# Applied with every change to a user's broadcast state
+CURSOR_CHANGED = {"$inc": {"version": 1}, "$unset": {"broadcast_unread": ""}}
+
+# Cursor stored for users who have never read anything
+EMPTY_CURSOR: Dict[str, Any] = {"read_before": "", "read_ids": [], "dismissed_ids": []}
+
+
+def _iso(value: Any) -> str:
+    """created_at as the isoformat string notifications are stored with"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            # Mongo hands back naive UTC datetimes
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    return value or ""
+
+
+def audience_query(user) -> Dict[str, Any]:
+    """Broadcasts addressed to this user (ignoring read/dismissed state)"""
+    return {
+        "$or": [{"roles": None}, {"roles": user.role}],
+        "exclude_roles": {"$ne": user.role},
+        "exclude_user_ids": {"$ne": user.id},
+        "created_at": {"$gte": _iso(getattr(user, "created_at", None))},
+    }
+
+
+def recipients_query(roles: Optional[List[str]], exclude_roles: List[str], exclude_user_ids: List[str]) -> Dict[str, Any]:
+    """The users query a broadcast's audience corresponds to"""
+    role_filter: Dict[str, Any] = {"$nin": exclude_roles}
+    if roles is not None:
+        role_filter["$in"] = roles
+    query: Dict[str, Any] = {"role": role_filter}
+    if exclude_user_ids:
+        query["id"] = {"$nin": exclude_user_ids}
+    return query
+
+
+async def create_broadcast(
+    db,
+    type: str,
+    title: str,
+    message: str,
+    link: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+    roles: Optional[List[str]] = None,
+    exclude_roles: Optional[List[str]] = None,
+    exclude_user_ids: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Store one broadcast; roles=None addresses every role not in exclude_roles"""
+    broadcast = {
+        "id": str(uuid.uuid4()),
+        "type": type,
+        "title": title,
+        "message": message,
+        "link": link,
+        "data": data or {},
+        "roles": roles,
+        "exclude_roles": exclude_roles or [],
+        "exclude_user_ids": exclude_user_ids or [],
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+    await db[BROADCASTS].insert_one(dict(broadcast))
+    await db.app_state.update_one({"id": STATE_ID}, {"$inc": {"version": 1}}, upsert=True)
+    logger.info(f"Created {type} broadcast {broadcast['id']} (roles={roles}, exclude_roles={exclude_roles})")
+    return broadcast
+
+
+async def current_version(db) -> int:
+    """Global broadcast version, bumped by every create_broadcast"""
+    state = await db.app_state.find_one({"id": STATE_ID}, {"_id": 0, "version": 1})
+    return (state or {}).get("version", 0)
+
+
+async def get_cursor(db, user_id: str) -> Dict[str, Any]:
+    cursor = await db[CURSORS].find_one({"user_id": user_id}, {"_id": 0})
+    return {**EMPTY_CURSOR, **(cursor or {})}
+
+
+def _as_notification(broadcast: Dict, user_id: str, cursor: Dict) -> Dict[str, Any]:
+    """A broadcast in the shape of a per-user notification"""
+    read = broadcast["created_at"] <= cursor["read_before"] or broadcast["id"] in cursor["read_ids"]
+    return {
+        "id": broadcast["id"],
+        "user_id": user_id,
+        "type": broadcast["type"],
+        "title": broadcast["title"],
+        "message": broadcast["message"],
+        "link": broadcast.get("link"),
+        "read": read,
+        "created_at": broadcast["created_at"],
+        "data": broadcast.get("data") or {},
+        "broadcast": True,
+    }
+
+
+def _unread_query(user, cursor: Dict) -> Dict[str, Any]:
+    query = audience_query(user)
+    query["created_at"]["$gt"] = cursor["read_before"]
+    query["id"] = {"$nin": cursor["read_ids"] + cursor["dismissed_ids"]}
+    return query
+
+
+async def list_for_user(
+    db,
+    user,
+    limit: int,
+    unread_only: bool = False,
+    cursor: Optional[Dict] = None,
+    before: Optional[Tuple[str, str]] = None,
+) -> List[Dict]:
+    """Newest `limit` broadcasts visible to the user (older than `before`), as notifications"""
+    cursor = cursor if cursor is not None else await get_cursor(db, user.id)
+    if unread_only:
+        query = _unread_query(user, cursor)
+    else:
+        query = audience_query(user)
+        query["id"] = {"$nin": cursor["dismissed_ids"]}
+    if before is not None:
+        query = {"$and": [query, older_than(*before)]}
+    broadcasts = await db[BROADCASTS].find(query, {"_id": 0}).sort(NEWEST_FIRST).limit(limit).to_list(length=None)
+    return [_as_notification(broadcast, user.id, cursor) for broadcast in broadcasts]
+
+
+async def count_unread(db, user, cursor: Optional[Dict] = None) -> int:
+    cursor = cursor if cursor is not None else await get_cursor(db, user.id)
+    return await db[BROADCASTS].count_documents(_unread_query(user, cursor))
+
+
+async def _find_visible(db, user, broadcast_id: str) -> Optional[Dict]:
+    return await db[BROADCASTS].find_one({**audience_query(user), "id": broadcast_id}, {"_id": 0, "id": 1})
+
+
+async def mark_read(db, user, broadcast_id: str) -> bool:
+    """False if no such broadcast is addressed to the user"""
+    if not await _find_visible(db, user, broadcast_id):
+        return False
+    await db[CURSORS].update_one(
+        {"user_id": user.id},
+        {"$addToSet": {"read_ids": broadcast_id}, **CURSOR_CHANGED},
+        upsert=True
+    )
+    return True
+
+
+async def mark_all_read(db, user) -> int:
+    """Move the read cursor to now; returns how many broadcasts became read"""
+    cursor = await get_cursor(db, user.id)
+    unread = await count_unread(db, user, cursor)
+    # Ids read one by one are covered by the cursor from now on
+    await db[CURSORS].update_one(
+        {"user_id": user.id},
+        {
+            "$set": {
+                "read_before": datetime.now(timezone.utc).isoformat(),
+                "read_ids": [],
+                "broadcast_unread": {"version": await current_version(db), "count": 0},
+            },
+            "$inc": {"version": 1},
+        },
+        upsert=True
+    )
+    return unread
+
+
+async def dismiss(db, user, broadcast_id: str) -> bool:
+    """Hide a broadcast from the user's feed; False if it is not addressed to them"""
+    if not await _find_visible(db, user, broadcast_id):
+        return False
+    cursor = await get_cursor(db, user.id)
+    if broadcast_id in cursor["dismissed_ids"]:
+        return False
+    await db[CURSORS].update_one(
+        {"user_id": user.id},
+        {"$addToSet": {"dismissed_ids": broadcast_id}, "$pull": {"read_ids": broadcast_id}, **CURSOR_CHANGED},
+        upsert=True
+    )
+    return True
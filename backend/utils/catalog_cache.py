@@ -0,0 +1,150 @@
+"""
+Recipe Catalog Cache
+In-process, versioned snapshot of the system recipe collection (db.recipes).
+
+The system catalog only changes when an admin edits, imports or approves
+something, so read endpoints serve it from memory. Write endpoints call
+invalidate(); the optional TTL bounds staleness when several workers run
+side by side (each worker only sees its own invalidations) and for counters
+such as view_count and rating_avg, which are updated without invalidating.
+
+Each load materializes the translated view of every configured language, so
+after a write the projections are rebuilt once rather than per request.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+class CatalogSnapshot:
+    """One immutable load of the catalog plus lazily built per-language views"""
+
+    def __init__(
+        self,
+        version: int,
+        recipes: List[Dict],
+        translate: Callable[[Dict, str], Dict],
+        languages: Sequence[str] = (),
+    ):
+        self.version = version
+        # Every document in db.recipes, in natural order
+        self.recipes = recipes
+        # Ids of every document, e.g. to tell system from user recipe ids
+        self.ids = {r.get('id') for r in recipes}
+        # What non-admin users may see: published system recipes
+        self.published = [
+            r for r in recipes
+            if r.get('author') == 'system' and r.get('is_published') is True
+        ]
+        self._translate = translate
+        self._translated: Dict[str, Dict[str, Dict]] = {}
+        self._derived: Dict[str, Any] = {}
+        self.languages = tuple(languages)
+        for lang in self.languages:
+            self._translated[lang] = self._build_translated(lang)
+
+    def derived(self, name: str, build: Callable[[], Any]) -> Any:
+        """Build a structure from this snapshot once (e.g. a matching engine) and reuse it"""
+        if name not in self._derived:
+            self._derived[name] = build()
+        return self._derived[name]
+
+    def _build_translated(self, lang: str) -> Dict[str, Dict]:
+        views = {}
+        for recipe in self.published:
+            prepared = dict(recipe)
+            if isinstance(prepared.get('created_at'), str):
+                prepared['created_at'] = datetime.fromisoformat(prepared['created_at'])
+            views[recipe['id']] = self._translate(prepared, lang)
+        return views
+
+    def translated(self, lang: str) -> Dict[str, Dict]:
+        """
+        Published recipes by id, translated to `lang` and with created_at
+        parsed. Precomputed for the configured languages; other language
+        codes are built per call and not kept. Callers must copy before
+        mutating.
+        """
+        views = self._translated.get(lang)
+        if views is None:
+            views = self._build_translated(lang)
+            if not self.languages:
+                self._translated[lang] = views
+        return views
+
+
+class CatalogCache:
+    """
+    Holds the current CatalogSnapshot and reloads it after invalidate() or
+    when the TTL expires. Concurrent misses share a single reload.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[List[Dict]]],
+        translate: Callable[[Dict, str], Dict],
+        ttl_seconds: Optional[float] = None,
+        languages: Sequence[str] = (),
+    ):
+        self._loader = loader
+        self._translate = translate
+        self.languages = tuple(languages)
+        self.ttl_seconds = ttl_seconds or None
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._loaded_at = 0.0
+        self._version = 0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _is_fresh(self) -> bool:
+        if self._snapshot is None:
+            return False
+        if self.ttl_seconds is None:
+            return True
+        return time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    async def get_snapshot(self) -> CatalogSnapshot:
+        """Return the current snapshot, loading it from Mongo on a miss"""
+        if self._is_fresh():
+            self.hits += 1
+            return self._snapshot
+
+        async with self._lock:
+            if self._is_fresh():
+                self.hits += 1
+                return self._snapshot
+
+            self.misses += 1
+            version = self._version
+            recipes = await self._loader()
+            snapshot = CatalogSnapshot(version, recipes, self._translate, self.languages)
+            # Only keep the snapshot if nothing was written while loading
+            if version == self._version:
+                self._snapshot = snapshot
+                self._loaded_at = time.monotonic()
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the snapshot after a write to db.recipes"""
+        self._version += 1
+        self._snapshot = None
+        self.invalidations += 1
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "version": self._version,
+            "cached": self._snapshot is not None,
+            "size": len(self._snapshot.recipes) if self._snapshot else 0,
+            "languages": sorted(self._snapshot._translated.keys()) if self._snapshot else [],
+            "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._snapshot else None,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,147 @@
+"""
+Click Ingestion
+Bounded queue of click writes, drained in batches by a background task.
+
+Redirect clicks (db.redirect_clicks), product clicks (products.click_count)
+and ad clicks (ads.clicks) used to be written while the visitor waited for
+the response. Handlers now enqueue the write and return. The drain task
+collects up to flush_size items (or whatever arrived within flush_interval)
+and writes them with one insert_many per collection and one unordered
+bulk_write of coalesced $inc updates, so a burst of clicks on the same
+product becomes a single update.
+
+When the queue is full new clicks are dropped and counted rather than
+slowing down the click path. drain() flushes everything on shutdown.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+
+class ClickIngestor:
+    """Asynchronous, batched writer for click events and counters"""
+
+    def __init__(self, max_queue: int = 10000, flush_size: int = 500, flush_interval: float = 1.0):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        # Items taken off the queue but not yet handed to a write
+        self._inflight: List[Tuple] = []
+        self._writing: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.flushes = 0
+        self.errors = 0
+
+    def _put(self, item: Tuple) -> bool:
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        self.enqueued += 1
+        return True
+
+    def insert(self, collection: str, document: Dict) -> bool:
+        """Queue a document insert; False if the queue is full and it was dropped"""
+        return self._put(("insert", collection, document))
+
+    def increment(self, collection: str, doc_id: str, field: str, amount: int = 1) -> bool:
+        """Queue an $inc of `field` on the document with this id"""
+        return self._put(("inc", collection, doc_id, field, amount))
+
+    async def _write(self, db, batch: List[Tuple]) -> None:
+        inserts: Dict[str, List[Dict]] = {}
+        increments: Dict[str, Dict[Tuple[str, str], int]] = {}
+        for item in batch:
+            if item[0] == "insert":
+                inserts.setdefault(item[1], []).append(item[2])
+            else:
+                _, collection, doc_id, field, amount = item
+                counters = increments.setdefault(collection, {})
+                counters[(doc_id, field)] = counters.get((doc_id, field), 0) + amount
+
+        for collection, documents in inserts.items():
+            try:
+                await db[collection].insert_many(documents, ordered=False)
+                self.written += len(documents)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Failed to write {len(documents)} clicks to {collection}: {e}")
+
+        for collection, counters in increments.items():
+            operations = [
+                UpdateOne({"id": doc_id}, {"$inc": {field: amount}})
+                for (doc_id, field), amount in counters.items()
+            ]
+            try:
+                await db[collection].bulk_write(operations, ordered=False)
+                self.written += sum(counters.values())
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Failed to apply {len(operations)} click counters to {collection}: {e}")
+
+        self.flushes += 1
+
+    async def _run(self, db) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._inflight = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(self._inflight) < self.flush_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._inflight.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._inflight = self._inflight, []
+            # Shielded so that cancelling the task on shutdown cannot cut a write in half
+            self._writing = asyncio.ensure_future(self._write(db, batch))
+            await asyncio.shield(self._writing)
+
+    def start(self, db) -> None:
+        """Start the background drain task (call from app startup)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(db))
+
+    async def drain(self, db) -> None:
+        """Stop the background task and write everything still queued"""
+        if self._task is not None:
+            # Before Python 3.12, wait_for() can swallow a cancellation that
+            # races with an item arriving, leaving the task waiting on the
+            # queue; cancel again until it has really stopped
+            while not self._task.done():
+                self._task.cancel()
+                await asyncio.wait({self._task}, timeout=0.1)
+            self._task = None
+        if self._writing is not None and not self._writing.done():
+            await self._writing
+
+        pending = self._inflight
+        self._inflight = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for start in range(0, len(pending), self.flush_size):
+            await self._write(db, pending[start:start + self.flush_size])
+
+    def stats(self) -> Dict:
+        return {
+            "queued": self._queue.qsize(),
+            "max_queue": self._queue.maxsize,
+            "flush_size": self.flush_size,
+            "flush_interval": self.flush_interval,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "errors": self.errors,
+        }
@@ -0,0 +1,117 @@
+"""
+Comment Enrichment
+Batched enrichment of the admin comment list and the comment language backfill.
+
+GET /api/admin/comments/all used to make up to three round trips per comment:
+a users lookup for comments without a language, an update_one to store the
+detected language, and a recipes lookup for the recipe name. The list is now
+enriched with one $in query on users and one on recipes for the whole page,
+and nothing is written while the admin waits.
+
+Storing the detected language is a separate, idempotent migration:
+backfill_comment_languages() walks the comments that still lack a language in
+batches (one $in users query and one unordered bulk_write per batch) and only
+updates comments that still lack one, so it can be re-run or interrupted at
+any time. An admin starts it with POST /api/admin/comments/backfill-language
+and it reports progress through its BackgroundJobs job; reading the list
+never starts it, so a run that cannot finish (comments without an id, a
+read-only database user) is not restarted on every page load.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANGUAGE = "da"
+
+# Country code -> comment language, as used when a comment is created
+COUNTRY_TO_LANGUAGE = {
+    'DK': 'da',
+    'DE': 'de',
+    'FR': 'fr',
+    'GB': 'en',
+    'US': 'en-US',
+}
+
+# Comments stored before the language field existed (or with an empty one)
+MISSING_LANGUAGE = {"$or": [
+    {"language": {"$exists": False}},
+    {"language": None},
+    {"language": ""},
+]}
+
+
+def language_for_country(country: Optional[str]) -> str:
+    return COUNTRY_TO_LANGUAGE.get(country, DEFAULT_LANGUAGE) if country else DEFAULT_LANGUAGE
+
+
+async def user_countries(db, user_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+    """user id -> country code, in one query"""
+    ids = list({user_id for user_id in user_ids if user_id})
+    if not ids:
+        return {}
+    users = await db.users.find({"id": {"$in": ids}}, {"_id": 0, "id": 1, "country": 1}).to_list(length=None)
+    return {user["id"]: user.get("country") for user in users}
+
+
+async def recipe_names(db, recipe_ids: Iterable[str]) -> Dict[str, str]:
+    """recipe id -> name for system recipes, in one query"""
+    ids = list({recipe_id for recipe_id in recipe_ids if recipe_id})
+    if not ids:
+        return {}
+    recipes = await db.recipes.find({"id": {"$in": ids}}, {"_id": 0, "id": 1, "name": 1}).to_list(length=None)
+    return {recipe["id"]: recipe.get("name") for recipe in recipes}
+
+
+async def enrich_admin_comments(db, comments: List[Dict]) -> int:
+    """
+    Fill in a missing language (from the author's country) and recipe_name.
+    Returns how many comments still lack a stored language.
+    """
+    missing = [comment for comment in comments if not comment.get('language')]
+    countries = await user_countries(db, (comment.get('user_id') for comment in missing))
+    for comment in missing:
+        comment['language'] = language_for_country(countries.get(comment.get('user_id')))
+
+    names = await recipe_names(db, (comment.get('recipe_id') for comment in comments))
+    for comment in comments:
+        comment['recipe_name'] = names.get(comment.get('recipe_id')) or "Unknown"
+    return len(missing)
+
+
+async def backfill_comment_languages(db, job: Dict[str, Any], batch_size: int = 500) -> Dict[str, Any]:
+    """Store the detected language on every comment without one"""
+    job["total"] = await db.recipe_comments.count_documents(MISSING_LANGUAGE)
+    updated = 0
+    batch: List[Dict] = []
+
+    async def write(batch: List[Dict]) -> int:
+        countries = await user_countries(db, (comment.get('user_id') for comment in batch))
+        operations = [
+            UpdateOne(
+                # A comment that got a language meanwhile is left alone
+                {"$and": [{"id": comment['id']}, MISSING_LANGUAGE]},
+                {"$set": {"language": language_for_country(countries.get(comment.get('user_id')))}}
+            )
+            for comment in batch
+        ]
+        result = await db.recipe_comments.bulk_write(operations, ordered=False)
+        job["checked"] += len(batch)
+        return result.modified_count
+
+    cursor = db.recipe_comments.find(MISSING_LANGUAGE, {"_id": 0, "id": 1, "user_id": 1}).batch_size(batch_size)
+    async for comment in cursor:
+        if not comment.get('id'):
+            continue
+        batch.append(comment)
+        if len(batch) >= batch_size:
+            updated += await write(batch)
+            batch = []
+    if batch:
+        updated += await write(batch)
+
+    logger.info(f"Comment language backfill: {updated} of {job['total']} comments updated")
+    return {"updated": updated}
@@ -0,0 +1,134 @@
+"""
+Comment Threads
+Keyset-paginated recipe comments, one-document likes and a stored comment count.
+
+GET /api/comments/{recipe_id} loaded up to 1000 comments and sorted them in
+Python, and a like rewrote the comment's whole liked_by array. Comments are
+now read newest first with an index-backed sort on (recipe_id, status,
+created_at, id), so the first page of a popular recipe costs the same as
+that of a quiet one. A like is one document in comment_likes (comment_id,
+user_id); toggling it is one delete or upsert plus an $inc of the comment's
+`likes`. The number of visible comments is kept on the recipe document as
+`comment_count` and moved with $inc by create, delete and hide.
+
+Existing data is migrated lazily: a comment's legacy liked_by array is moved
+to comment_likes the first time it is liked after the change, and a recipe's
+comment_count is counted once when it is first read. Until then the counter
+is left alone by $inc, so it can never start from a wrong value.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from pymongo import ReturnDocument, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Legacy like arrays are never sent to clients; liked_by is set per viewer
+COMMENT_PROJECTION = {"_id": 0, "liked_by": 0}
+
+RECIPE_COLLECTIONS = ("recipes", "user_recipes")
+
+
+async def adjust_comment_count(db, recipe_id: str, delta: int) -> None:
+    """$inc the recipe's comment_count (only once it has been counted)"""
+    for collection in RECIPE_COLLECTIONS:
+        result = await db[collection].update_one(
+            {"id": recipe_id, "comment_count": {"$exists": True}},
+            {"$inc": {"comment_count": delta}}
+        )
+        if result.matched_count:
+            return
+
+
+async def comment_count(db, recipe_id: str) -> int:
+    """Visible comments on the recipe, counted once and then read from the recipe"""
+    for collection in RECIPE_COLLECTIONS:
+        recipe = await db[collection].find_one({"id": recipe_id}, {"_id": 0, "comment_count": 1})
+        if recipe is None:
+            continue
+        if "comment_count" in recipe:
+            return max(0, recipe["comment_count"])
+        count = await db.recipe_comments.count_documents({"recipe_id": recipe_id, "status": "visible"})
+        await db[collection].update_one(
+            {"id": recipe_id, "comment_count": {"$exists": False}},
+            {"$set": {"comment_count": count}}
+        )
+        return count
+    # Comments on a recipe that no longer exists
+    return await db.recipe_comments.count_documents({"recipe_id": recipe_id, "status": "visible"})
+
+
+async def attach_viewer_likes(db, comments: List[Dict], user_id: Optional[str]) -> None:
+    """Set liked_by to [user_id] on the comments the viewer liked, [] on the rest"""
+    liked = set()
+    if user_id and comments:
+        ids = [comment["id"] for comment in comments]
+        async for like in db.comment_likes.find({"user_id": user_id, "comment_id": {"$in": ids}}, {"_id": 0, "comment_id": 1}):
+            liked.add(like["comment_id"])
+        # Likes still in a legacy liked_by array
+        async for comment in db.recipe_comments.find({"id": {"$in": ids}, "liked_by": user_id}, {"_id": 0, "id": 1}):
+            liked.add(comment["id"])
+    for comment in comments:
+        comment["liked_by"] = [user_id] if comment["id"] in liked else []
+
+
+async def migrate_legacy_likes(db, comment_id: str) -> None:
+    """Move a comment's liked_by array into comment_likes (no-op once migrated)"""
+    legacy = await db.recipe_comments.find_one(
+        {"id": comment_id, "liked_by": {"$exists": True}},
+        {"_id": 0, "liked_by": 1}
+    )
+    if legacy is None:
+        return
+    user_ids = set(legacy.get("liked_by") or [])
+    if user_ids:
+        # Written before the array is removed, so a concurrent toggle that no
+        # longer sees liked_by always finds the likes (the upserts are idempotent)
+        now = datetime.now(timezone.utc).isoformat()
+        await db.comment_likes.bulk_write(
+            [
+                UpdateOne(
+                    {"comment_id": comment_id, "user_id": user_id},
+                    {"$setOnInsert": {"comment_id": comment_id, "user_id": user_id, "created_at": now}},
+                    upsert=True
+                )
+                for user_id in user_ids
+            ],
+            ordered=False
+        )
+    await db.recipe_comments.update_one(
+        {"id": comment_id, "liked_by": {"$exists": True}},
+        {"$unset": {"liked_by": ""}}
+    )
+
+
+async def toggle_like(db, comment_id: str, user_id: str) -> Tuple[bool, int]:
+    """Like or unlike; returns (liked, likes) after the toggle"""
+    await migrate_legacy_likes(db, comment_id)
+    removed = await db.comment_likes.delete_one({"comment_id": comment_id, "user_id": user_id})
+    if removed.deleted_count:
+        liked, delta = False, -1
+    else:
+        result = await db.comment_likes.update_one(
+            {"comment_id": comment_id, "user_id": user_id},
+            {"$setOnInsert": {
+                "comment_id": comment_id,
+                "user_id": user_id,
+                "created_at": datetime.now(timezone.utc).isoformat()
+            }},
+            upsert=True
+        )
+        # A concurrent like of the same user already counted
+        liked, delta = True, 1 if result.upserted_id is not None else 0
+    comment = await db.recipe_comments.find_one_and_update(
+        {"id": comment_id},
+        {"$inc": {"likes": delta}},
+        projection={"_id": 0, "likes": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    return liked, max(0, (comment or {}).get("likes", 0))
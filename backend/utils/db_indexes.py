@@ -0,0 +1,222 @@
+"""
+Database Index Registry
+Declarative list of the MongoDB indexes the API relies on, plus the query
+shapes they are meant to cover.
+
+ensure_indexes() is applied on startup; create_index is a no-op for indexes
+that already exist, so it is safe to run on every boot. explain_query_shapes()
+runs explain() for every registered query shape and flags the ones whose
+winning plan is a collection scan (served by GET /api/admin/db-indexes and
+check_db_indexes.py).
+
+Indexes are deliberately non-unique: legacy data may contain duplicates, and
+a failed unique build would leave the lookup without any index at all.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pymongo import ASCENDING, DESCENDING
+
+logger = logging.getLogger(__name__)
+
+IndexKeys = Sequence[Tuple[str, int]]
+
+# collection -> index key lists
+INDEXES: Dict[str, List[IndexKeys]] = {
+    "user_sessions": [
+        [("session_token", ASCENDING)],
+        [("user_id", ASCENDING)],
+    ],
+    "users": [
+        [("id", ASCENDING)],
+        [("email", ASCENDING)],
+    ],
+    "recipes": [
+        [("id", ASCENDING)],
+    ],
+    "user_recipes": [
+        [("id", ASCENDING)],
+        [("author", ASCENDING)],
+        [("session_id", ASCENDING)],
+        [("approval_status", ASCENDING)],
+    ],
+    "favorites": [
+        [("session_id", ASCENDING), ("recipe_id", ASCENDING)],
+    ],
+    "ratings": [
+        [("session_id", ASCENDING), ("recipe_id", ASCENDING)],
+        [("recipe_id", ASCENDING)],
+    ],
+    "redirect_options": [
+        [("mappingId", ASCENDING), ("status", ASCENDING)],
+    ],
+    "notifications": [
+        [("user_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)],
+    ],
+    "recipe_comments": [
+        [("id", ASCENDING)],
+        [("recipe_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)],
+    ],
+    "comment_likes": [
+        [("comment_id", ASCENDING), ("user_id", ASCENDING)],
+        [("user_id", ASCENDING), ("comment_id", ASCENDING)],
+    ],
+    # Tips feed: one index per filter combination GET /api/tips accepts, each
+    # ending in the (rank_score, id) sort; the admin lists sort on created_at
+    "tips_and_tricks": [
+        [("id", ASCENDING)],
+        [("is_public", ASCENDING), ("approval_status", ASCENDING), ("rank_score", DESCENDING), ("id", DESCENDING)],
+        [("is_public", ASCENDING), ("approval_status", ASCENDING), ("category", ASCENDING),
+         ("rank_score", DESCENDING), ("id", DESCENDING)],
+        [("is_public", ASCENDING), ("approval_status", ASCENDING), ("country", ASCENDING), ("language", ASCENDING),
+         ("rank_score", DESCENDING), ("id", DESCENDING)],
+        [("is_public", ASCENDING), ("approval_status", ASCENDING), ("country", ASCENDING), ("language", ASCENDING),
+         ("category", ASCENDING), ("rank_score", DESCENDING), ("id", DESCENDING)],
+        [("is_public", ASCENDING), ("approval_status", ASCENDING), ("is_international", ASCENDING),
+         ("rank_score", DESCENDING), ("id", DESCENDING)],
+        [("is_public", ASCENDING), ("approval_status", ASCENDING), ("is_international", ASCENDING),
+         ("category", ASCENDING), ("rank_score", DESCENDING), ("id", DESCENDING)],
+        [("approval_status", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)],
+        [("created_at", DESCENDING), ("id", DESCENDING)],
+    ],
+    "notification_broadcasts": [
+        [("created_at", DESCENDING), ("id", DESCENDING)],
+        [("id", ASCENDING)],
+    ],
+    "notification_cursors": [
+        [("user_id", ASCENDING)],
+    ],
+}
+
+# (name, collection, filter, sort) - the hot lookups the indexes above exist for.
+# Values are placeholders; only the shape matters to the planner.
+QUERY_SHAPES: List[Tuple[str, str, Dict[str, Any], Optional[IndexKeys]]] = [
+    ("session by token", "user_sessions", {"session_token": "x"}, None),
+    ("sessions by user", "user_sessions", {"user_id": "x"}, None),
+    ("user by id", "users", {"id": "x"}, None),
+    ("user by email", "users", {"email": "x"}, None),
+    ("system recipe by id", "recipes", {"id": "x"}, None),
+    ("user recipe by id", "user_recipes", {"id": "x"}, None),
+    ("user recipes by author", "user_recipes", {"author": "x"}, None),
+    ("user recipes by session", "user_recipes", {"session_id": "x"}, None),
+    ("pending user recipes", "user_recipes", {"approval_status": "pending"}, None),
+    ("favorites by session", "favorites", {"session_id": "x"}, None),
+    ("favorite lookup", "favorites", {"session_id": "x", "recipe_id": "x"}, None),
+    ("rating lookup", "ratings", {"session_id": "x", "recipe_id": "x"}, None),
+    ("ratings by recipe", "ratings", {"recipe_id": "x"}, None),
+    ("active redirect options", "redirect_options", {"mappingId": "x", "status": "active"}, [("updatedAt", DESCENDING)]),
+    ("notifications by user", "notifications", {"user_id": "x"}, [("created_at", DESCENDING), ("id", DESCENDING)]),
+    ("unread notifications", "notifications", {"user_id": "x", "read": False}, None),
+    ("comment by id", "recipe_comments", {"id": "x"}, None),
+    ("comments by recipe", "recipe_comments", {"recipe_id": "x", "status": "visible"}, [("created_at", DESCENDING), ("id", DESCENDING)]),
+    ("comment like lookup", "comment_likes", {"comment_id": "x", "user_id": "x"}, None),
+    ("viewer comment likes", "comment_likes", {"user_id": "x", "comment_id": {"$in": ["x"]}}, None),
+    ("tip by id", "tips_and_tricks", {"id": "x"}, None),
+    ("tips feed", "tips_and_tricks", {"is_public": True, "approval_status": "approved"},
+     [("rank_score", DESCENDING), ("id", DESCENDING)]),
+    ("tips feed by category", "tips_and_tricks", {"is_public": True, "approval_status": "approved", "category": "x"},
+     [("rank_score", DESCENDING), ("id", DESCENDING)]),
+    ("tips feed by country", "tips_and_tricks",
+     {"is_public": True, "approval_status": "approved", "country": "x", "language": "x"},
+     [("rank_score", DESCENDING), ("id", DESCENDING)]),
+    ("tips feed by country and category", "tips_and_tricks",
+     {"is_public": True, "approval_status": "approved", "country": "x", "language": "x", "category": "x"},
+     [("rank_score", DESCENDING), ("id", DESCENDING)]),
+    ("tips feed for user country", "tips_and_tricks",
+     {"is_public": True, "approval_status": "approved",
+      "$or": [{"country": "x", "language": "x"}, {"is_international": True}]},
+     [("rank_score", DESCENDING), ("id", DESCENDING)]),
+    ("tips feed for user country by category", "tips_and_tricks",
+     {"is_public": True, "approval_status": "approved", "category": "x",
+      "$or": [{"country": "x", "language": "x"}, {"is_international": True}]},
+     [("rank_score", DESCENDING), ("id", DESCENDING)]),
+    ("admin tips by status", "tips_and_tricks", {"approval_status": "pending"}, [("created_at", DESCENDING), ("id", DESCENDING)]),
+    ("admin tips", "tips_and_tricks", {}, [("created_at", DESCENDING), ("id", DESCENDING)]),
+    ("broadcasts since", "notification_broadcasts", {"created_at": {"$gte": "x"}}, [("created_at", DESCENDING), ("id", DESCENDING)]),
+    ("broadcast by id", "notification_broadcasts", {"id": "x"}, None),
+    ("notification cursor", "notification_cursors", {"user_id": "x"}, None),
+]
+
+
+def index_name(keys: IndexKeys) -> str:
+    """MongoDB's default index name, e.g. session_id_1_recipe_id_1"""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+
+async def ensure_indexes(db) -> Dict[str, Any]:
+    """
+    Create every registered index. Failures (e.g. a read-only database user)
+    are logged and reported per index instead of aborting startup.
+    """
+    created, failed = [], []
+    for collection, key_lists in INDEXES.items():
+        for keys in key_lists:
+            name = f"{collection}.{index_name(keys)}"
+            try:
+                await db[collection].create_index(list(keys), background=True)
+                created.append(name)
+            except Exception as e:
+                logger.warning(f"Could not create index {name}: {e}")
+                failed.append({"index": name, "error": str(e)})
+    return {"ensured": created, "failed": failed}
+
+
+def _plan_stages(plan: Any) -> List[str]:
+    """All stage names in an explain() plan tree, outermost first"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            if isinstance(value, (dict, list)):
+                stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_plan_stages(item))
+    return stages
+
+
+async def explain_query_shapes(db) -> List[Dict[str, Any]]:
+    """explain() every registered query shape and flag collection scans"""
+    report = []
+    for name, collection, query, sort in QUERY_SHAPES:
+        entry: Dict[str, Any] = {"query": name, "collection": collection, "filter": query}
+        try:
+            cursor = db[collection].find(query)
+            if sort:
+                cursor = cursor.sort(list(sort))
+            explained = await cursor.explain()
+            stages = _plan_stages(explained.get("queryPlanner", {}).get("winningPlan", {}))
+            entry["stages"] = stages
+            entry["collscan"] = "COLLSCAN" in stages
+        except Exception as e:
+            entry["error"] = str(e)
+            entry["collscan"] = None
+        report.append(entry)
+    return report
+
+
+async def index_report(db) -> Dict[str, Any]:
+    """Existing indexes per registered collection plus the explain() report"""
+    existing = {}
+    for collection in INDEXES:
+        try:
+            info = await db[collection].index_information()
+            existing[collection] = sorted(info.keys())
+        except Exception as e:
+            existing[collection] = {"error": str(e)}
+
+    missing = [
+        f"{collection}.{index_name(keys)}"
+        for collection, key_lists in INDEXES.items()
+        for keys in key_lists
+        if isinstance(existing.get(collection), list) and index_name(keys) not in existing[collection]
+    ]
+    queries = await explain_query_shapes(db)
+    return {
+        "existing": existing,
+        "missing": missing,
+        "queries": queries,
+        "collscans": [q["query"] for q in queries if q["collscan"]],
+    }
@@ -0,0 +1,235 @@
+"""
+Ingredient Index
+Inverted index from ingredient-name substrings to recipe bitsets, used by the
+include_ingredients/exclude_ingredients filter of GET /api/recipes.
+
+A filter term matches a recipe when it is a substring of one of the recipe's
+(lowercased) ingredient names. The index keeps the distinct ingredient names
+as a vocabulary, with 1-, 2- and 3-grams pointing at the names containing
+them. A term is resolved to the names containing it (exact lookup for terms
+up to 3 characters, trigram intersection plus verification for longer ones),
+and the recipe bitsets of those names are OR-ed together. Include filters
+become bitwise AND, exclude filters AND NOT.
+
+Recipes are identified by a hashable key, e.g. ("recipes", recipe_id), and
+mapped to bit positions ("slots"). sync() only re-indexes a recipe when its
+ingredient names changed, so keeping the index current is incremental.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+GRAM_SIZE = 3
+
+
+def recipe_matches_ingredients(recipe: dict, include_list: List[str], exclude_list: List[str]) -> bool:
+    """
+    Check a recipe against lowercase include/exclude ingredient terms.
+    A term matches when it is a substring of any ingredient name.
+    """
+    # Get all ingredient names from recipe (lowercase for case-insensitive matching)
+    recipe_ingredients = [ing['name'].lower() for ing in recipe.get('ingredients', [])]
+
+    # Check if recipe contains ALL included ingredients
+    if include_list:
+        has_all_included = all(
+            any(include_ing in recipe_ing for recipe_ing in recipe_ingredients)
+            for include_ing in include_list
+        )
+        if not has_all_included:
+            return False
+
+    # Check if recipe contains ANY excluded ingredients
+    if exclude_list:
+        has_any_excluded = any(
+            any(exclude_ing in recipe_ing for recipe_ing in recipe_ingredients)
+            for exclude_ing in exclude_list
+        )
+        if has_any_excluded:
+            return False
+
+    return True
+
+
+def _grams(name: str) -> Set[str]:
+    """All substrings of length 1..GRAM_SIZE"""
+    return {
+        name[i:i + size]
+        for size in range(1, GRAM_SIZE + 1)
+        for i in range(len(name) - size + 1)
+    }
+
+
+def _ingredient_names(recipe: dict) -> Tuple[str, ...]:
+    return tuple(ing['name'] for ing in recipe.get('ingredients', []))
+
+
+class IngredientIndex:
+    """Incrementally maintained ingredient-substring → recipe bitset index"""
+
+    def __init__(self):
+        # Recipe key -> slot (bit position), and the raw names it was indexed with
+        self._slots: Dict[Hashable, int] = {}
+        self._fingerprints: Dict[Hashable, Tuple[str, ...]] = {}
+        self._free_slots: List[int] = []
+        self._capacity = 0
+        # Slot -> vocabulary ids of its lowercased ingredient names
+        self._slot_names: Dict[int, Set[int]] = {}
+        # Vocabulary
+        self._name_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._name_slots: List[Set[int]] = []
+        self._gram_names: Dict[str, Set[int]] = {}
+        # Slots of recipes with at least one ingredient (an empty term matches these)
+        self._nonempty: Set[int] = set()
+        # Lazily built bitsets, dropped when the underlying sets change
+        self._name_masks: Dict[int, int] = {}
+        self._term_masks: Dict[str, int] = {}
+        self._nonempty_mask: Optional[int] = None
+        # Last snapshot object synced per source (see sync_snapshot)
+        self._synced_snapshots: Dict[str, object] = {}
+        self._source_keys: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # ----- maintenance -----
+
+    def _name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._name_ids[name] = name_id
+            self._names.append(name)
+            self._name_slots.append(set())
+            for gram in _grams(name):
+                self._gram_names.setdefault(gram, set()).add(name_id)
+            # A new name can match cached terms
+            self._term_masks.clear()
+        return name_id
+
+    def _set_names(self, slot: int, name_ids: Set[int]) -> None:
+        old = self._slot_names.get(slot, set())
+        for name_id in old - name_ids:
+            self._name_slots[name_id].discard(slot)
+            self._name_masks.pop(name_id, None)
+        for name_id in name_ids - old:
+            self._name_slots[name_id].add(slot)
+            self._name_masks.pop(name_id, None)
+        if name_ids:
+            self._slot_names[slot] = name_ids
+            self._nonempty.add(slot)
+        else:
+            self._slot_names.pop(slot, None)
+            self._nonempty.discard(slot)
+        if old != name_ids:
+            self._term_masks.clear()
+            self._nonempty_mask = None
+
+    def sync(self, key: Hashable, recipe: dict) -> None:
+        """Index a recipe, or re-index it if its ingredient names changed"""
+        fingerprint = _ingredient_names(recipe)
+        if self._fingerprints.get(key) == fingerprint:
+            return
+        slot = self._slots.get(key)
+        if slot is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                slot = self._capacity
+                self._capacity += 1
+            self._slots[key] = slot
+        self._fingerprints[key] = fingerprint
+        self._set_names(slot, {self._name_id(name.lower()) for name in fingerprint})
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a recipe from the index (no-op if it is not indexed)"""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        self._fingerprints.pop(key, None)
+        self._set_names(slot, set())
+        self._free_slots.append(slot)
+
+    def sync_snapshot(self, source: str, snapshot: object, recipes: Iterable[dict]) -> None:
+        """
+        Sync every recipe of an in-memory snapshot under keys (source, id) and
+        remove recipes of that source that are no longer present. Does nothing
+        if this snapshot object was already synced.
+        """
+        if self._synced_snapshots.get(source) is snapshot:
+            return
+        seen = set()
+        for recipe in recipes:
+            key = (source, recipe['id'])
+            seen.add(key)
+            self.sync(key, recipe)
+        for key in self._source_keys.get(source, set()) - seen:
+            self.remove(key)
+        self._source_keys[source] = seen
+        self._synced_snapshots[source] = snapshot
+
+    # ----- queries -----
+
+    def _slots_to_mask(self, slots: Set[int]) -> int:
+        bits = bytearray((self._capacity + 7) // 8)
+        for slot in slots:
+            bits[slot >> 3] |= 1 << (slot & 7)
+        return int.from_bytes(bits, 'little')
+
+    def _name_mask(self, name_id: int) -> int:
+        mask = self._name_masks.get(name_id)
+        if mask is None:
+            mask = self._slots_to_mask(self._name_slots[name_id])
+            self._name_masks[name_id] = mask
+        return mask
+
+    def _matching_names(self, term: str) -> Iterable[int]:
+        if len(term) <= GRAM_SIZE:
+            # Every substring up to GRAM_SIZE is a gram, so the lookup is exact
+            return self._gram_names.get(term, ())
+        postings = sorted(
+            (self._gram_names.get(term[i:i + GRAM_SIZE], set()) for i in range(len(term) - GRAM_SIZE + 1)),
+            key=len
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        return [name_id for name_id in candidates if term in self._names[name_id]]
+
+    def term_mask(self, term: str) -> int:
+        """Bitset of recipes with an ingredient name containing `term`"""
+        mask = self._term_masks.get(term)
+        if mask is None:
+            if term == "":
+                if self._nonempty_mask is None:
+                    self._nonempty_mask = self._slots_to_mask(self._nonempty)
+                mask = self._nonempty_mask
+            else:
+                mask = 0
+                for name_id in self._matching_names(term):
+                    mask |= self._name_mask(name_id)
+            self._term_masks[term] = mask
+        return mask
+
+    def filter(
+        self,
+        keyed_recipes: Sequence[Tuple[Hashable, dict]],
+        include_list: List[str],
+        exclude_list: List[str],
+    ) -> List[dict]:
+        """
+        Return the recipes (in their original order) that contain every
+        include term and no exclude term. All keys must already be synced.
+        """
+        allowed = (1 << self._capacity) - 1
+        for term in include_list:
+            allowed &= self.term_mask(term)
+        for term in exclude_list:
+            allowed &= ~self.term_mask(term)
+
+        # Test bits on a byte string - shifting a large int per recipe would be O(n)
+        bits = allowed.to_bytes((self._capacity + 7) // 8, 'little')
+        result = []
+        for key, recipe in keyed_recipes:
+            slot = self._slots[key]
+            if bits[slot >> 3] >> (slot & 7) & 1:
+                result.append(recipe)
+        return result
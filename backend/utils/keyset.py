@@ -0,0 +1,53 @@
+"""
+Keyset Pagination
+Descending pages over (field, id) for feeds such as notifications, comments and tips.
+
+A page is read with a Mongo sort on (field, id) descending and a limit; the
+next page starts after the last document's (field, id), so deep pages cost
+the same as the first one (no skip). Positions travel as opaque URL-safe
+tokens. The field defaults to created_at, which must be stored as a
+comparable value (the isoformat strings used throughout the API are).
+"""
+
+import base64
+import json
+from typing import Any, Dict, List, Tuple
+
+
+def descending(field: str) -> List[Tuple[str, int]]:
+    """Sort on field, highest first; ids break ties so pages are stable"""
+    return [(field, -1), ("id", -1)]
+
+
+NEWEST_FIRST = descending("created_at")
+
+
+def encode_position(doc: Dict, field: str = "created_at") -> str:
+    """Opaque next_cursor token for the position after `doc`"""
+    raw = json.dumps([doc[field], doc["id"]], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_position(token: str) -> Tuple[Any, str]:
+    """
+    Decode a token created by encode_position into (value, id).
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        value, doc_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(value, (str, int, float)):
+            raise TypeError(f"unsupported position value {value!r}")
+        return value, str(doc_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+def older_than(value: Any, doc_id: str, field: str = "created_at") -> Dict[str, Any]:
+    """Documents after a position in descending(field) order"""
+    return {"$or": [
+        {field: {"$lt": value}},
+        {field: value, "id": {"$lt": doc_id}},
+    ]}
@@ -0,0 +1,128 @@
+"""
+Link Health Checker
+Concurrent health check of redirect option URLs, run as a background job.
+
+POST /api/admin/link-health used to HEAD every active option one after
+another (5s timeout each) and update broken ones one by one, holding the
+admin request open for minutes. The checker runs a bounded pool of workers
+over one shared httpx client (keep-alive, HTTP/2 when the h2 package is
+installed), with at most per_host requests in flight against the same host
+so a retailer with many links is not hammered. Links are queued per host and
+workers pick a host with a free slot, so the pool stays busy on other hosts
+while one host is at its cap.
+
+A link is checked with HEAD; hosts that reject HEAD (or answer it with an
+error) get a GET before the link is declared broken. A status >= 400 or a
+network error/timeout marks the option inactive, as before.
+
+Checks run as BackgroundJobs (utils/background_jobs.py) so the admin can
+poll GET /api/admin/link-health/{job_id}.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from collections import Counter, deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class LinkHealthChecker:
+    """Checks URLs with a bounded worker pool and per-host concurrency caps"""
+
+    def __init__(
+        self,
+        concurrency: int = 20,
+        per_host: int = 4,
+        timeout: float = 5.0,
+        http2: bool = True,
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.http2 = http2 and HTTP2_AVAILABLE and transport is None
+        self._transport = transport
+
+    def _client(self) -> "httpx.AsyncClient":
+        # Imported here: the admin check is the only user of httpx in the redirect service
+        import httpx
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=self.http2,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            transport=self._transport,
+        )
+
+    async def check_url(self, client: "httpx.AsyncClient", url: str) -> Dict[str, Any]:
+        """{"ok": bool, "status": int (if any response), "reason": str (if broken)}"""
+        try:
+            response = await client.head(url)
+            if response.status_code < 400:
+                return {"ok": True, "status": response.status_code}
+            # Many shops answer HEAD with 403/404/405 - confirm with a GET (body not read)
+            async with client.stream("GET", url) as response:
+                if response.status_code < 400:
+                    return {"ok": True, "status": response.status_code}
+                return {"ok": False, "status": response.status_code, "reason": "HTTP error"}
+        except Exception as e:
+            return {"ok": False, "reason": str(e) or "Timeout/Network error"}
+
+    async def check(
+        self,
+        options: List[Dict],
+        on_result: Optional[Callable[[Dict, Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Check every option's url; returns results in the order of `options`"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(options)
+        # One queue per host: a worker only takes a link whose host has a free
+        # slot, so links from one retailer stored together do not tie up the pool
+        pending: Dict[str, Deque[int]] = {}
+        for index, option in enumerate(options):
+            pending.setdefault(urlparse(option["url"]).netloc.lower(), deque()).append(index)
+        in_flight: Counter = Counter()
+        slot_freed = asyncio.Condition()
+
+        def take() -> Optional[Tuple[str, int]]:
+            for host in list(pending):
+                if in_flight[host] < self.per_host:
+                    indexes = pending.pop(host)
+                    index = indexes.popleft()
+                    if indexes:
+                        # Re-inserted last, so hosts take turns
+                        pending[host] = indexes
+                    in_flight[host] += 1
+                    return host, index
+            return None
+
+        async with self._client() as client:
+            async def worker():
+                while True:
+                    async with slot_freed:
+                        picked = take()
+                        while picked is None and pending:
+                            await slot_freed.wait()
+                            picked = take()
+                    if picked is None:
+                        return
+                    host, index = picked
+                    option = options[index]
+                    try:
+                        result = await self.check_url(client, option["url"])
+                    finally:
+                        async with slot_freed:
+                            in_flight[host] -= 1
+                            slot_freed.notify_all()
+                    results[index] = result
+                    if on_result is not None:
+                        on_result(option, result)
+
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(options)) or 1)))
+        return results
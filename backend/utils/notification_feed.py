@@ -0,0 +1,143 @@
+"""
+Notification Feed
+Keyset-paginated notification feed with a stored unread counter and an ETag.
+
+The notification bell polls GET /api/notifications, which ran a find plus a
+count_documents over the user's notifications on every poll. The user's
+notification_cursors document now also carries `unread` (personal
+notifications not yet read), which the notification write paths keep up to
+date, and a `version` that every change to the user's feed increments. The
+broadcast share of the unread count is cached on the same document against
+the global broadcast version.
+
+A poll reads the cursor document and the broadcast version, derives the ETag
+from them and answers 304 when the client already has that ETag; the list is
+only queried when something changed. Pages are keyset-paginated on
+(created_at, id), newest first, across personal notifications and broadcasts.
+Counters are created lazily (one count_documents per user) so existing data
+needs no migration.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import broadcast_notifications
+from utils.broadcast_notifications import CURSORS, EMPTY_CURSOR
+from utils.keyset import NEWEST_FIRST, decode_position, encode_position, older_than
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 100
+
+
+async def record_change(db, user_id: str, unread_delta: int = 0, reset_unread: bool = False) -> None:
+    """
+    Bump the user's feed version after a write to their personal notifications,
+    adjusting the unread counter by unread_delta (or setting it to 0).
+    """
+    if reset_unread:
+        await db[CURSORS].update_one(
+            {"user_id": user_id},
+            {"$set": {"unread": 0}, "$inc": {"version": 1}},
+            upsert=True
+        )
+        return
+    if unread_delta:
+        # Only adjust a counter that exists; a missing one is counted on the next read
+        result = await db[CURSORS].update_one(
+            {"user_id": user_id, "unread": {"$exists": True}},
+            {"$inc": {"unread": unread_delta, "version": 1}}
+        )
+        if result.matched_count:
+            return
+    await db[CURSORS].update_one({"user_id": user_id}, {"$inc": {"version": 1}}, upsert=True)
+
+
+async def feed_state(db, user) -> Dict[str, Any]:
+    """
+    The user's cursor plus the current unread counts, filling in missing or
+    outdated counters. Returns {"cursor", "version", "broadcast_version", "unread_count"}.
+    """
+    stored = await db[CURSORS].find_one({"user_id": user.id}, {"_id": 0})
+    cursor = {**EMPTY_CURSOR, **(stored or {})}
+    broadcast_version = await broadcast_notifications.current_version(db)
+
+    updates: Dict[str, Any] = {}
+    if "unread" not in cursor:
+        cursor["unread"] = await db.notifications.count_documents({"user_id": user.id, "read": False})
+        updates["unread"] = cursor["unread"]
+    cached = cursor.get("broadcast_unread") or {}
+    if cached.get("version") != broadcast_version:
+        cached = {"version": broadcast_version, "count": await broadcast_notifications.count_unread(db, user, cursor)}
+        cursor["broadcast_unread"] = cached
+        updates["broadcast_unread"] = cached
+
+    version = cursor.get("version", 0)
+    if updates:
+        if stored is None:
+            await db[CURSORS].update_one({"user_id": user.id}, {"$set": updates}, upsert=True)
+        else:
+            # Skipped if the feed changed meanwhile; the next read counts again
+            await db[CURSORS].update_one({"user_id": user.id, "version": stored.get("version")}, {"$set": updates})
+
+    return {
+        "cursor": cursor,
+        "version": version,
+        "broadcast_version": broadcast_version,
+        "unread_count": max(0, cursor["unread"]) + cached["count"],
+    }
+
+
+def feed_etag(user, state: Dict[str, Any], *params: Any) -> str:
+    """Weak ETag of one feed response (user, feed versions and request parameters)"""
+    key = json.dumps([user.id, user.role, state["version"], state["broadcast_version"], *params], default=str)
+    return f'W/"{hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    # Weak comparison: W/"x" and "x" match
+    bare = etag[2:] if etag.startswith("W/") else etag
+    return "*" in candidates or etag in candidates or bare in candidates
+
+
+async def read_page(
+    db,
+    user,
+    state: Dict[str, Any],
+    limit: int,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of personal notifications and broadcasts, newest first.
+
+    Returns:
+        (notifications, next_cursor) - next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    before = decode_position(cursor) if cursor else None
+
+    query: Dict[str, Any] = {"user_id": user.id}
+    if unread_only:
+        query["read"] = False
+    if before is not None:
+        query = {"$and": [query, older_than(*before)]}
+
+    # One extra per source tells whether another page follows
+    notifications = await db.notifications.find(
+        query,
+        {"_id": 0}
+    ).sort(NEWEST_FIRST).limit(limit + 1).to_list(length=None)
+    notifications += await broadcast_notifications.list_for_user(
+        db, user, limit + 1, unread_only, state["cursor"], before
+    )
+    notifications.sort(key=lambda n: (n["created_at"], n["id"]), reverse=True)
+
+    page = notifications[:limit]
+    next_cursor = encode_position(page[-1]) if len(notifications) > limit else None
+    return page, next_cursor
@@ -0,0 +1,239 @@
+"""
+Pantry Matching Engine
+Scores a whole recipe catalog against a user's pantry in one vectorized pass.
+
+Ingredient names are normalized (lowercase, collapsed whitespace) and interned
+to integer ids once per catalog. Every non-garnish ingredient becomes one
+entry in flat NumPy arrays (ingredient id, owning recipe, required flag), so
+scoring a pantry is a single gather plus a few bincounts instead of a Python
+loop per recipe and ingredient. Full match payloads (have/missing lists) are
+only built for the recipes a caller asks for.
+
+Results are identical to calculate_match_score, which is kept as the
+reference implementation. TopMatches keeps only the best matches while
+recipe batches stream through, so memory stays bounded by the page size.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase and collapse whitespace"""
+    return ' '.join(name.lower().split())
+
+
+def calculate_match_score(recipe: Dict, pantry_items: List[Dict]) -> Dict:
+    """Reference (per-recipe) implementation of the pantry match score"""
+    score = 0
+    missing = []
+    have = []
+
+    # Build pantry items with normalized names (lowercase, no extra spaces)
+    pantry_items_normalized = []
+    for item in pantry_items:
+        normalized_name = ' '.join(item['ingredient_name'].lower().split())
+        pantry_items_normalized.append({
+            'original': item['ingredient_name'],
+            'normalized': normalized_name,
+            'category': item.get('category_key', '')
+        })
+
+    for ingredient in recipe['ingredients']:
+        if ingredient['role'] == 'garnish':
+            continue
+
+        ingredient_name_normalized = ' '.join(ingredient['name'].lower().split())
+
+        # Try exact normalized match first
+        matched = any(
+            ingredient_name_normalized == pantry_item['normalized']
+            for pantry_item in pantry_items_normalized
+        )
+
+        if matched:
+            if ingredient['role'] == 'required':
+                score += 2
+                have.append(ingredient['name'])
+            else:
+                score += 1
+                have.append(ingredient['name'])
+        else:
+            if ingredient['role'] == 'required':
+                score -= 2
+                missing.append(ingredient['name'])
+
+    total_required = len([i for i in recipe['ingredients'] if i['role'] == 'required'])
+    matched_required = len([i for i in have if any(ing['name'] == i and ing['role'] == 'required' for ing in recipe['ingredients'])])
+    match_pct = (matched_required / total_required * 100) if total_required > 0 else 0
+
+    return {
+        'score': score,
+        'match_pct': round(match_pct, 1),
+        'have': have,
+        'missing': missing,
+        'can_make_now': len(missing) == 0 and score > 0,
+        'almost': len(missing) <= 2 and len(missing) > 0
+    }
+
+
+class PantryScores:
+    """Per-recipe results of one vectorized scoring pass"""
+
+    def __init__(self, matcher: "PantryMatcher", hit: np.ndarray):
+        self._matcher = matcher
+        self.hit = hit
+        n = len(matcher.recipes)
+        rec = matcher.entry_recipe
+        self.score = np.bincount(rec, weights=np.where(hit, matcher.hit_weight, matcher.miss_weight), minlength=n).astype(np.int64)
+        self.have_count = np.bincount(rec, weights=hit, minlength=n).astype(np.int64)
+        self.missing_count = np.bincount(rec, weights=~hit & matcher.entry_required, minlength=n).astype(np.int64)
+        self.matched_required = np.bincount(rec, weights=hit & matcher.entry_counts_required, minlength=n).astype(np.int64)
+        self.can_make_now = (self.missing_count == 0) & (self.score > 0)
+
+    def recipe(self, index: int) -> Dict:
+        return self._matcher.recipes[index]
+
+    def with_matches(self) -> List[int]:
+        """Indexes of recipes where the pantry has at least one ingredient"""
+        return np.flatnonzero(self.have_count > 0).tolist()
+
+    def match(self, index: int) -> Dict:
+        """Full match payload for one recipe, as calculate_match_score returns it"""
+        matcher = self._matcher
+        start, end = matcher.offsets[index], matcher.offsets[index + 1]
+        names = matcher.entry_names[start:end]
+        hit = self.hit[start:end].tolist()
+        required = matcher.entry_required[start:end].tolist()
+        have = [name for name, is_hit in zip(names, hit) if is_hit]
+        missing = [name for name, is_hit, is_required in zip(names, hit, required) if not is_hit and is_required]
+
+        total_required = matcher.total_required[index]
+        matched_required = int(self.matched_required[index])
+        match_pct = (matched_required / total_required * 100) if total_required > 0 else 0
+        score = int(self.score[index])
+
+        return {
+            'score': score,
+            'match_pct': round(match_pct, 1),
+            'have': have,
+            'missing': missing,
+            'can_make_now': len(missing) == 0 and score > 0,
+            'almost': len(missing) <= 2 and len(missing) > 0
+        }
+
+
+class PantryMatcher:
+    """Interned, array-backed view of a recipe list for pantry scoring"""
+
+    def __init__(self, recipes: List[Dict]):
+        self.recipes = recipes
+        self.vocabulary: Dict[str, int] = {}
+
+        entry_ids = []
+        entry_recipe = []
+        entry_required = []
+        entry_counts_required = []
+        self.entry_names: List[str] = []
+        self.offsets = [0]
+        self.total_required: List[int] = []
+
+        for index, recipe in enumerate(recipes):
+            ingredients = recipe['ingredients']
+            required_names = {ing['name'] for ing in ingredients if ing['role'] == 'required'}
+            self.total_required.append(sum(1 for ing in ingredients if ing['role'] == 'required'))
+            for ingredient in ingredients:
+                if ingredient['role'] == 'garnish':
+                    continue
+                token = normalize_name(ingredient['name'])
+                entry_ids.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+                entry_recipe.append(index)
+                entry_required.append(ingredient['role'] == 'required')
+                # A matched name counts towards match_pct if any required
+                # ingredient of the recipe has exactly that name
+                entry_counts_required.append(ingredient['name'] in required_names)
+                self.entry_names.append(ingredient['name'])
+            self.offsets.append(len(entry_ids))
+
+        self.entry_ids = np.asarray(entry_ids, dtype=np.int32)
+        self.entry_recipe = np.asarray(entry_recipe, dtype=np.int32)
+        self.entry_required = np.asarray(entry_required, dtype=bool)
+        self.entry_counts_required = np.asarray(entry_counts_required, dtype=bool)
+        self.hit_weight = np.where(self.entry_required, 2, 1)
+        self.miss_weight = np.where(self.entry_required, -2, 0)
+
+    def score(self, pantry_names: Iterable[str]) -> PantryScores:
+        """Score every recipe against the pantry in one pass"""
+        in_pantry = np.zeros(len(self.vocabulary) + 1, dtype=bool)
+        for name in pantry_names:
+            token_id = self.vocabulary.get(normalize_name(name))
+            if token_id is not None:
+                in_pantry[token_id] = True
+        return PantryScores(self, in_pantry[self.entry_ids])
+
+
+class TopMatches:
+    """
+    Streaming top-K selection for POST /api/match.
+
+    Recipes with at least one pantry hit are ranked like the original
+    two-pass sort: most ingredients in the pantry first, then fewest
+    missing, then highest score, then catalog order. The best `limit`
+    recipes are kept separately for "can make now" and "almost". Payloads
+    are only built for recipes that enter one of the two heaps, and
+    total_matches still counts every recipe with a hit.
+    """
+
+    def __init__(self, limit: int = 50):
+        self.limit = limit
+        self.total = 0
+        self._offset = 0
+        # can_make_now -> min-heap of (negated rank key, entry); the root is the worst kept match
+        self._heaps: Dict[bool, List[Tuple[tuple, Dict]]] = {True: [], False: []}
+
+    def add(self, scores: PantryScores) -> None:
+        """Merge one scored batch; batches must be added in catalog order"""
+        offset = self._offset
+        self._offset += len(scores.score)
+
+        candidates = np.flatnonzero(scores.have_count > 0)
+        self.total += len(candidates)
+
+        for can_make in (True, False):
+            indexes = candidates[scores.can_make_now[candidates] == can_make]
+            if not len(indexes):
+                continue
+            # Best-first within the batch; nothing beyond the first `limit` can make the cut
+            order = np.lexsort((
+                indexes,
+                -scores.score[indexes],
+                scores.missing_count[indexes],
+                -scores.have_count[indexes],
+            ))[:self.limit]
+
+            heap = self._heaps[can_make]
+            for index in indexes[order].tolist():
+                rank = (
+                    int(scores.have_count[index]),
+                    -int(scores.missing_count[index]),
+                    int(scores.score[index]),
+                    -(offset + index),
+                )
+                if len(heap) >= self.limit and rank <= heap[0][0]:
+                    # The batch is sorted, so the rest are worse as well
+                    break
+                entry = {"recipe": scores.recipe(index), "match": scores.match(index)}
+                if len(heap) < self.limit:
+                    heapq.heappush(heap, (rank, entry))
+                else:
+                    heapq.heapreplace(heap, (rank, entry))
+
+    def results(self) -> Tuple[List[Dict], List[Dict], int]:
+        """(can_make_now, almost, total_matches), best match first"""
+        can_make, almost = (
+            [entry for _, entry in sorted(self._heaps[key], key=lambda item: item[0], reverse=True)]
+            for key in (True, False)
+        )
+        return can_make, almost, self.total
@@ -0,0 +1,241 @@
+"""
+Product CSV Import
+Chunked import of product mappings/options (POST /api/admin/import-product-csv).
+
+The import used to read and decode the whole upload, then make two or three
+Mongo calls per row (upsert mapping, find option, update/insert option).
+Rows are now read from the spooled upload a chunk at a time (the multipart
+body is already parsed incrementally into a temp file by Starlette), validated,
+and each chunk is written with one bulk_write of mapping upserts and one of
+option upserts. Memory is bounded by the chunk size, not the file size.
+
+Row format and semantics are unchanged:
+produkt_navn, keywords, ean, leverandør, url, title[, land]
+An option is identified by mapping + supplier + country; existing options get
+the new title/url, new ones are inserted active. Within a chunk the last row
+for the same mapping or option wins, as it did when rows were applied in order.
+"""
+
+import asyncio
+import csv
+import io
+import logging
+import re
+import unicodedata
+from datetime import datetime, timezone
+from itertools import islice
+from typing import BinaryIO, Dict, List, Set, Tuple
+from urllib.parse import urlparse
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+# Country detected from the shop's domain when the row has no country column
+TLD_TO_COUNTRY = {
+    '.dk': 'DK',
+    '.de': 'DE',
+    '.at': 'AT',
+    '.fr': 'FR',
+    '.co.uk': 'GB',
+    '.uk': 'GB',
+    '.com': 'US',
+    '.eu': 'GB',
+}
+
+# Errors beyond this are only counted, so a broken 50k-line file stays small
+MAX_REPORTED_ERRORS = 1000
+
+
+def mapping_slug(name: str) -> str:
+    """Mapping id for a product name"""
+    slug = unicodedata.normalize('NFD', name.lower())
+    slug = slug.encode('ascii', 'ignore').decode('utf-8')
+    slug = slug.replace('æ', 'ae').replace('ø', 'o').replace('å', 'aa')
+    slug = re.sub(r'[^a-z0-9]+', '-', slug)
+    return slug.strip('-')
+
+
+def detect_country(url: str) -> str:
+    """Country code from the URL's domain, DK if unknown"""
+    domain = urlparse(url).netloc.lower()
+    for tld, country in TLD_TO_COUNTRY.items():
+        if domain.endswith(tld):
+            return country
+    logger.warning(f"Could not detect country from URL {url}, using DK fallback")
+    return "DK"
+
+
+class ProductRow:
+    """One validated CSV line"""
+
+    __slots__ = ("line", "mapping_id", "name", "ean", "keywords", "supplier", "url", "title", "country")
+
+    def __init__(self, line: int, row: List[str]):
+        if len(row) < 6:
+            raise ValueError(f"Invalid format (expected at least 6 fields, got {len(row)}). Row: {row}")
+        produkt_navn, keywords, ean, leverandor, url, title = row[:6]
+        if not produkt_navn or not leverandor or not url or not title:
+            raise ValueError(f"Missing required fields. Row: {row}")
+
+        countries = row[6] if len(row) > 6 else ""
+        self.line = line
+        self.mapping_id = mapping_slug(produkt_navn)
+        self.name = produkt_navn
+        self.ean = ean or None
+        self.keywords = keywords.replace(";", ",") if keywords else ""
+        self.supplier = leverandor
+        self.url = url
+        self.title = title
+        self.country = countries.strip().upper() if countries and countries.strip() else detect_country(url)
+
+    @property
+    def option_key(self) -> Tuple[str, str, str]:
+        return (self.mapping_id, self.supplier, self.country)
+
+
+class ProductCsvImporter:
+    """Validates rows and writes them in chunks; report() has the endpoint's response"""
+
+    def __init__(self, db, chunk_size: int = 1000):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.mappings = 0
+        self.options = 0
+        self.lines = 0
+        self.chunks = 0
+        self.errors: List[str] = []
+        self.error_count = 0
+
+    def _error(self, line: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"Line {line}: {message}")
+        logger.warning(f"Line {line}: {message}")
+
+    async def _bulk(self, collection: str, operations: List[UpdateOne], lines: List[List[int]]) -> Tuple[int, Set[int]]:
+        """
+        Unordered bulk_write; failed operations are reported for their lines.
+        Returns (upserted, failed operation indexes); upserted includes the
+        operations that succeeded next to failed ones.
+        """
+        try:
+            result = await self.db[collection].bulk_write(operations, ordered=False)
+            return result.upserted_count, set()
+        except BulkWriteError as e:
+            failed = set()
+            for error in e.details.get("writeErrors", []):
+                failed.add(error["index"])
+                for line in lines[error["index"]]:
+                    self._error(line, error.get("errmsg", "write failed"))
+            return e.details.get("nUpserted", 0), failed
+
+    async def write_chunk(self, rows: List[ProductRow]) -> None:
+        if not rows:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+
+        mappings: Dict[str, ProductRow] = {}
+        mapping_lines: Dict[str, List[int]] = {}
+        for row in rows:
+            mappings[row.mapping_id] = row
+            mapping_lines.setdefault(row.mapping_id, []).append(row.line)
+        mapping_ids = list(mappings)
+        upserted, failed = await self._bulk(
+            "redirect_mappings",
+            [
+                UpdateOne(
+                    {"id": mapping_id},
+                    {"$set": {"id": mapping_id, "name": row.name, "ean": row.ean, "keywords": row.keywords}},
+                    upsert=True
+                )
+                for mapping_id, row in mappings.items()
+            ],
+            [mapping_lines[mapping_id] for mapping_id in mapping_ids]
+        )
+        self.mappings += upserted
+        failed_mappings = {mapping_ids[index] for index in failed}
+
+        options: Dict[Tuple[str, str, str], ProductRow] = {}
+        option_lines: Dict[Tuple[str, str, str], List[int]] = {}
+        for row in rows:
+            if row.mapping_id in failed_mappings:
+                continue
+            options[row.option_key] = row
+            option_lines.setdefault(row.option_key, []).append(row.line)
+        if not options:
+            return
+        stamp = int(datetime.now(timezone.utc).timestamp() * 1000)
+        keys = list(options)
+        _, failed = await self._bulk(
+            "redirect_options",
+            [
+                UpdateOne(
+                    {"mappingId": row.mapping_id, "supplier": row.supplier, "country_codes": [row.country]},
+                    {
+                        "$set": {
+                            "title": row.title,
+                            "url": row.url,
+                            "country_codes": [row.country],
+                            "updatedAt": now
+                        },
+                        "$setOnInsert": {
+                            "id": f"opt_{row.mapping_id}_{row.supplier}_{row.country}_{stamp}",
+                            "status": "active",
+                            "priceLastSeen": None
+                        }
+                    },
+                    upsert=True
+                )
+                for row in options.values()
+            ],
+            [option_lines[key] for key in keys]
+        )
+        self.options += sum(len(option_lines[key]) for index, key in enumerate(keys) if index not in failed)
+
+    async def run(self, upload: BinaryIO) -> Dict:
+        """Import a whole upload (binary file object positioned at the start)"""
+        text = io.TextIOWrapper(upload, encoding="utf-8", newline="")
+        reader = csv.reader(text)
+        try:
+            header = await asyncio.to_thread(next, reader, None)
+            logger.info(f"CSV Header: {header}")
+
+            while True:
+                # File reads may hit the disk spool - keep them off the event loop
+                batch = await asyncio.to_thread(lambda: list(islice(reader, self.chunk_size)))
+                if not batch:
+                    break
+                rows = []
+                for row in batch:
+                    self.lines += 1
+                    line = self.lines + 1  # the header is line 1
+                    try:
+                        rows.append(ProductRow(line, row))
+                    except ValueError as e:
+                        self._error(line, str(e))
+                try:
+                    await self.write_chunk(rows)
+                except Exception as e:
+                    logger.error(f"Failed to write chunk ending at line {self.lines + 1}: {e}", exc_info=True)
+                    for row in rows:
+                        self._error(row.line, str(e))
+                self.chunks += 1
+                logger.info(f"CSV import progress: {self.lines} lines, {self.mappings} new mappings, {self.options} options, {self.error_count} errors")
+        finally:
+            # The upload object is closed by FastAPI; just detach the wrapper
+            text.detach()
+        return self.report()
+
+    def report(self) -> Dict:
+        report = {
+            "mappings": self.mappings,
+            "options": self.options,
+            "errors": self.errors,
+            "lines": self.lines,
+            "chunks": self.chunks,
+        }
+        if self.error_count > len(self.errors):
+            report["errors_truncated"] = self.error_count - len(self.errors)
+        return report
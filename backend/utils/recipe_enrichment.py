@@ -0,0 +1,101 @@
+"""
+Recipe Enrichment
+Adds per-caller and per-author fields (favorites, ratings, author names and
+author recipe counts) to a list of recipes using a constant number of bulk
+Mongo queries, independent of how many recipes are in the list.
+"""
+
+from typing import Dict, List, Optional
+
+# Keys the enrichment step may add to a recipe
+ENRICHMENT_FIELDS = ('is_favorite', 'user_rating', 'author_name', 'author_recipe_count')
+
+
+async def attach_session_info(db, recipes: List[Dict], session_id: str) -> List[Dict]:
+    """
+    Set 'is_favorite' and 'user_rating' on every recipe for the given session.
+
+    Uses one query for favorites and one $in query for ratings.
+    """
+    favorites = await db.favorites.find({"session_id": session_id}, {"_id": 0}).to_list(1000)
+    favorite_ids = {fav['recipe_id'] for fav in favorites}
+
+    recipe_ids = list({recipe['id'] for recipe in recipes})
+    ratings_by_recipe = {}
+    if recipe_ids:
+        ratings = await db.ratings.find(
+            {"session_id": session_id, "recipe_id": {"$in": recipe_ids}},
+            {"_id": 0, "recipe_id": 1, "stars": 1}
+        ).to_list(length=None)
+        for rating in ratings:
+            # Keep the first match per recipe, like find_one would
+            ratings_by_recipe.setdefault(rating['recipe_id'], rating)
+
+    for recipe in recipes:
+        recipe['is_favorite'] = recipe['id'] in favorite_ids
+        rating = ratings_by_recipe.get(recipe['id'])
+        recipe['user_rating'] = rating.get('stars') if rating else None
+
+    return recipes
+
+
+async def attach_author_info(db, recipes: List[Dict]) -> List[Dict]:
+    """
+    Set 'author_name' and 'author_recipe_count' on user-created recipes.
+
+    Uses one $in query for author names and one aggregation for the number of
+    published, approved recipes per author. System recipes are left untouched.
+    """
+    author_ids = list({
+        recipe['author'] for recipe in recipes
+        if recipe.get('author') and recipe.get('author') != 'system'
+    })
+    if not author_ids:
+        return recipes
+
+    authors = {}
+    author_docs = await db.users.find(
+        {"id": {"$in": author_ids}},
+        {"_id": 0, "id": 1, "name": 1}
+    ).to_list(length=None)
+    for author_doc in author_docs:
+        # A user without a name projects to an empty document, which the
+        # per-recipe lookup treated as "not found"
+        if author_doc['id'] not in authors:
+            authors[author_doc['id']] = author_doc if 'name' in author_doc else None
+    authors = {author_id: doc for author_id, doc in authors.items() if doc}
+
+    recipe_counts = {}
+    if authors:
+        pipeline = [
+            {"$match": {
+                "author": {"$in": list(authors.keys())},
+                "is_published": True,
+                "approval_status": "approved"
+            }},
+            {"$group": {"_id": "$author", "count": {"$sum": 1}}}
+        ]
+        async for row in db.user_recipes.aggregate(pipeline):
+            recipe_counts[row['_id']] = row['count']
+
+    for recipe in recipes:
+        if recipe.get('author') and recipe.get('author') != 'system':
+            author_doc = authors.get(recipe['author'])
+            if author_doc:
+                recipe['author_name'] = author_doc.get('name', 'Ukendt')
+                recipe['author_recipe_count'] = recipe_counts.get(recipe['author'], 0)
+            else:
+                recipe['author_name'] = 'Ukendt'
+                recipe['author_recipe_count'] = 0
+
+    return recipes
+
+
+async def enrich_recipes(db, recipes: List[Dict], session_id: Optional[str] = None) -> List[Dict]:
+    """
+    Add favorite/rating info (when a session is given) and author info to recipes.
+    """
+    if session_id:
+        await attach_session_info(db, recipes, session_id)
+    await attach_author_info(db, recipes)
+    return recipes
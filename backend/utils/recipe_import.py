@@ -0,0 +1,191 @@
+"""
+Recipe Import
+Shared engine for bulk recipe imports (admin endpoints and import scripts).
+
+Imports used to look up and write one recipe at a time (find_one followed by
+replace_one/insert_one per row). RecipeImport processes the rows in chunks:
+ingredients are normalized to base units for the whole chunk, existing
+recipes are found with a single $in query on the import key (id, or name
+within a scope such as the admin's own recipes), and the chunk is written
+with one unordered bulk_write. The result has one entry per input row and
+dry_run=True reports the same without writing anything.
+
+Rows are applied as if in order: when the same key appears twice, the later
+row updates the recipe created by the earlier one (only the final document
+is written).
+
+A chunk whose lookup or write fails (a timeout, a lost connection) is
+reported as errors row by row and the import goes on with the next chunk, so
+the caller still learns which rows were stored.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from utils.unit_converter import normalize_ingredient
+
+logger = logging.getLogger(__name__)
+
+# prepare(row, existing) -> document to store; existing is None for new recipes.
+# Raise ValueError to reject the row.
+PrepareFn = Callable[[Dict, Optional[Dict]], Dict]
+
+
+def normalize_ingredients(recipe: Dict) -> None:
+    """Add base-unit fields (quantity_ml/quantity_g, display_*) to ingredients that lack them"""
+    ingredients = recipe.get("ingredients")
+    if not isinstance(ingredients, list):
+        return
+    for i, ingredient in enumerate(ingredients):
+        if not isinstance(ingredient, dict) or "unit_type" in ingredient:
+            continue
+        try:
+            ingredients[i] = normalize_ingredient(ingredient)
+        except (ValueError, TypeError) as e:
+            # Same fallback as create_recipe: keep the original quantity
+            logger.warning(f"Could not normalize ingredient {ingredient.get('name')}: {e}")
+            ingredient.setdefault("quantity_ml", ingredient.get("quantity", 0))
+
+
+class ImportReport:
+    """Per-row results plus totals"""
+
+    def __init__(self, dry_run: bool):
+        self.dry_run = dry_run
+        self.results: List[Dict[str, Any]] = []
+
+    def add(self, row: int, recipe: Dict, status: str, error: Optional[str] = None) -> Dict[str, Any]:
+        result = {"row": row, "id": recipe.get("id"), "name": recipe.get("name", "Unknown"), "status": status}
+        if error:
+            result["error"] = error
+        self.results.append(result)
+        return result
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result["status"] == status)
+
+    @property
+    def created(self) -> int:
+        return self.count("created")
+
+    @property
+    def updated(self) -> int:
+        return self.count("updated")
+
+    @property
+    def errors(self) -> int:
+        return self.count("error")
+
+
+class RecipeImport:
+    """
+    Upserts recipes into one collection, matched on key_field ("id" or "name")
+    within an optional scope filter (e.g. {"author": user_id}).
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        key_field: str = "id",
+        prepare: Optional[PrepareFn] = None,
+        scope: Optional[Dict] = None,
+        existing_projection: Optional[Dict] = None,
+        normalize: bool = True,
+        chunk_size: int = 500,
+    ):
+        self.collection = collection
+        self.key_field = key_field
+        self.prepare = prepare or (lambda row, existing: row)
+        self.scope = scope or {}
+        self.existing_projection = existing_projection or {"_id": 0}
+        self.normalize = normalize
+        self.chunk_size = chunk_size
+
+    async def run(self, db, rows: List[Dict], dry_run: bool = False) -> ImportReport:
+        report = ImportReport(dry_run)
+        # key -> latest document for keys seen in this import / already in the database
+        seen: Dict[Any, Dict] = {}
+        in_db: set = set()
+
+        for start in range(0, len(rows), self.chunk_size):
+            await self._run_chunk(db, rows[start:start + self.chunk_size], start, report, seen, in_db, dry_run)
+        return report
+
+    async def _run_chunk(self, db, chunk, offset, report, seen, in_db, dry_run) -> None:
+        keys = {
+            row.get(self.key_field) for row in chunk
+            if isinstance(row, dict) and row.get(self.key_field) and row.get(self.key_field) not in seen
+        }
+        if keys:
+            try:
+                cursor = db[self.collection].find({**self.scope, self.key_field: {"$in": list(keys)}}, self.existing_projection)
+                async for existing in cursor:
+                    key = existing.get(self.key_field)
+                    if key not in seen:
+                        seen[key] = existing
+                        in_db.add(key)
+            except Exception as e:
+                logger.error(f"Recipe import: lookup for rows {offset}-{offset + len(chunk) - 1} failed: {e}")
+                for index, row in enumerate(chunk, start=offset):
+                    report.add(index, row if isinstance(row, dict) else {}, "error", f"Lookup failed: {e}")
+                return
+
+        # key -> (document, result entries of the rows that produced it)
+        pending: Dict[Any, Dict] = {}
+        entries: Dict[Any, List[Dict]] = {}
+        for index, row in enumerate(chunk, start=offset):
+            if not isinstance(row, dict):
+                report.add(index, {}, "error", "Not a recipe object")
+                continue
+            key = row.get(self.key_field)
+            if not key:
+                report.add(index, row, "error", f"Mangler {'ID' if self.key_field == 'id' else self.key_field}")
+                continue
+            existing = seen.get(key)
+            try:
+                document = self.prepare(row, existing)
+                if self.normalize:
+                    normalize_ingredients(document)
+            except (ValueError, TypeError) as e:
+                report.add(index, row, "error", str(e))
+                continue
+            seen[key] = document
+            pending[key] = document
+            entries.setdefault(key, []).append(
+                report.add(index, document, "updated" if existing is not None else "created")
+            )
+
+        if dry_run or not pending:
+            return
+
+        keys = list(pending)
+        operations = [
+            ReplaceOne({"id": pending[key]["id"]}, pending[key]) if key in in_db else InsertOne(pending[key])
+            for key in keys
+        ]
+        try:
+            await db[self.collection].bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                key = keys[error["index"]]
+                for entry in entries[key]:
+                    entry["status"] = "error"
+                    entry["error"] = error.get("errmsg", "write failed")
+                # Nothing was stored for this key
+                seen.pop(key, None)
+            failed = {keys[error["index"]] for error in e.details.get("writeErrors", [])}
+            in_db.update(key for key in keys if key not in failed)
+            return
+        except Exception as e:
+            logger.error(f"Recipe import: write of rows {offset}-{offset + len(chunk) - 1} failed: {e}")
+            for key in keys:
+                for entry in entries[key]:
+                    entry["status"] = "error"
+                    entry["error"] = f"Write failed: {e}"
+                # Unknown whether it was stored; a later row with this key looks it up again
+                seen.pop(key, None)
+            return
+        in_db.update(keys)
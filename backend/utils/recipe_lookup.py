@@ -0,0 +1,82 @@
+"""
+Recipe Lookup
+Resolves a recipe id to its document and collection in one round trip.
+
+Recipes live in two collections: db.recipes (system catalog) and
+db.user_recipes. Handlers used to try db.recipes first and then
+db.user_recipes, sometimes twice. The ids of the system catalog are already
+in memory (CatalogSnapshot.ids), so the right collection is known up front
+and a single find_one fetches the document (for user recipes the approved
+copy is looked up first, since duplicates with the same id can exist in
+other approval states). Only when an id is in neither
+(e.g. a system recipe created on another worker since the snapshot was
+loaded, or a bad id) is db.recipes tried as well.
+
+Visibility rules of GET /api/recipes/{id} are evaluated on the fetched
+document instead of being encoded in extra queries.
+"""
+
+from typing import Any, Container, Dict, Optional
+
+SYSTEM_COLLECTION = "recipes"
+USER_COLLECTION = "user_recipes"
+
+
+class ResolvedRecipe:
+    """A recipe document and the collection it was found in"""
+
+    __slots__ = ("recipe", "collection")
+
+    def __init__(self, recipe: Dict, collection: str):
+        self.recipe = recipe
+        self.collection = collection
+
+    @property
+    def is_system(self) -> bool:
+        return self.collection == SYSTEM_COLLECTION
+
+
+async def resolve_recipe(
+    db,
+    recipe_id: str,
+    system_ids: Container[str],
+    projection: Optional[Dict] = None,
+) -> Optional[ResolvedRecipe]:
+    """Find a recipe in db.recipes or db.user_recipes (system recipes win, as before)"""
+    if projection is None:
+        projection = {"_id": 0}
+
+    if recipe_id in system_ids:
+        order = (SYSTEM_COLLECTION, USER_COLLECTION)
+    else:
+        order = (USER_COLLECTION, SYSTEM_COLLECTION)
+
+    for collection in order:
+        recipe = None
+        if collection == USER_COLLECTION:
+            # Pending or rejected duplicates can share the id; the approved copy wins, as before
+            recipe = await db[collection].find_one({"id": recipe_id, "approval_status": "approved"}, projection)
+        if recipe is None:
+            recipe = await db[collection].find_one({"id": recipe_id}, projection)
+        if recipe is not None:
+            return ResolvedRecipe(recipe, collection)
+    return None
+
+
+def is_visible(resolved: ResolvedRecipe, user: Any, session_id: Optional[str]) -> bool:
+    """
+    Whether GET /api/recipes/{id} may return this recipe:
+    - system recipes: published, or the user is admin
+    - user recipes: approved, or owned by the session / logged-in user
+    """
+    recipe = resolved.recipe
+    if resolved.is_system:
+        return bool(user and user.role == "admin") or bool(recipe.get("is_published", False))
+
+    if recipe.get("approval_status") == "approved":
+        return True
+    if not session_id:
+        return False
+    if recipe.get("session_id") == session_id:
+        return True
+    return bool(user) and recipe.get("author") in (user.id, user.email)
@@ -0,0 +1,323 @@
+"""
+Recipe Catalog Pagination
+Cursor-based pages over several recipe collections at once.
+
+The catalog is ordered like the unpaginated GET /api/recipes response:
+free recipes first, then newest first. Each source (system recipes, published
+user recipes, the caller's own recipes) is read with a Mongo sort on that key
+and the sources are k-way merged, so a page of N recipes only reads about N
+documents per source.
+
+created_at is an isoformat string for most recipes, but some import paths
+store a BSON date. Mongo sorts and compares each type separately (dates sort
+above all strings), so every source is read as two streams - dates and
+everything else - and the merge and the cursor work on the value normalised
+to a UTC ISO string. Stored strings differ in format after the seconds
+(naive, "Z", "+00:00", fractions), so Mongo's order of them is only right
+down to the second: each stream is reordered within a second while it is
+read, and the range filter for strings reads through the cursor's second and
+leaves the exact cut to Python.
+"""
+
+import base64
+import heapq
+import itertools
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Order within one free/non-free group: newest first, ties broken by id
+PAGE_SORT = [("created_at", -1), ("id", 1)]
+
+# Free recipes are read before non-free ones. Non-free also covers recipes
+# without an is_free field, which the unpaginated sort treats as False.
+GROUP_FILTERS = [
+    {"is_free": True},
+    {"is_free": {"$ne": True}},
+]
+
+# created_at streams read per source: BSON dates, and strings/missing values
+DATES = {"created_at": {"$type": "date"}}
+NON_DATES = {"created_at": {"$not": {"$type": "date"}}}
+STREAMS = [DATES, NON_DATES]
+
+# Sorts after any character, so prefix + _LAST is above every string with that prefix
+_LAST = chr(0x10FFFF)
+
+# Fields the pagination, enrichment and translation steps read themselves
+_INTERNAL_FIELDS = {"id", "is_free", "created_at", "author"}
+_TRANSLATED_FIELDS = {"name", "description", "steps", "ingredients"}
+
+
+def sort_value(created_at: Any) -> Optional[str]:
+    """created_at as the UTC ISO string the merge and the cursor compare"""
+    if created_at is None:
+        return None
+    if isinstance(created_at, str):
+        try:
+            created_at = datetime.fromisoformat(
+                created_at[:-1] + "+00:00" if created_at.endswith("Z") else created_at
+            )
+        except ValueError:
+            return created_at
+    if isinstance(created_at, datetime):
+        if created_at.tzinfo is None:
+            # Mongo hands back naive UTC datetimes
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at.astimezone(timezone.utc).isoformat()
+    return str(created_at)
+
+
+def _as_bson_date(value: str) -> Optional[datetime]:
+    """The cursor's ISO string as a (naive UTC) date to compare BSON dates with"""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def encode_cursor(position: Dict) -> str:
+    """Encode a page position as an opaque URL-safe token"""
+    # default=str: a position can never make the page fail
+    raw = json.dumps(position, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict:
+    """
+    Decode a token created by encode_cursor.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return {
+            "g": int(position["g"]),
+            "c": position["c"],
+            "s": int(position["s"]),
+            "i": str(position["i"]),
+        }
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """Parse a comma-separated fields= parameter (None means all fields)"""
+    if not fields:
+        return None
+    parsed = {field.strip() for field in fields.split(",") if field.strip()}
+    if not parsed:
+        return None
+    parsed.add("id")
+    return parsed
+
+
+def build_projection(fields: Optional[Set[str]], extra: Set[str] = frozenset()) -> Dict:
+    """
+    Build a Mongo projection for the requested fields.
+
+    Always keeps the fields needed to sort, enrich and translate the result;
+    those are removed again by trim_fields.
+    """
+    if fields is None:
+        return {"_id": 0}
+    needed = fields | _INTERNAL_FIELDS | set(extra)
+    if fields & _TRANSLATED_FIELDS:
+        needed |= _TRANSLATED_FIELDS | {"translations"}
+    projection = {field: 1 for field in sorted(needed)}
+    projection["_id"] = 0
+    return projection
+
+
+def trim_fields(recipe: Dict, fields: Optional[Set[str]]) -> Dict:
+    """Drop every key that was not requested with fields="""
+    if fields is None:
+        return recipe
+    return {key: value for key, value in recipe.items() if key in fields}
+
+
+class _PageKey:
+    """Merge key: newest first (missing created_at last), then source, then id"""
+
+    __slots__ = ("created_at", "source", "id")
+
+    def __init__(self, created_at, source: int, recipe_id: str):
+        self.created_at = sort_value(created_at)
+        self.source = source
+        self.id = recipe_id
+
+    def __lt__(self, other: "_PageKey") -> bool:
+        if self.created_at != other.created_at:
+            if self.created_at is None:
+                return False
+            if other.created_at is None:
+                return True
+            return self.created_at > other.created_at
+        return (self.source, self.id) < (other.source, other.id)
+
+
+def _after_filter(source: int, position: Dict, dates: bool = False) -> Optional[Dict]:
+    """
+    Query restricting one source's stream to recipes after the cursor position
+    (within the cursor's group). dates=True builds it for the BSON date stream.
+    Returns None if nothing can follow.
+    """
+    created_at, cursor_source, cursor_id = position["c"], position["s"], position["i"]
+    missing = {"created_at": None}
+
+    if dates:
+        # Dates never lack a value, so nothing follows a missing-created_at position
+        created_at = _as_bson_date(created_at) if created_at is not None else None
+        if created_at is None:
+            return None
+        if source > cursor_source:
+            return {"created_at": {"$lte": created_at}}
+        if source == cursor_source:
+            return {"$or": [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "id": {"$gt": cursor_id}},
+            ]}
+        return {"created_at": {"$lt": created_at}}
+
+    if created_at is None:
+        if source > cursor_source:
+            return missing
+        if source == cursor_source:
+            return {**missing, "id": {"$gt": cursor_id}}
+        return None
+
+    # Everything up to the end of the cursor's second; _Stream drops the
+    # documents of that second that do not follow the position
+    return {"$or": [{"created_at": {"$lt": created_at[:19] + _LAST}}, missing]}
+
+
+async def _next_doc(cursor, predicate: Optional[Callable[[Dict], bool]]) -> Optional[Dict]:
+    """Return the next document from a cursor that passes the predicate"""
+    while True:
+        try:
+            doc = await cursor.__anext__()
+        except StopAsyncIteration:
+            return None
+        if predicate is None or predicate(doc):
+            return doc
+
+
+class _Stream:
+    """
+    One source stream's documents in _PageKey order, starting after `after`.
+    Documents of the same second are read together and sorted by their
+    normalised key; missing created_at values come in id order from Mongo.
+    """
+
+    def __init__(self, cursor, source: int, predicate: Optional[Callable[[Dict], bool]], after: Optional[_PageKey]):
+        self._cursor = cursor
+        self._source = source
+        self._predicate = predicate
+        self._after = after
+        # Sorted last-first so the next item is pop()ed
+        self._ready: List[Tuple[_PageKey, Dict]] = []
+        self._held: Optional[Tuple[_PageKey, Dict]] = None
+
+    async def next(self) -> Optional[Tuple[_PageKey, Dict]]:
+        while not self._ready:
+            if not await self._read_second():
+                return None
+        return self._ready.pop()
+
+    async def _read_second(self) -> bool:
+        second = [self._held] if self._held else []
+        self._held = None
+        while not second or second[0][0].created_at is not None:
+            doc = await _next_doc(self._cursor, self._predicate)
+            if doc is None:
+                break
+            item = (_PageKey(doc.get("created_at"), self._source, doc["id"]), doc)
+            if second and (item[0].created_at or "")[:19] != second[0][0].created_at[:19]:
+                self._held = item
+                break
+            second.append(item)
+        if not second:
+            return False
+        self._ready = sorted(
+            (item for item in second if self._after is None or self._after < item[0]),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        return True
+
+
+async def paginate_recipe_sources(
+    sources: List[Tuple[object, Dict]],
+    limit: int,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict] = None,
+    predicate: Optional[Callable[[Dict], bool]] = None,
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Read one page from several (collection, query) sources.
+
+    Args:
+        sources: Collections and queries in tie-break order
+        limit: Page size
+        cursor: Token from a previous page's next_cursor
+        projection: Mongo projection applied to every source
+        predicate: Optional Python-side filter applied while merging
+
+    Returns:
+        (recipes, next_cursor) - next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    position = decode_cursor(cursor) if cursor else None
+    projection = projection or {"_id": 0}
+
+    page = []
+    positions = []
+    # Tie-breaker so the heap never compares documents (ids are not unique in old data)
+    sequence = itertools.count()
+    for group, group_filter in enumerate(GROUP_FILTERS):
+        if position and group < position["g"]:
+            continue
+
+        resume = position and group == position["g"]
+        after_key = _PageKey(position["c"], position["s"], position["i"]) if resume else None
+        heap = []
+        for source, (collection, query) in enumerate(sources):
+            for stream_filter in STREAMS:
+                clauses = [query, group_filter, stream_filter]
+                if resume:
+                    after = _after_filter(source, position, dates=stream_filter is DATES)
+                    if after is None:
+                        continue
+                    clauses.append(after)
+                mongo_cursor = collection.find({"$and": clauses}, projection).sort(PAGE_SORT).batch_size(limit + 1)
+                stream = _Stream(mongo_cursor, source, predicate, after_key)
+                item = await stream.next()
+                if item is not None:
+                    heapq.heappush(heap, (item[0], next(sequence), stream, item[1]))
+
+        while heap and len(page) <= limit:
+            key, _, stream, doc = heapq.heappop(heap)
+            page.append(doc)
+            positions.append({"g": group, "c": key.created_at, "s": key.source, "i": key.id})
+            item = await stream.next()
+            if item is not None:
+                heapq.heappush(heap, (item[0], next(sequence), stream, item[1]))
+
+        if len(page) > limit:
+            break
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(positions[limit - 1])
+    return page, next_cursor
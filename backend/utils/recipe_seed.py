@@ -0,0 +1,142 @@
+"""
+Recipe Seeding
+Hash-gated seeding of the system recipes from seed_data/recipes.json.
+
+seed_recipes() used to build a ~1600-line inline list on every import of
+server.py and upsert every recipe on every boot of every worker. The seed
+recipes now live in a data file that is only parsed when seeding actually
+runs. A SHA-256 of the seed file, the translations file and SEED_FORMAT is
+stored in db.app_state; when it matches, startup costs one find_one and
+nothing is parsed or written.
+
+Seeding upserts by (name, author="system") in one unordered bulk_write.
+Fields that change at runtime (id, created_at, ratings, views, free/published
+flags) are only set when a recipe is first inserted, so re-seeding after a
+data change updates content and translations without resetting them.
+
+Deleting all system recipes (POST /api/admin/delete-all-recipes) forgets the
+stored hash, so the next startup or manage.py --seed puts them back.
+
+Run it explicitly with: python manage.py --seed [--force]
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_FILE = os.path.join(BACKEND_DIR, 'seed_data', 'recipes.json')
+TRANSLATIONS_FILE = os.path.join(BACKEND_DIR, 'recipe_translations.json')
+
+# Bump when the way documents are built from the seed data changes
+SEED_FORMAT = "1"
+STATE_ID = "recipe_seed"
+
+# Set on insert only - these belong to the live recipe once it exists
+INSERT_ONLY_FIELDS = ("id", "created_at", "rating_avg", "rating_count", "view_count", "is_free", "is_published")
+
+
+def seed_hash(seed_file: str = SEED_FILE, translations_file: str = TRANSLATIONS_FILE) -> str:
+    """Content hash of everything that determines the seeded documents"""
+    digest = hashlib.sha256(SEED_FORMAT.encode())
+    for path in (seed_file, translations_file):
+        digest.update(b"\0" + path.rsplit(os.sep, 1)[-1].encode() + b"\0")
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def load_seed_recipes(seed_file: str = SEED_FILE) -> List[Dict]:
+    with open(seed_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_translations(translations_file: str = TRANSLATIONS_FILE) -> Dict[str, Dict]:
+    """recipe_translations.json keyed by recipe name (empty if missing or unreadable)"""
+    try:
+        if not os.path.exists(translations_file):
+            logger.warning(f"[SEED] Translations file not found at {translations_file}")
+            return {}
+        with open(translations_file, 'r', encoding='utf-8') as f:
+            translations = json.load(f)
+    except Exception as e:
+        logger.warning(f"[SEED] Could not load recipe translations: {e}")
+        return {}
+    by_name = {}
+    for trans_data in translations.values():
+        # First entry per name wins, as before
+        by_name.setdefault(trans_data['name'], trans_data['translations'])
+    return by_name
+
+
+def build_seed_docs(recipes: List[Dict], translations: Dict[str, Dict], make_doc: Callable[[Dict], Dict]) -> List[Dict]:
+    """Documents to upsert; make_doc turns seed data into a recipe document"""
+    docs = []
+    for recipe_data in recipes:
+        doc = make_doc(recipe_data)
+        if recipe_data['name'] in translations:
+            doc['translations'] = translations[recipe_data['name']]
+
+        # Ensure Danish translation exists
+        if 'translations' not in doc or 'da' not in doc.get('translations', {}):
+            doc['translations'] = {
+                'da': {
+                    'name': recipe_data['name'],
+                    'description': recipe_data.get('description', ''),
+                    'steps': recipe_data.get('steps', [])
+                }
+            }
+        docs.append(doc)
+    return docs
+
+
+async def seed_recipes(db, make_doc: Callable[[Dict], Dict], force: bool = False) -> Dict[str, Any]:
+    """
+    Upsert the seed recipes unless the stored hash says they are current.
+    Returns {"seeded": bool, "hash": str, "recipes": int, "errors": int}.
+    """
+    current = seed_hash()
+    if not force:
+        state: Optional[Dict] = await db.app_state.find_one({"id": STATE_ID}, {"_id": 0, "hash": 1})
+        if state and state.get("hash") == current:
+            logger.info("[SEED] Seed data unchanged - skipping")
+            return {"seeded": False, "hash": current, "recipes": 0, "errors": 0}
+
+    docs = build_seed_docs(load_seed_recipes(), load_translations(), make_doc)
+    operations = []
+    for doc in docs:
+        on_insert = {field: doc.pop(field) for field in INSERT_ONLY_FIELDS if field in doc}
+        operations.append(UpdateOne(
+            {'name': doc['name'], 'author': 'system'},
+            {'$set': doc, '$setOnInsert': on_insert},
+            upsert=True
+        ))
+
+    errors = 0
+    try:
+        await db.recipes.bulk_write(operations, ordered=False)
+    except Exception as e:
+        errors = len(getattr(e, 'details', {}).get('writeErrors', [])) or len(operations)
+        logger.warning(f"[SEED] Failed to upsert {errors} seed recipes: {e}")
+
+    if not errors:
+        # Only a complete seed is recorded, so a failed one is retried next time
+        await db.app_state.update_one(
+            {"id": STATE_ID},
+            {"$set": {"id": STATE_ID, "hash": current, "recipes": len(docs)}},
+            upsert=True
+        )
+    logger.info(f"[SEED] Seeded {len(docs)} recipes with translations ({errors} errors)")
+    return {"seeded": True, "hash": current, "recipes": len(docs), "errors": errors}
+
+
+async def forget_seed(db) -> None:
+    """Drop the stored hash so the next startup or manage.py --seed seeds again"""
+    await db.app_state.delete_one({"id": STATE_ID})
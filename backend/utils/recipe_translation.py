@@ -0,0 +1,74 @@
+"""
+Recipe Translation
+Per-language projections of recipe documents.
+
+A recipe stores its texts for every language in `translations`. Clients only
+need the language they asked for, so projections drop the `translations`
+object (admins, who edit translations, still get it). The catalog cache
+materializes the projection of every supported language once per catalog
+load, i.e. once after each write, instead of per request.
+"""
+
+from typing import Dict, Optional
+
+# Languages the frontend ships; projections are precomputed for these
+SUPPORTED_LANGUAGES = ("da", "en", "de", "fr", "en_us")
+
+# Tried in order when the requested language has no translation
+FALLBACK_LANGUAGES = ("en", "da")
+
+
+def resolve_translation(translations: Dict, lang: str) -> Optional[Dict]:
+    """The translation for `lang`, falling back to English, then Danish"""
+    for candidate in (lang,) + FALLBACK_LANGUAGES:
+        if candidate in translations:
+            return translations[candidate]
+    return None
+
+
+def apply_translation(recipe: dict, lang: str = "da", include_translations: bool = True) -> dict:
+    """
+    Apply language-specific translation to recipe.
+    Falls back to English if requested language not available.
+    Falls back to Danish if English not available.
+    With include_translations=False the `translations` object is left out.
+    """
+    # If no translations field, return as-is (legacy recipe or user recipe)
+    if "translations" not in recipe:
+        return recipe
+
+    translations = recipe.get("translations", {})
+    translation = resolve_translation(translations, lang)
+
+    # No translations available
+    if translation is None:
+        if include_translations:
+            return recipe
+        return {key: value for key, value in recipe.items() if key != "translations"}
+
+    # Apply translation to recipe
+    recipe_copy = recipe.copy()
+    recipe_copy["name"] = translation.get("name", recipe.get("name", ""))
+    recipe_copy["description"] = translation.get("description", recipe.get("description", ""))
+    recipe_copy["steps"] = translation.get("steps", recipe.get("steps", []))
+
+    # Apply translated ingredients if available
+    if "ingredients" in translation:
+        recipe_copy["ingredients"] = translation["ingredients"]
+
+    # Mark which language is currently displayed
+    recipe_copy["_current_language"] = lang
+    recipe_copy["_available_languages"] = list(translations.keys())
+
+    if not include_translations:
+        del recipe_copy["translations"]
+
+    return recipe_copy
+
+
+def with_translations(view: dict, recipe: dict) -> dict:
+    """Add the full translations object of `recipe` back onto a projection"""
+    if "translations" in recipe and "translations" not in view:
+        return {**view, "translations": recipe["translations"]}
+    return view
+
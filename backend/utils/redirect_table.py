@@ -0,0 +1,140 @@
+"""
+Redirect Routing Table
+In-memory mapping_id -> per-country target URL table for /api/go/{mapping_id}.
+
+The redirect used to query the active options of a mapping on every click
+and scan them per country. The table holds, for every mapping, the final
+(affiliate-wrapped, UTM-tagged) URL per country and the default URL used
+when the visitor's country has no option, so a redirect is two dict lookups.
+
+Selection is unchanged: options are ordered newest first (updatedAt); the
+visitor's country wins, then DK, US, GB, then the newest option. An option
+without country_codes counts as DK/US/GB.
+
+The admin endpoints that write options call refresh() so the change is live
+immediately on this worker; other workers pick it up within ttl_seconds
+(refreshed in the background while the old table keeps serving).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Countries tried after the visitor's own country
+FALLBACK_COUNTRIES = ("DK", "US", "GB")
+
+
+class MappingRoutes:
+    """Precomputed targets of one mapping"""
+
+    __slots__ = ("by_country", "default_url")
+
+    def __init__(self, by_country: Dict[str, str], default_url: str):
+        self.by_country = by_country
+        self.default_url = default_url
+
+    def target(self, country: Optional[str]) -> str:
+        if country:
+            url = self.by_country.get(country.upper())
+            if url is not None:
+                return url
+        return self.default_url
+
+
+def build_routes(options: List[Dict], make_url: Callable[[str], str]) -> MappingRoutes:
+    """Routes for one mapping from its active options, newest first"""
+    by_country: Dict[str, str] = {}
+    for option in options:
+        for country in option.get("country_codes", FALLBACK_COUNTRIES) or ():
+            if country not in by_country:
+                by_country[country] = make_url(option["url"])
+
+    default_url = next(
+        (by_country[country] for country in FALLBACK_COUNTRIES if country in by_country),
+        None
+    )
+    if default_url is None:
+        default_url = make_url(options[0]["url"])
+    return MappingRoutes(by_country, default_url)
+
+
+def build_table(options: Iterable[Dict], make_url: Callable[[str], str]) -> Dict[str, MappingRoutes]:
+    """Group active options by mapping and precompute every mapping's routes"""
+    grouped: Dict[str, List[Dict]] = {}
+    for option in options:
+        grouped.setdefault(option["mappingId"], []).append(option)
+    table = {}
+    for mapping_id, mapping_options in grouped.items():
+        # Stable sort keeps the load order for equal timestamps
+        mapping_options.sort(key=lambda o: o.get("updatedAt") or "", reverse=True)
+        table[mapping_id] = build_routes(mapping_options, make_url)
+    return table
+
+
+class RedirectTable:
+    """Holds the current routing table and reloads it from redirect_options"""
+
+    def __init__(self, make_url: Callable[[str], str], fallback_url: str, ttl_seconds: Optional[float] = 60):
+        self._make_url = make_url
+        self._fallback_url = fallback_url
+        self.ttl_seconds = ttl_seconds or None
+        self._table: Optional[Dict[str, MappingRoutes]] = None
+        self._fallback_target: Optional[str] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._background: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.fallbacks = 0
+        self.reloads = 0
+
+    async def refresh(self, db, if_missing: bool = False) -> None:
+        """Rebuild the table from the active options (call after writing options)"""
+        async with self._lock:
+            if if_missing and self._table is not None:
+                return
+            options = await db.redirect_options.find(
+                {"status": "active"},
+                {"_id": 0, "mappingId": 1, "url": 1, "country_codes": 1, "updatedAt": 1}
+            ).to_list(length=None)
+            self._table = build_table(options, self._make_url)
+            self._fallback_target = self._make_url(self._fallback_url)
+            self._loaded_at = time.monotonic()
+            self.reloads += 1
+
+    async def _refresh_quietly(self, db) -> None:
+        try:
+            await self.refresh(db)
+        except Exception as e:
+            logger.warning(f"Failed to refresh redirect table: {e}")
+
+    async def resolve(self, db, mapping_id: str, country: Optional[str]) -> str:
+        """Target URL for a click; only the very first call waits for a load"""
+        if self._table is None:
+            await self.refresh(db, if_missing=True)
+        elif (
+            self.ttl_seconds is not None
+            and time.monotonic() - self._loaded_at >= self.ttl_seconds
+            and (self._background is None or self._background.done())
+        ):
+            self._background = asyncio.create_task(self._refresh_quietly(db))
+
+        routes = self._table.get(mapping_id)
+        if routes is None:
+            self.fallbacks += 1
+            return self._fallback_target
+        self.hits += 1
+        return routes.target(country)
+
+    def stats(self) -> Dict:
+        return {
+            "loaded": self._table is not None,
+            "mappings": len(self._table) if self._table is not None else 0,
+            "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._table is not None else None,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "reloads": self.reloads,
+        }
@@ -0,0 +1,185 @@
+"""
+Session Cache
+Short-lived in-process cache of resolved sessions (token -> User) and a
+write-behind buffer for the rolling session expiry.
+
+get_current_user runs on almost every request. With the cache, a hit needs
+no database round trip at all; the rolling expires_at/last_active update is
+recorded in SessionTouchBuffer and written at most once per session per
+interval, in one unordered bulk_write for all sessions.
+
+The cache only sees this worker's invalidations, so the TTL is kept short:
+a logout, role change or password reset handled by another worker becomes
+visible here within ttl_seconds.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Set
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """LRU of session token -> resolved user, with a TTL per entry"""
+
+    def __init__(self, ttl_seconds: float = 30, max_size: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        # token -> (user, user_id, cached_at)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._user_tokens: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[Any]:
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+        user, _, cached_at = entry
+        if time.monotonic() - cached_at >= self.ttl_seconds:
+            self.invalidate_token(token)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return user
+
+    def put(self, token: str, user: Any, user_id: str) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self.invalidate_token(token)
+        self._entries[token] = (user, user_id, time.monotonic())
+        self._user_tokens.setdefault(user_id, set()).add(token)
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self.invalidate_token(oldest)
+
+    def invalidate_token(self, token: str) -> None:
+        """Forget one session (logout)"""
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        tokens = self._user_tokens.get(entry[1])
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._user_tokens[entry[1]]
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Forget every session of a user (role/profile change, device logout, deletion)"""
+        for token in list(self._user_tokens.get(user_id, ())):
+            self.invalidate_token(token)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+class SessionTouchBuffer:
+    """
+    Write-behind buffer for the rolling session expiry. touch() records the
+    latest activity per token; flush() writes every pending token whose last
+    write is at least interval_seconds old.
+    """
+
+    def __init__(self, interval_seconds: float = 60, expire_days: int = 30, max_pending: int = 5000):
+        self.interval_seconds = interval_seconds
+        self.expire_days = expire_days
+        self.max_pending = max_pending
+        # token -> latest activity not yet written
+        self._pending: Dict[str, datetime] = {}
+        # token -> monotonic time of the last write
+        self._written: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+        self.flushes = 0
+        self.writes = 0
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def needs_immediate_write(self, expires_at: datetime, now: datetime) -> bool:
+        """
+        True when a session would expire before the next flush, so the
+        rolled expiry must be written right away.
+        """
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at - now < timedelta(seconds=self.interval_seconds * 2)
+
+    def touch(self, token: str, now: Optional[datetime] = None) -> None:
+        self._pending[token] = now or datetime.now(timezone.utc)
+
+    def mark_written(self, token: str) -> None:
+        self._pending.pop(token, None)
+        self._written[token] = time.monotonic()
+
+    def discard(self, token: str) -> None:
+        """Drop pending activity for a session that was deleted"""
+        self._pending.pop(token, None)
+        self._written.pop(token, None)
+
+    async def flush(self, db, force: bool = False) -> int:
+        """Write due touches in one bulk_write; returns the number of sessions written"""
+        async with self._lock:
+            cutoff = time.monotonic() - self.interval_seconds
+            due = [
+                (token, last_active) for token, last_active in self._pending.items()
+                if force or token not in self._written or self._written[token] <= cutoff
+            ]
+            # Tokens not written for a full interval have nothing left to throttle
+            self._written = {t: ts for t, ts in self._written.items() if ts > cutoff}
+            if not due:
+                return 0
+
+            expire_delta = timedelta(days=self.expire_days)
+            operations = [
+                UpdateOne(
+                    {"session_token": token},
+                    {"$set": {"expires_at": last_active + expire_delta, "last_active": last_active}}
+                )
+                for token, last_active in due
+            ]
+            try:
+                await db.user_sessions.bulk_write(operations, ordered=False)
+            except Exception as e:
+                logger.warning(f"Failed to flush {len(operations)} session touches: {e}")
+                return 0
+
+            written_at = time.monotonic()
+            for token, last_active in due:
+                self._written[token] = written_at
+                # Keep activity that arrived while writing for the next flush
+                if self._pending.get(token) == last_active:
+                    del self._pending[token]
+            self.flushes += 1
+            self.writes += len(operations)
+            return len(operations)
+
+    async def run(self, db) -> None:
+        """Flush every interval until cancelled"""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.flush(db)
+
+    def stats(self) -> Dict:
+        return {
+            "pending": len(self._pending),
+            "interval_seconds": self.interval_seconds,
+            "flushes": self.flushes,
+            "writes": self.writes,
+        }
@@ -0,0 +1,134 @@
+"""
+Startup Profile
+Opt-in timing of worker boot: module imports, startup phases and the first request.
+
+With STARTUP_PROFILE=1 an import hook records how long every module takes to
+import (cumulative, like `python -X importtime`), named marks record the
+phases of app construction and the startup event, and the time and peak RSS
+at the first request are captured. The report is logged on the first request
+and served at GET /api/admin/startup-profile.
+
+Without the flag nothing is hooked and mark() is a no-op, so the profile
+costs nothing in normal operation.
+"""
+
+import importlib.abc
+import logging
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get('STARTUP_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+
+def _peak_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Delegates to the real loader and times exec_module"""
+
+    def __init__(self, loader, record):
+        self._loader = loader
+        self._record = record
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._record(module.__name__, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Asks the other finders for the spec and wraps its loader"""
+
+    def __init__(self, record):
+        self._record = record
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self._record)
+            return spec
+        return None
+
+
+class StartupProfile:
+    """Collects import timings and boot phase marks (no-op unless enabled)"""
+
+    def __init__(self, enabled: bool = ENABLED):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.imports: Dict[str, float] = {}
+        self.marks: List[Tuple[str, float]] = []
+        self.first_request: Optional[float] = None
+        self.first_request_rss_kb: Optional[int] = None
+        self._finder: Optional[_TimingFinder] = None
+        if enabled:
+            self._finder = _TimingFinder(self._record_import)
+            sys.meta_path.insert(0, self._finder)
+
+    def _record_import(self, name: str, seconds: float) -> None:
+        self.imports[name] = seconds
+
+    def mark(self, name: str) -> None:
+        """Record the time since the profile started under `name`"""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - self.started))
+
+    def request_started(self) -> bool:
+        """Record the first request; True only the first time"""
+        if not self.enabled or self.first_request is not None:
+            return False
+        self.first_request = time.perf_counter() - self.started
+        self.first_request_rss_kb = _peak_rss_kb()
+        # Later imports are lazy loads at runtime, not boot cost
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        return True
+
+    def report(self, top: int = 30) -> Dict:
+        slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top]
+        return {
+            "enabled": self.enabled,
+            "marks": [{"name": name, "ms": round(seconds * 1000, 1)} for name, seconds in self.marks],
+            "time_to_first_request_ms": round(self.first_request * 1000, 1) if self.first_request is not None else None,
+            "peak_rss_kb": self.first_request_rss_kb if self.first_request_rss_kb is not None else _peak_rss_kb(),
+            "modules_imported": len(self.imports),
+            "slowest_imports": [{"module": name, "cumulative_ms": round(seconds * 1000, 1)} for name, seconds in slowest],
+        }
+
+    def log_report(self) -> None:
+        report = self.report(top=15)
+        logger.info(
+            f"[STARTUP] first request after {report['time_to_first_request_ms']} ms, "
+            f"peak RSS {report['peak_rss_kb']} KiB, {report['modules_imported']} modules imported"
+        )
+        for mark in report["marks"]:
+            logger.info(f"[STARTUP] {mark['ms']:>8} ms  {mark['name']}")
+        for entry in report["slowest_imports"]:
+            logger.info(f"[STARTUP] import {entry['cumulative_ms']:>8} ms  {entry['module']}")
+
+
+startup_profile = StartupProfile()
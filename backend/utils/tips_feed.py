@@ -0,0 +1,204 @@
+"""
+Tips Feed
+Ranked, keyset-paginated tips feed with a first-page cache.
+
+GET /api/tips loaded up to 10,000 approved tips, parsed their dates and
+sorted them in Python by likes, then age; the admin lists did the same by
+date. Every tip now stores a rank_score combining likes and recency, set when
+the tip is created, liked or approved, so the feed is a Mongo sort on
+(rank_score, id) over a compound index for each filter the endpoint accepts
+(category, country/language, international), read one page at a time.
+
+rank_score = log10(1 + likes) + published / LIKES_DECADE_SECONDS, i.e. ten
+times the likes is worth a week of recency. "published" is approved_at for
+tips approved by an admin and created_at for tips published on creation.
+The score only depends on the tip itself, so it never has to decay or be
+recomputed on a schedule. Tips are scored when they are created, approved or
+liked; every startup scores the tips that still have no score (all of them
+when RANK_FORMAT changed), and a page that ends on an unscored tip scores
+them before it is returned, so the feed never stops at one.
+
+First pages (no cursor) are cached per worker for each filter combination
+and page size. Every tip write invalidates the cache; the TTL bounds how
+long other workers' writes take to show up.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from utils.keyset import decode_position, descending, encode_position, older_than
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+# What the unpaginated endpoints returned at most
+UNPAGINATED_LIMIT = 10000
+
+LIKES_DECADE_SECONDS = 7 * 24 * 3600
+
+# Bump when rank_score() changes so stored scores are recomputed on startup
+RANK_FORMAT = "1"
+STATE_ID = "tips_rank"
+
+# Matches a missing or null rank_score
+UNSCORED = {"rank_score": None}
+
+
+def _timestamp(value: Any) -> float:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return 0.0
+
+
+def rank_score(tip: Dict, likes: Optional[int] = None) -> float:
+    """Feed ranking of a tip (with `likes` instead of the stored count, if given)"""
+    likes = tip.get("likes", 0) if likes is None else likes
+    published = tip.get("approved_at") or tip.get("created_at")
+    return round(math.log10(1 + max(0, likes or 0)) + _timestamp(published) / LIKES_DECADE_SECONDS, 9)
+
+
+async def score_tips(db, query: Dict[str, Any], batch_size: int = 500) -> int:
+    """Store rank_score on the tips matching query; returns how many were scored"""
+    scored = 0
+    operations = []
+    async for tip in db.tips_and_tricks.find(query, {"_id": 0, "id": 1, "likes": 1, "created_at": 1, "approved_at": 1}).batch_size(batch_size):
+        if not tip.get("id"):
+            continue
+        operations.append(UpdateOne(
+            {"id": tip["id"]},
+            {"$set": {"rank_score": rank_score(tip)}}
+        ))
+        if len(operations) >= batch_size:
+            await db.tips_and_tricks.bulk_write(operations, ordered=False)
+            scored += len(operations)
+            operations = []
+    if operations:
+        await db.tips_and_tricks.bulk_write(operations, ordered=False)
+        scored += len(operations)
+    return scored
+
+
+async def backfill_rank_scores(db, batch_size: int = 500) -> Dict[str, Any]:
+    """Score the unscored tips, or every tip if the stored RANK_FORMAT is outdated"""
+    state = await db.app_state.find_one({"id": STATE_ID}, {"_id": 0, "format": 1})
+    current = bool(state) and state.get("format") == RANK_FORMAT
+
+    scored = await score_tips(db, UNSCORED if current else {}, batch_size)
+    if not current:
+        await db.app_state.update_one({"id": STATE_ID}, {"$set": {"id": STATE_ID, "format": RANK_FORMAT}}, upsert=True)
+    if scored:
+        logger.info(f"Scored {scored} tips for the ranked feed")
+    return {"scored": scored, "rescored_all": not current}
+
+
+def parse_dates(tips: List[Dict]) -> None:
+    for tip in tips:
+        if isinstance(tip.get('created_at'), str):
+            tip['created_at'] = datetime.fromisoformat(tip['created_at'])
+        if isinstance(tip.get('updated_at'), str):
+            tip['updated_at'] = datetime.fromisoformat(tip['updated_at'])
+
+
+async def read_page(
+    db,
+    query: Dict[str, Any],
+    sort_field: str,
+    limit: Optional[int],
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Tips matching query in descending (sort_field, id) order, dates parsed.
+    limit=None reads up to UNPAGINATED_LIMIT and never returns a next_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    page_query = query
+    if cursor:
+        page_query = {"$and": [query, older_than(*decode_position(cursor), field=sort_field)]}
+    fetch = UNPAGINATED_LIMIT if limit is None else limit + 1
+
+    tips = await db.tips_and_tricks.find(page_query, {"_id": 0}).sort(descending(sort_field)).limit(fetch).to_list(length=None)
+
+    if sort_field == "rank_score" and tips and tips[-1].get(sort_field) is None:
+        # A tip written without a score (which sorts last) would end the feed;
+        # score the unscored tips and read the page again
+        try:
+            if await score_tips(db, {"$and": [query, UNSCORED]}):
+                tips = await db.tips_and_tricks.find(page_query, {"_id": 0}).sort(descending(sort_field)).limit(fetch).to_list(length=None)
+        except Exception as e:
+            logger.warning(f"Could not score tips for the feed: {e}")
+
+    next_cursor = None
+    if limit is not None and len(tips) > limit:
+        tips = tips[:limit]
+        # A tip that still has no score (scoring failed) cannot be a position
+        if tips[-1].get(sort_field) is not None:
+            next_cursor = encode_position(tips[-1], field=sort_field)
+    parse_dates(tips)
+    return tips, next_cursor
+
+
+def page_size(limit: Optional[int]) -> Optional[int]:
+    return None if limit is None else max(1, min(limit, MAX_PAGE_SIZE))
+
+
+class TipsFeedCache:
+    """First pages of the feed per filter key, with a TTL and full invalidation on writes"""
+
+    def __init__(self, ttl_seconds: float = 30, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        # Bumped by invalidate(); pages read before a write are not stored
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[1] >= self.ttl_seconds:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, value: Any, version: int) -> None:
+        """Store a page read while the cache was at `version`"""
+        if self.ttl_seconds <= 0 or version != self.version:
+            return
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached page after a write to db.tips_and_tricks"""
+        self._entries.clear()
+        self.version += 1
+        self.invalidations += 1
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,98 @@
+"""
+Recipe View Buffer
+In-process buffer for recipe detail views, written to Mongo in batches.
+
+GET /api/recipes/{id} used to $inc db.recipes.view_count and insert a
+db.recipe_views event before responding. Views are now recorded here:
+increments are aggregated per recipe (a popular recipe costs one update per
+flush, not one per view) and events are collected for one insert_many.
+A background task flushes every interval; when more than max_pending views
+are buffered the next recorder flushes inline (backpressure), so memory stays
+bounded even if the background task falls behind. The app flushes on shutdown.
+
+View counts and the admin's recipe_views list lag by at most one interval.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+
+class RecipeViewBuffer:
+    """Aggregates view_count increments and recipe_views events between flushes"""
+
+    def __init__(self, interval_seconds: float = 5, max_pending: int = 5000):
+        self.interval_seconds = interval_seconds
+        self.max_pending = max_pending
+        self._counts: Dict[str, int] = {}
+        self._events: List[Dict] = []
+        self._pending = 0
+        self._lock = asyncio.Lock()
+        self.flushes = 0
+        self.views = 0
+        self.dropped_events = 0
+
+    @property
+    def pending_count(self) -> int:
+        return self._pending
+
+    def record(self, recipe_id: str, count_view: bool, event: Optional[Dict] = None) -> None:
+        """Buffer one view: a view_count increment (system recipes) and/or a recipe_views event"""
+        if count_view:
+            self._counts[recipe_id] = self._counts.get(recipe_id, 0) + 1
+        if event is not None:
+            self._events.append(event)
+        self._pending += 1
+        self.views += 1
+
+    async def flush(self, db) -> int:
+        """Write everything buffered; returns the number of views flushed"""
+        async with self._lock:
+            if not self._pending:
+                return 0
+            counts, events, pending = self._counts, self._events, self._pending
+            self._counts, self._events, self._pending = {}, [], 0
+
+            try:
+                if counts:
+                    await db.recipes.bulk_write(
+                        [UpdateOne({"id": recipe_id}, {"$inc": {"view_count": n}}) for recipe_id, n in counts.items()],
+                        ordered=False
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to flush view counts for {len(counts)} recipes: {e}")
+                # Increments are tiny - keep them for the next flush
+                for recipe_id, n in counts.items():
+                    self._counts[recipe_id] = self._counts.get(recipe_id, 0) + n
+                self._pending += len(counts)
+
+            try:
+                if events:
+                    await db.recipe_views.insert_many(events, ordered=False)
+            except Exception as e:
+                logger.warning(f"Failed to flush {len(events)} recipe view events: {e}")
+                self.dropped_events += len(events)
+
+            self.flushes += 1
+            return pending
+
+    async def run(self, db) -> None:
+        """Flush every interval until cancelled"""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.flush(db)
+
+    def stats(self) -> Dict:
+        return {
+            "pending": self._pending,
+            "recipes_pending": len(self._counts),
+            "interval_seconds": self.interval_seconds,
+            "max_pending": self.max_pending,
+            "flushes": self.flushes,
+            "views": self.views,
+            "dropped_events": self.dropped_events,
+        }
@@ -0,0 +1,178 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from utils import comment_threads  # noqa: E402
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+
+
+def _db():
+    return mongomock_motor.AsyncMongoMockClient()["test"]
+
+
+async def _comment(db, comment_id, recipe_id="r1", status="visible", **fields):
+    await db.recipe_comments.insert_one({
+        "id": comment_id,
+        "recipe_id": recipe_id,
+        "user_id": "author",
+        "comment": "hi",
+        "status": status,
+        "created_at": NOW,
+        "likes": 0,
+        **fields,
+    })
+
+
+async def _likes(db, comment_id):
+    comment = await db.recipe_comments.find_one({"id": comment_id}, {"_id": 0, "likes": 1})
+    return comment["likes"]
+
+
+def test_toggle_like_counts_each_user_once():
+    async def run():
+        db = _db()
+        await _comment(db, "c1")
+
+        assert await comment_threads.toggle_like(db, "c1", "u1") == (True, 1)
+        assert await comment_threads.toggle_like(db, "c1", "u2") == (True, 2)
+        assert await comment_threads.toggle_like(db, "c1", "u1") == (False, 1)
+        assert await comment_threads.toggle_like(db, "c1", "u1") == (True, 2)
+        assert await _likes(db, "c1") == 2
+        assert await db.comment_likes.count_documents({"comment_id": "c1"}) == 2
+
+        comments = [{"id": "c1"}]
+        await comment_threads.attach_viewer_likes(db, comments, "u2")
+        assert comments[0]["liked_by"] == ["u2"]
+        await comment_threads.attach_viewer_likes(db, comments, "u3")
+        assert comments[0]["liked_by"] == []
+
+    asyncio.run(run())
+
+
+def test_legacy_likes_are_migrated_on_first_toggle():
+    async def run():
+        db = _db()
+        await _comment(db, "c1", likes=2, liked_by=["u1", "u2"])
+
+        # Legacy likes count for the viewer before the migration
+        comments = [{"id": "c1"}]
+        await comment_threads.attach_viewer_likes(db, comments, "u1")
+        assert comments[0]["liked_by"] == ["u1"]
+
+        # A legacy liker toggling unlikes
+        assert await comment_threads.toggle_like(db, "c1", "u1") == (False, 1)
+        stored = await db.recipe_comments.find_one({"id": "c1"}, {"_id": 0})
+        assert "liked_by" not in stored
+        assert [like["user_id"] for like in await db.comment_likes.find({"comment_id": "c1"}).to_list(None)] == ["u2"]
+
+        # Migrating again is a no-op
+        await comment_threads.migrate_legacy_likes(db, "c1")
+        assert await db.comment_likes.count_documents({"comment_id": "c1"}) == 1
+        assert await comment_threads.toggle_like(db, "c1", "u2") == (False, 0)
+
+    asyncio.run(run())
+
+
+def test_legacy_likes_are_stored_before_the_array_is_removed():
+    async def run():
+        db = _db()
+        await _comment(db, "c1", likes=1, liked_by=["u1"])
+        likes_when_unset = []
+
+        class Comments:
+            """recipe_comments, noting how many like documents exist when liked_by is unset"""
+
+            def __getattr__(self, name):
+                return getattr(db.recipe_comments, name)
+
+            async def update_one(self, query, update, *args, **kwargs):
+                if "$unset" in update:
+                    likes_when_unset.append(await db.comment_likes.count_documents({"comment_id": "c1"}))
+                return await db.recipe_comments.update_one(query, update, *args, **kwargs)
+
+        class Database:
+            recipe_comments = Comments()
+            comment_likes = db.comment_likes
+
+        await comment_threads.migrate_legacy_likes(Database(), "c1")
+        # A toggle that no longer sees liked_by must find the like document
+        assert likes_when_unset == [1]
+
+    asyncio.run(run())
+
+
+def test_comment_count_is_counted_once_then_adjusted():
+    async def run():
+        db = _db()
+        await db.recipes.insert_one({"id": "r1", "name": "Cola"})
+        await _comment(db, "c1")
+        await _comment(db, "c2")
+        await _comment(db, "c3", status="hidden")
+
+        # Not counted yet: $inc leaves the recipe alone
+        await comment_threads.adjust_comment_count(db, "r1", 1)
+        assert "comment_count" not in await db.recipes.find_one({"id": "r1"})
+
+        assert await comment_threads.comment_count(db, "r1") == 2
+        assert (await db.recipes.find_one({"id": "r1"}))["comment_count"] == 2
+        await comment_threads.adjust_comment_count(db, "r1", -1)
+        assert await comment_threads.comment_count(db, "r1") == 1
+
+        # Comments on a recipe that no longer exists are counted directly
+        await _comment(db, "c4", recipe_id="gone")
+        assert await comment_threads.comment_count(db, "gone") == 1
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def server(monkeypatch):
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ.setdefault("DB_NAME", "test")
+    # Skipped where the app's own dependencies are not installed
+    server = pytest.importorskip("server")
+    monkeypatch.setattr(server, "db", _db())
+    return server
+
+
+def test_comment_count_follows_hide_unhide_and_delete(server):
+    async def run():
+        from auth import User
+
+        db = server.db
+        admin = User(id="admin", email="admin@slushbook.dk", name="Admin", role="admin", created_at=datetime.now(timezone.utc))
+        await db.recipes.insert_one({"id": "r1", "name": "Cola"})
+        for comment_id in ("c1", "c2", "c3"):
+            await _comment(db, comment_id)
+        await _comment(db, "c4", status="hidden")
+
+        async def count():
+            return (await db.recipes.find_one({"id": "r1"}))["comment_count"]
+
+        assert await comment_threads.comment_count(db, "r1") == 3
+        await server.hide_comment("c1", admin)
+        assert await count() == 2
+        await server.hide_comment("c1", admin)
+        assert await count() == 3
+        await server.hide_comment("c4", admin)
+        assert await count() == 4
+
+        await comment_threads.toggle_like(db, "c2", "u1")
+        await server.delete_comment("c2", admin)
+        assert await count() == 3
+        assert await db.comment_likes.count_documents({"comment_id": "c2"}) == 0
+
+        await server.hide_comment("c3", admin)
+        await server.delete_comment("c3", admin)
+        assert await count() == 2
+        assert await count() == await db.recipe_comments.count_documents({"recipe_id": "r1", "status": "visible"})
+
+    asyncio.run(run())
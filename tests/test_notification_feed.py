@@ -0,0 +1,238 @@
+import asyncio
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from utils import broadcast_notifications, notification_feed  # noqa: E402
+from utils.broadcast_notifications import BROADCASTS  # noqa: E402
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+USER = SimpleNamespace(id="u1", role="pro", created_at=BASE.isoformat())
+
+
+def _db():
+    return mongomock_motor.AsyncMongoMockClient()["test"]
+
+
+def _at(minutes):
+    return (BASE + timedelta(minutes=minutes)).isoformat()
+
+
+async def _notify(db, user_id, created_at, notification_id=None):
+    """What server.create_notification writes"""
+    notification = {
+        "id": notification_id or str(uuid.uuid4()),
+        "user_id": user_id,
+        "type": "system",
+        "title": "t",
+        "message": "m",
+        "read": False,
+        "created_at": created_at,
+        "data": {},
+    }
+    await db.notifications.insert_one(dict(notification))
+    await notification_feed.record_change(db, user_id, unread_delta=1)
+    return notification
+
+
+async def _broadcast(db, created_at, broadcast_id, **audience):
+    """A broadcast stored at a fixed time (create_broadcast stamps the current time)"""
+    await db[BROADCASTS].insert_one({
+        "id": broadcast_id,
+        "type": "system",
+        "title": "t",
+        "message": "m",
+        "link": None,
+        "data": {},
+        "roles": audience.get("roles"),
+        "exclude_roles": audience.get("exclude_roles", []),
+        "exclude_user_ids": audience.get("exclude_user_ids", []),
+        "created_at": created_at,
+    })
+    await db.app_state.update_one({"id": broadcast_notifications.STATE_ID}, {"$inc": {"version": 1}}, upsert=True)
+
+
+async def _unread(db, user=USER):
+    return (await notification_feed.feed_state(db, user))["unread_count"]
+
+
+def test_unread_counter_follows_writes():
+    async def run():
+        db = _db()
+        # Notifications stored before the counter existed are counted on the first read
+        await db.notifications.insert_one({"id": "legacy", "user_id": USER.id, "read": False, "created_at": _at(0)})
+        assert await _unread(db) == 1
+
+        first = await _notify(db, USER.id, _at(1))
+        second = await _notify(db, USER.id, _at(2))
+        await _notify(db, USER.id, _at(3))
+        await _notify(db, "someone-else", _at(3))
+        assert await _unread(db) == 4
+
+        # Mark read (PUT /notifications/{id}/read)
+        result = await db.notifications.update_one({"id": first["id"], "user_id": USER.id}, {"$set": {"read": True}})
+        assert result.modified_count == 1
+        await notification_feed.record_change(db, USER.id, unread_delta=-1)
+        assert await _unread(db) == 3
+
+        # Deleting a read notification leaves the counter alone, an unread one lowers it
+        for notification_id in (first["id"], second["id"]):
+            deleted = await db.notifications.find_one_and_delete({"id": notification_id, "user_id": USER.id})
+            await notification_feed.record_change(db, USER.id, unread_delta=0 if deleted.get("read") else -1)
+        assert await _unread(db) == 2
+
+        # Read all
+        await db.notifications.update_many({"user_id": USER.id, "read": False}, {"$set": {"read": True}})
+        await notification_feed.record_change(db, USER.id, reset_unread=True)
+        await broadcast_notifications.mark_all_read(db, USER)
+        assert await _unread(db) == 0
+
+        await _notify(db, USER.id, _at(4))
+        assert await _unread(db) == 1
+
+    asyncio.run(run())
+
+
+def test_etag_answers_304_until_the_feed_changes():
+    async def run():
+        db = _db()
+        await _notify(db, USER.id, _at(1))
+
+        state = await notification_feed.feed_state(db, USER)
+        etag = notification_feed.feed_etag(USER, state, 50, False, None)
+        again = notification_feed.feed_etag(USER, await notification_feed.feed_state(db, USER), 50, False, None)
+        assert again == etag
+        # If-None-Match with the current ETag (weak or strong form) means 304
+        assert notification_feed.etag_matches(etag, again)
+        assert notification_feed.etag_matches(f'"other", {etag[2:]}', again)
+        assert not notification_feed.etag_matches(None, again)
+        # Other request parameters are other responses
+        assert notification_feed.feed_etag(USER, state, 50, True, None) != etag
+
+        await broadcast_notifications.create_broadcast(db, "system", "t", "m", exclude_roles=["guest"])
+        state = await notification_feed.feed_state(db, USER)
+        after_broadcast = notification_feed.feed_etag(USER, state, 50, False, None)
+        assert after_broadcast != etag
+        assert not notification_feed.etag_matches(etag, after_broadcast)
+        assert state["unread_count"] == 2
+
+        await _notify(db, USER.id, _at(2))
+        state = await notification_feed.feed_state(db, USER)
+        assert notification_feed.feed_etag(USER, state, 50, False, None) != after_broadcast
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7])
+def test_pages_merge_personal_notifications_and_broadcasts(limit):
+    async def run():
+        db = _db()
+        expected = []
+        for n in range(12):
+            # Broadcasts interleave with personal notifications, some at the same time
+            if n % 3 == 0:
+                await _broadcast(db, _at(n // 2), f"b{n:02d}")
+            else:
+                await _notify(db, USER.id, _at(n // 2), f"n{n:02d}")
+            expected.append((_at(n // 2), f"{'b' if n % 3 == 0 else 'n'}{n:02d}"))
+        await _notify(db, "someone-else", _at(3), "other")
+        await _broadcast(db, _at(4), "not-for-pro", roles=["admin"])
+        expected = [notification_id for _, notification_id in sorted(expected, reverse=True)]
+
+        state = await notification_feed.feed_state(db, USER)
+        seen, cursor = [], None
+        while True:
+            page, cursor = await notification_feed.read_page(db, USER, state, limit, cursor=cursor)
+            assert len(page) <= limit
+            seen += [notification["id"] for notification in page]
+            if cursor is None:
+                break
+        assert seen == expected
+
+    asyncio.run(run())
+
+
+def test_broadcast_audience():
+    async def run():
+        db = _db()
+        author = SimpleNamespace(id="author", role="pro", created_at=BASE.isoformat())
+        admin = SimpleNamespace(id="admin", role="admin", created_at=BASE.isoformat())
+        member = SimpleNamespace(id="member", role="user", created_at=BASE.isoformat())
+        guest = SimpleNamespace(id="guest", role="guest", created_at=BASE.isoformat())
+        newcomer = SimpleNamespace(id="newcomer", role="pro", created_at=_at(10))
+
+        await _broadcast(db, _at(1), "new-recipe", roles=["pro", "admin"], exclude_user_ids=["author"])
+        await _broadcast(db, _at(2), "system", exclude_roles=["guest"])
+
+        async def visible(user):
+            return [n["id"] for n in await broadcast_notifications.list_for_user(db, user, 10)]
+
+        assert await visible(USER) == ["system", "new-recipe"]
+        assert await visible(admin) == ["system", "new-recipe"]
+        assert await visible(author) == ["system"]
+        assert await visible(member) == ["system"]
+        assert await visible(guest) == []
+        # Only users who existed when a broadcast was sent see it
+        assert await visible(newcomer) == []
+        assert await broadcast_notifications.count_unread(db, newcomer) == 0
+
+        await db.users.insert_many([
+            {"id": user.id, "role": user.role} for user in (USER, author, admin, member, guest)
+        ])
+        recipients = broadcast_notifications.recipients_query(["pro", "admin"], [], ["author"])
+        assert await db.users.count_documents(recipients) == 2
+        assert await db.users.count_documents(broadcast_notifications.recipients_query(None, ["guest"], [])) == 4
+
+    asyncio.run(run())
+
+
+def test_broadcast_read_and_dismiss_cursor():
+    async def run():
+        db = _db()
+        for n in range(3):
+            await _broadcast(db, _at(n), f"b{n}")
+        await _broadcast(db, _at(3), "admins-only", roles=["admin"])
+
+        async def feed():
+            return {n["id"]: n["read"] for n in await broadcast_notifications.list_for_user(db, USER, 10)}
+
+        assert await broadcast_notifications.count_unread(db, USER) == 3
+        assert await broadcast_notifications.mark_read(db, USER, "b1")
+        assert not await broadcast_notifications.mark_read(db, USER, "admins-only")
+        assert not await broadcast_notifications.mark_read(db, USER, "missing")
+        assert await feed() == {"b2": False, "b1": True, "b0": False}
+        assert await broadcast_notifications.count_unread(db, USER) == 2
+
+        # Dismissing drops it from the feed and the unread count, and only once
+        assert await broadcast_notifications.dismiss(db, USER, "b1")
+        assert await broadcast_notifications.dismiss(db, USER, "b2")
+        assert not await broadcast_notifications.dismiss(db, USER, "b2")
+        assert not await broadcast_notifications.dismiss(db, USER, "admins-only")
+        assert await feed() == {"b0": False}
+        assert await broadcast_notifications.count_unread(db, USER) == 1
+        cursor = await broadcast_notifications.get_cursor(db, USER.id)
+        assert cursor["read_ids"] == [] and sorted(cursor["dismissed_ids"]) == ["b1", "b2"]
+
+        # Read-all moves the cursor; broadcasts sent afterwards are unread again
+        assert await broadcast_notifications.mark_all_read(db, USER) == 1
+        assert await feed() == {"b0": True}
+        assert await broadcast_notifications.count_unread(db, USER) == 0
+        later = await broadcast_notifications.create_broadcast(db, "system", "t", "m")
+        assert await broadcast_notifications.count_unread(db, USER) == 1
+        assert (await feed())[later["id"]] is False
+
+        # Every change to the cursor invalidates the feed's cached unread count
+        state = await notification_feed.feed_state(db, USER)
+        assert state["unread_count"] == 1
+        assert await broadcast_notifications.mark_read(db, USER, later["id"])
+        assert (await notification_feed.feed_state(db, USER))["unread_count"] == 0
+
+    asyncio.run(run())
@@ -0,0 +1,106 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from utils.recipe_pagination import decode_cursor, paginate_recipe_sources, sort_value  # noqa: E402
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _recipes():
+    """Free and paid recipes with string, BSON date and missing created_at"""
+    recipes = []
+    for n in range(12):
+        created_at = BASE + timedelta(hours=n)
+        recipes.append({
+            "id": f"r{n:02d}",
+            "is_free": n % 3 == 0,
+            # Every other recipe comes from the bulk import, which stores a datetime
+            "created_at": created_at if n % 2 else created_at.isoformat(),
+        })
+    recipes.append({"id": "r-missing", "is_free": False})
+    return recipes
+
+
+def _expected_order(recipes):
+    """Free first, then newest first (missing last), then id"""
+    by_id = sorted(recipes, key=lambda recipe: recipe["id"])
+    newest_first = sorted(by_id, key=lambda recipe: sort_value(recipe.get("created_at")) or "", reverse=True)
+    ordered = sorted(newest_first, key=lambda recipe: (not recipe["is_free"], recipe.get("created_at") is None))
+    return [recipe["id"] for recipe in ordered]
+
+
+async def _walk(collection, limit):
+    pages, cursor = [], None
+    while True:
+        page, cursor = await paginate_recipe_sources([(collection, {})], limit, cursor, {"_id": 0})
+        pages.append([recipe["id"] for recipe in page])
+        if cursor is None:
+            return pages
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 5])
+def test_mixed_created_at_types_page_without_gaps(limit):
+    async def run():
+        collection = mongomock_motor.AsyncMongoMockClient()["test"]["recipes"]
+        recipes = _recipes()
+        await collection.insert_many([dict(recipe) for recipe in recipes])
+        pages = await _walk(collection, limit)
+        seen = [recipe_id for page in pages for recipe_id in page]
+        assert seen == _expected_order(recipes)
+        assert all(len(page) == limit for page in pages[:-1])
+
+    asyncio.run(run())
+
+
+def test_datetime_recipe_on_page_boundary():
+    async def run():
+        collection = mongomock_motor.AsyncMongoMockClient()["test"]["recipes"]
+        await collection.insert_many([
+            {"id": "new", "is_free": False, "created_at": (BASE + timedelta(days=2)).isoformat()},
+            {"id": "imported", "is_free": False, "created_at": BASE + timedelta(days=1)},
+            {"id": "old", "is_free": False, "created_at": BASE.isoformat()},
+        ])
+        page, cursor = await paginate_recipe_sources([(collection, {})], 2, None, {"_id": 0})
+        assert [recipe["id"] for recipe in page] == ["new", "imported"]
+        assert decode_cursor(cursor)["c"] == (BASE + timedelta(days=1)).isoformat()
+
+        page, cursor = await paginate_recipe_sources([(collection, {})], 2, cursor, {"_id": 0})
+        assert [recipe["id"] for recipe in page] == ["old"]
+        assert cursor is None
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4])
+def test_string_formats_sort_by_instant(limit):
+    async def run():
+        collection = mongomock_motor.AsyncMongoMockClient()["test"]["recipes"]
+        second = BASE + timedelta(seconds=30)
+        # (id, stored created_at, instant) - naive and "Z" strings are UTC
+        recipes = [
+            ("naive", "2024-01-01T00:00:30.900000", second + timedelta(microseconds=900000)),
+            ("zulu", "2024-01-01T00:00:30.500Z", second + timedelta(microseconds=500000)),
+            ("offset", second.isoformat(), second),
+            ("zulu-whole", "2024-01-01T00:00:30Z", second),
+            ("date", second + timedelta(microseconds=700000), second + timedelta(microseconds=700000)),
+            ("naive-later", "2024-01-01T00:00:31", second + timedelta(seconds=1)),
+            ("zulu-earlier", "2024-01-01T00:00:29.999Z", second - timedelta(milliseconds=1)),
+        ]
+        await collection.insert_many([
+            {"id": recipe_id, "is_free": False, "created_at": created_at} for recipe_id, created_at, _ in recipes
+        ])
+        expected = [recipe_id for recipe_id, _, instant in sorted(recipes, key=lambda r: (-r[2].timestamp(), r[0]))]
+        pages = await _walk(collection, limit)
+        assert [recipe_id for page in pages for recipe_id in page] == expected
+        assert sort_value("2024-01-01T00:00:30Z") == sort_value(second)
+
+    asyncio.run(run())